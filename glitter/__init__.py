@@ -7,4 +7,8 @@ default_app_config = 'glitter.apps.GlittersConfig'
 def autodiscover():
     """ Auto discover for layouts. """
     autodiscover_modules('layouts')
+
+
+def autodiscover_blocks():
+    """ Auto discover for block admins, only needed once the block admin is used. """
     autodiscover_modules('blocks')
@@ -8,3 +8,11 @@ class GlittersConfig(AppConfig):
     def ready(self):
         super().ready()
         self.module.autodiscover()
+
+        # All layouts have been registered, index them and check their templates exist
+        from . import checks, templates  # noqa
+        templates.finalize()
+
+        # Find Glitter Apps once, only importing apps which have a glitter_apps module
+        from .integration import glitter_app_pool
+        glitter_app_pool.discover_glitter_apps()
@@ -1,10 +1,15 @@
 from os.path import basename
 
+from django.conf.urls import url
 from django.contrib import admin
+from django.http import JsonResponse
 
 from .models import ImageCategory, Image, FileCategory, File
 
 
+CHOICES_LIMIT = 50
+
+
 @admin.register(ImageCategory, FileCategory)
 class CategoryAdmin(admin.ModelAdmin):
     search_fields = ('title',)
@@ -18,7 +23,44 @@ class FileAdmin(admin.ModelAdmin):
     search_fields = ('title',)
     readonly_fields = ('modified_at', 'created_at',)
 
+    def get_urls(self):
+        urls = super().get_urls()
+        info = self.model._meta.app_label, self.model._meta.model_name
+        asset_urls = [
+            url(
+                r'^choices/$',
+                self.admin_site.admin_view(self.choices_view),
+                name='%s_%s_choices' % info
+            ),
+        ]
+        return asset_urls + urls
+
     def file_link(self, obj):
         return '<a href="%s">%s</a>' % (obj.get_absolute_url(), basename(obj.file.name))
     file_link.short_description = 'Link'
     file_link.allow_tags = True
+
+    def choices_view(self, request):
+        """
+        Search for assets by the start of their title, for choosing an asset in a form without
+        listing every asset.
+        """
+        assets = self.get_queryset(request).select_related('category').order_by(
+            'category__title', 'title', 'id'
+        )
+
+        query = request.GET.get('q', '').strip()
+        if query:
+            assets = assets.filter(title__istartswith=query)
+
+        # Fetch an extra asset to find out if there are any more matches
+        assets = list(assets[:CHOICES_LIMIT + 1])
+
+        return JsonResponse({
+            'results': [{
+                'id': asset.id,
+                'text': str(asset),
+                'group': str(asset.category) if asset.category else '',
+            } for asset in assets[:CHOICES_LIMIT]],
+            'more': len(assets) > CHOICES_LIMIT,
+        })
@@ -1,8 +1,27 @@
 from itertools import groupby
+from threading import local
 
 from django.db import models
 from django.forms.models import ModelChoiceField, ModelChoiceIterator
 
+try:
+    from django.core.exceptions import EmptyResultSet
+except ImportError:
+    from django.db.models.sql.datastructures import EmptyResultSet
+
+
+# Choices which have already been fetched in the current request, shared between every form which
+# needs them - such as each row of an inline formset
+_choice_cache = local()
+
+
+def start_choice_cache(**kwargs):
+    _choice_cache.choices = {}
+
+
+def clear_choice_cache(**kwargs):
+    _choice_cache.choices = None
+
 
 class GroupedModelChoiceField(ModelChoiceField):
     def __init__(self, queryset, group_by_field='category', group_label=None, *args, **kwargs):
@@ -31,32 +50,53 @@ class GroupedModelChoiceField(ModelChoiceField):
 
 
 class GroupedModelChoiceIterator(ModelChoiceIterator):
+    def get_cache_key(self):
+        try:
+            return (type(self.field), self.field.group_by_field, str(self.queryset.query))
+        except EmptyResultSet:
+            return None
+
+    def get_groups(self):
+        """
+        Return a list of groups and their choices, which are only fetched once per request.
+        """
+        cache = getattr(_choice_cache, 'choices', None)
+        cache_key = None
+
+        if cache is not None:
+            cache_key = self.get_cache_key()
+
+            if cache_key in cache:
+                return cache[cache_key]
+
+        groups = [
+            (group, [self.choice(ch) for ch in choices])
+            for group, choices in groupby(
+                self.queryset.all(),
+                key=lambda row: getattr(row, self.field.group_by_field)
+            )
+        ]
+
+        if cache_key is not None:
+            cache[cache_key] = groups
+
+        return groups
+
     def __iter__(self):
         if self.field.empty_label is not None:
             yield ('', self.field.empty_label)
 
-        if hasattr(self.field, 'cache_choices') and self.field.cache_choices:
-            if self.field.choice_cache is None:
-                self.field.choice_cache = [
-                    (self.field.group_label(group), [self.choice(ch) for ch in choices])
-                    for group, choices in groupby(
-                        self.queryset.all(), key=lambda row: getattr(
-                            row, self.field.group_by_field
-                        )
-                    )
-                ]
-
-            for choice in self.field.choice_cache:
-                yield choice
-        else:
-            for group, choices in groupby(
-                    self.queryset.all(),
-                    key=lambda row: getattr(row, self.field.group_by_field)
-            ):
-                yield (self.field.group_label(group), [self.choice(ch) for ch in choices])
+        for group, choices in self.get_groups():
+            yield (self.field.group_label(group), choices)
+
+    def __len__(self):
+        return len(self.get_groups()) + (1 if self.field.empty_label is not None else 0)
 
 
 class AssetForeignKey(models.ForeignKey):
     def formfield(self, **kwargs):
+        from .widgets import AssetSelect  # avoid a circular import
+
         kwargs.setdefault('form_class', GroupedModelChoiceField)
+        kwargs.setdefault('widget', AssetSelect)
         return super().formfield(**kwargs)
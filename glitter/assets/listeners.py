@@ -1,31 +1,59 @@
-from django.db.models.signals import pre_save, post_delete
-from django.core.files.storage import default_storage
+from django.core.signals import request_finished, request_started
+from django.db.models.signals import post_delete, post_save
 
-from .models import Image, File
+from .fields import clear_choice_cache, start_choice_cache
+from .models import Image, File, Rendition
+from .renditions import clear_cached_rendition
+from .utils import queue_renditions
 
 
-def asset_file_change(sender, instance, **kwargs):
-    # Must be saved already
-    if instance.pk is not None:
-        try:
-            old_obj = sender.objects.get(pk=instance.pk)
+def delete_unused_file(sender, storage, name):
+    # Files are shared between assets with identical content, only remove unused files
+    if sender.objects.filter(file=name).exists():
+        return
+
+    try:
+        storage.delete(name)
+    except:
+        pass
 
-            # Delete the old file if the file names don't match
-            if old_obj.file.path != instance.file.path:
-                default_storage.delete(old_obj.file.path)
-        except:
-            pass
+
+def asset_file_change(sender, instance, created, raw, **kwargs):
+    old_name = getattr(instance, '_loaded_file_name', None)
+    instance._loaded_file_name = instance.file.name
+
+    # Delete the old file if it has been replaced
+    if old_name and old_name != instance.file.name:
+        delete_unused_file(sender, instance.file.storage, old_name)
+
+        # Renditions of the old file are no longer needed
+        if sender is Image:
+            instance.renditions.all().delete()
 
 
 def asset_file_delete(sender, instance, **kwargs):
     # Try and remove the file if possible
-    try:
-        instance.file.delete(save=False)
-    except:
-        pass
+    delete_unused_file(sender, instance.file.storage, instance.file.name)
+
+
+def rendition_delete(sender, instance, **kwargs):
+    clear_cached_rendition(instance.image_id, instance.spec)
+
+
+def image_renditions(sender, instance, raw, **kwargs):
+    # Fixtures may not have the image files to go with them
+    if raw:
+        return
+
+    queue_renditions(instance)
 
 
-pre_save.connect(asset_file_change, sender=Image)
-pre_save.connect(asset_file_change, sender=File)
+post_save.connect(asset_file_change, sender=Image)
+post_save.connect(asset_file_change, sender=File)
+post_save.connect(image_renditions, sender=Image)
 post_delete.connect(asset_file_delete, sender=Image)
 post_delete.connect(asset_file_delete, sender=File)
+post_delete.connect(asset_file_delete, sender=Rendition)
+post_delete.connect(rendition_delete, sender=Rendition)
+request_started.connect(start_choice_cache)
+request_finished.connect(clear_choice_cache)
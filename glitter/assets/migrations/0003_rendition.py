@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+import glitter.assets.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('glitter_assets', '0002_image_category_field_optional'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Rendition',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('spec', models.CharField(max_length=100)),
+                ('file', models.ImageField(height_field='height', upload_to=glitter.assets.models.rendition_upload_to, width_field='width')),
+                ('height', models.PositiveIntegerField(editable=False)),
+                ('width', models.PositiveIntegerField(editable=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('image', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='renditions', to='glitter_assets.Image')),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='rendition',
+            unique_together=set([('image', 'spec')]),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import glitter.assets.mixins
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('glitter_assets', '0003_rendition'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='file',
+            name='file_hash',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='image',
+            name='file_hash',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='file',
+            name='file',
+            field=models.FileField(upload_to=glitter.assets.mixins.hashed_upload_to),
+        ),
+        migrations.AlterField(
+            model_name='image',
+            name='file',
+            field=models.ImageField(height_field='image_height', upload_to=glitter.assets.mixins.hashed_upload_to, verbose_name='Image', width_field='image_width'),
+        ),
+    ]
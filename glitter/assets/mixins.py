@@ -1,7 +1,26 @@
+import hashlib
+import os
+
 from django.db import models
 
 
+def hashed_upload_to(instance, filename):
+    """
+    Store files by a hash of their content, so identical uploads share the same file and a file
+    never changes once it has been stored.
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    return 'assets/{model_name}/{prefix}/{file_hash}{extension}'.format(
+        model_name=instance._meta.model_name,
+        prefix=instance.file_hash[:2],
+        file_hash=instance.file_hash,
+        extension=extension,
+    )
+
+
 class FileMixin(models.Model):
+    file_hash = models.CharField(max_length=64, blank=True, db_index=True, editable=False)
+
     class Meta:
         abstract = True
         ordering = ('-created_at', '-modified_at', 'title')
@@ -9,11 +28,39 @@ class FileMixin(models.Model):
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+
+        # Keep the original file name, so the old file can be tidied up if it gets replaced
+        instance._loaded_file_name = instance.__dict__.get('file')
+        return instance
+
     def get_absolute_url(self):
         return self.file.url
 
+    def get_file_hash(self):
+        file_hash = hashlib.sha256()
+
+        for chunk in self.file.chunks():
+            file_hash.update(chunk)
+
+        return file_hash.hexdigest()
+
     def save(self, *args, **kwargs):
-        # Avoid doing file size requests constantly
-        self.file_size = self.file.size
+        if not self.file._committed:
+            # New upload, the size is known without asking the storage backend
+            self.file_size = self.file.size
+            self.file_hash = self.get_file_hash()
+
+            # Identical content has been uploaded before, reuse the existing file
+            file_name = self.file.field.generate_filename(self, self.file.name)
+
+            if self.file.storage.exists(file_name):
+                self.file.name = file_name
+                self.file._committed = True
+        elif not self.file_size:
+            # Avoid doing file size requests constantly
+            self.file_size = self.file.size
 
         super().save(*args, **kwargs)
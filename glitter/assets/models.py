@@ -1,6 +1,7 @@
 from django.db import models
 
-from .mixins import FileMixin
+from .mixins import FileMixin, hashed_upload_to
+from .renditions import get_rendition
 
 
 class BaseCategory(models.Model):
@@ -22,7 +23,7 @@ class FileCategory(BaseCategory):
 class File(FileMixin, models.Model):
     category = models.ForeignKey(FileCategory)
     title = models.CharField(max_length=100, db_index=True)
-    file = models.FileField(upload_to='assets/file')
+    file = models.FileField(upload_to=hashed_upload_to)
     file_size = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
@@ -37,10 +38,42 @@ class Image(FileMixin, models.Model):
     category = models.ForeignKey(ImageCategory, blank=True, null=True)
     title = models.CharField(max_length=100, db_index=True)
     file = models.ImageField(
-        'Image', upload_to='assets/image', height_field='image_height', width_field='image_width'
+        'Image', upload_to=hashed_upload_to, height_field='image_height', width_field='image_width'
     )
     image_height = models.PositiveIntegerField(editable=False)
     image_width = models.PositiveIntegerField(editable=False)
     file_size = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
+
+    def get_rendition(self, spec, crop=False):
+        """
+        Return a resized version of this image, either for a named rendition size or a geometry
+        string such as ``200x200``.
+        """
+        return get_rendition(self, spec, crop=crop)
+
+
+def rendition_upload_to(instance, filename):
+    return 'assets/rendition/{}/{}'.format(instance.spec, filename)
+
+
+class Rendition(models.Model):
+    image = models.ForeignKey(Image, related_name='renditions')
+    spec = models.CharField(max_length=100)
+    file = models.ImageField(
+        upload_to=rendition_upload_to, height_field='height', width_field='width'
+    )
+    height = models.PositiveIntegerField(editable=False)
+    width = models.PositiveIntegerField(editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('image', 'spec')
+
+    def __str__(self):
+        return '{} ({})'.format(self.image, self.spec)
+
+    @property
+    def url(self):
+        return self.file.url
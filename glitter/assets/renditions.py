@@ -0,0 +1,256 @@
+"""
+Resized versions of images, generated once and stored alongside the original.
+
+Renditions are requested with either the name of a size set with the ``GLITTER_IMAGE_RENDITIONS``
+setting, or with a geometry string such as ``300``, ``x300`` or ``200x200``.
+"""
+from collections import namedtuple
+from io import BytesIO
+import logging
+import os
+import re
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import IntegrityError, transaction
+
+from PIL import Image as PILImage, ImageOps
+
+
+# Sizes used by glitter itself, projects can add or override these with the
+# GLITTER_IMAGE_RENDITIONS setting
+DEFAULT_RENDITIONS = {
+    'admin_thumbnail': {'geometry': '200x200', 'crop': True},
+    'admin_preview': {'geometry': 'x300'},
+}
+
+logger = logging.getLogger('glitter.assets')
+
+# Sensible defaults if no other settings are provided
+GLITTER_IMAGE_RENDITION_QUALITY = 85
+GLITTER_IMAGE_RENDITION_RETRY = 5 * 60
+
+RENDITION_KEY = 'glitter_assets_rendition_{}_{}'
+
+GEOMETRY_RE = re.compile(r'^(?P<width>\d*)(?:x(?P<height>\d*))?$')
+
+
+# The URL and size used for a rendition, along with the name of the image file it was made from.
+# If the image couldn't be resized, this is the original image with resized set to False.
+CachedRendition = namedtuple(
+    'CachedRendition', ['url', 'width', 'height', 'source', 'resized']
+)
+
+
+class RenditionSpec(namedtuple('RenditionSpec', ['width', 'height', 'crop'])):
+    @property
+    def key(self):
+        """
+        Unique name for the spec, used for looking up renditions and for the storage path.
+        """
+        key = '{}x{}'.format(self.width or '', self.height or '')
+
+        if self.crop:
+            key += '-crop'
+
+        return key
+
+
+def get_rendition_specs():
+    """
+    Return a dictionary of named rendition sizes.
+    """
+    specs = DEFAULT_RENDITIONS.copy()
+    specs.update(getattr(settings, 'GLITTER_IMAGE_RENDITIONS', {}))
+    return specs
+
+
+def parse_geometry(geometry, crop=False):
+    match = GEOMETRY_RE.match(str(geometry).strip())
+
+    if match is None:
+        raise ValueError('Invalid geometry: {!r}'.format(geometry))
+
+    width = int(match.group('width') or 0) or None
+    height = int(match.group('height') or 0) or None
+
+    if width is None and height is None:
+        raise ValueError('Invalid geometry: {!r}'.format(geometry))
+
+    # Cropping only makes sense when both dimensions are given
+    return RenditionSpec(width=width, height=height, crop=bool(crop and width and height))
+
+
+def get_spec(spec, crop=False):
+    """
+    Return a RenditionSpec for either a named rendition size or a geometry string.
+    """
+    if isinstance(spec, RenditionSpec):
+        return spec
+
+    named_spec = get_rendition_specs().get(spec)
+
+    if named_spec is not None:
+        return parse_geometry(named_spec['geometry'], crop=named_spec.get('crop', False))
+
+    return parse_geometry(spec, crop=crop)
+
+
+def get_rendition_quality():
+    return getattr(settings, 'GLITTER_IMAGE_RENDITION_QUALITY', GLITTER_IMAGE_RENDITION_QUALITY)
+
+
+def resize_image(image_file, spec, quality=None):
+    """
+    Resize an image file to fit the given spec, returning the content of the new image.
+
+    Images are never scaled up, unless they're being cropped to an exact size. This doesn't touch
+    the database or storage, so it's safe to call in another process.
+    """
+    source = PILImage.open(image_file)
+    image_format = source.format or 'PNG'
+
+    if spec.crop:
+        resized = ImageOps.fit(source, (spec.width, spec.height), PILImage.LANCZOS)
+    else:
+        resized = source.copy()
+        resized.thumbnail(
+            (spec.width or source.width, spec.height or source.height), PILImage.LANCZOS
+        )
+
+    save_kwargs = {}
+
+    if image_format == 'JPEG':
+        save_kwargs['quality'] = quality or get_rendition_quality()
+
+        if resized.mode not in ('RGB', 'L'):
+            resized = resized.convert('RGB')
+
+    content = BytesIO()
+    resized.save(content, format=image_format, **save_kwargs)
+    return content.getvalue()
+
+
+def save_rendition(image, spec, content):
+    """
+    Store the content of a resized image as a rendition.
+    """
+    rendition = image.renditions.model(image=image, spec=spec.key)
+    rendition.file.save(os.path.basename(image.file.name), ContentFile(content), save=False)
+
+    try:
+        with transaction.atomic():
+            rendition.save()
+    except IntegrityError:
+        # Another request or worker got there first, use that one instead
+        rendition.file.delete(save=False)
+        rendition = image.renditions.get(spec=spec.key)
+
+    return rendition
+
+
+def create_rendition(image, spec):
+    """
+    Generate and store a new rendition of an image.
+    """
+    with image.file.storage.open(image.file.name, 'rb') as image_file:
+        content = resize_image(image_file, spec)
+
+    return save_rendition(image, spec, content)
+
+
+def get_rendition(image, spec, crop=False):
+    """
+    Return a rendition of an image, creating it if it doesn't exist yet.
+
+    Renditions which have been fetched with ``prefetch_related('renditions')`` are used without
+    any further queries.
+    """
+    spec = get_spec(spec, crop=crop)
+    prefetched = getattr(image, '_prefetched_objects_cache', {}).get('renditions')
+
+    if prefetched is not None:
+        for rendition in prefetched:
+            if rendition.spec == spec.key:
+                return rendition
+    else:
+        rendition = image.renditions.filter(spec=spec.key).first()
+
+        if rendition is not None:
+            return rendition
+
+    return create_rendition(image, spec)
+
+
+def get_rendition_key(image_id, spec_key):
+    return RENDITION_KEY.format(image_id, spec_key)
+
+
+def get_rendition_retry():
+    return getattr(settings, 'GLITTER_IMAGE_RENDITION_RETRY', GLITTER_IMAGE_RENDITION_RETRY)
+
+
+def get_cached_rendition(image, spec, crop=False):
+    """
+    Return the URL and size of a rendition of an image, which are cached so showing an image
+    doesn't need any queries once the rendition exists.
+
+    If the image can't be resized the original image is used instead, and resizing isn't tried
+    again until ``GLITTER_IMAGE_RENDITION_RETRY`` seconds have passed.
+    """
+    spec = get_spec(spec, crop=crop)
+    key = get_rendition_key(image.pk, spec.key)
+    cached = cache.get(key)
+
+    # Anything cached for an image file which has since been replaced is ignored
+    if cached is not None and cached.source == image.file.name:
+        return cached
+
+    try:
+        rendition = get_rendition(image, spec)
+    except (OSError, ValueError):
+        logger.warning(
+            'Unable to create %s rendition for image %s', spec.key, image.pk, exc_info=True
+        )
+        cached = CachedRendition(
+            url=image.file.url, width=image.image_width, height=image.image_height,
+            source=image.file.name, resized=False,
+        )
+        cache.set(key, cached, get_rendition_retry())
+    else:
+        cached = CachedRendition(
+            url=rendition.url, width=rendition.width, height=rendition.height,
+            source=image.file.name, resized=True,
+        )
+        cache.set(key, cached, None)
+
+    return cached
+
+
+def clear_cached_rendition(image_id, spec_key):
+    cache.delete(get_rendition_key(image_id, spec_key))
+
+
+def get_missing_specs(image):
+    """
+    Return a list of specs for named renditions which haven't been created for an image.
+    """
+    existing = set(image.renditions.values_list('spec', flat=True))
+    specs = []
+
+    for name in get_rendition_specs():
+        spec = get_spec(name)
+
+        if spec.key not in existing:
+            specs.append(spec)
+            existing.add(spec.key)
+
+    return specs
+
+
+def create_renditions(image):
+    """
+    Create any missing named renditions for an image.
+    """
+    return [create_rendition(image, spec) for spec in get_missing_specs(image)]
@@ -0,0 +1,17 @@
+from celery import shared_task
+
+from .models import Image
+from .renditions import create_renditions
+
+
+@shared_task
+def rendition_task(pk):
+    """
+    Create any missing named renditions for an image from Celery.
+    """
+    try:
+        image = Image.objects.get(pk=pk)
+    except Image.DoesNotExist:
+        return
+
+    create_renditions(image)
@@ -0,0 +1,36 @@
+import logging
+
+from django import template
+
+from glitter.assets.renditions import get_cached_rendition
+
+
+logger = logging.getLogger('glitter.assets')
+
+register = template.Library()
+
+
+@register.assignment_tag
+def rendition(image, spec, crop=False):
+    """
+    Return a resized version of an image, for a named rendition size or a geometry string.
+
+    Usage::
+
+        {% rendition object.image 'admin_thumbnail' as thumb %}
+        {% if thumb %}
+            <img src="{{ thumb.url }}" width="{{ thumb.width }}" height="{{ thumb.height }}">
+        {% endif %}
+
+    The URL and size are cached, so no queries are needed once the rendition exists. If the image
+    can't be resized the original image is used instead. Returns ``None`` if there's no image, or
+    if the size isn't valid.
+    """
+    if not image or not spec:
+        return None
+
+    try:
+        return get_cached_rendition(image, spec, crop=crop)
+    except ValueError:
+        logger.warning('Invalid rendition size %r for image %s', spec, image.pk)
+        return None
@@ -4,8 +4,27 @@ when you run "manage.py test".
 
 Replace this with more appropriate tests for your application.
 """
+from io import BytesIO
+import hashlib
+import json
+import os
+import shutil
+import tempfile
 
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.urlresolvers import reverse
+from django.template import Context, Template
+from django.test import TestCase, override_settings
+
+from PIL import Image as PILImage
+
+from .fields import AssetForeignKey, clear_choice_cache, start_choice_cache
+from .models import File, FileCategory, Image
+from .renditions import RenditionSpec, get_spec, parse_geometry
+from .utils import generate_renditions
+from .widgets import AssetSelect
 
 
 class SimpleTest(TestCase):
@@ -14,3 +33,332 @@ class SimpleTest(TestCase):
         Tests that 1 + 1 always equals 2.
         """
         self.assertEqual(1 + 1, 2)
+
+
+def create_image_file(name='test.jpg', size=(800, 600), image_format='JPEG'):
+    content = BytesIO()
+    PILImage.new('RGB', size, color='red').save(content, format=image_format)
+    return SimpleUploadedFile(name, content.getvalue())
+
+
+class RenditionSpecTestCase(TestCase):
+    def test_parse_geometry(self):
+        self.assertEqual(parse_geometry('300'), RenditionSpec(width=300, height=None, crop=False))
+        self.assertEqual(parse_geometry('x300'), RenditionSpec(width=None, height=300, crop=False))
+        self.assertEqual(
+            parse_geometry('200x100', crop=True), RenditionSpec(width=200, height=100, crop=True)
+        )
+        self.assertEqual(parse_geometry(300).key, '300x')
+        self.assertEqual(parse_geometry('200x100', crop='center').key, '200x100-crop')
+
+    def test_parse_geometry_crop_needs_both_dimensions(self):
+        self.assertFalse(parse_geometry('300', crop=True).crop)
+
+    def test_parse_invalid_geometry(self):
+        for geometry in ('', 'x', 'big', '200x200x200'):
+            with self.assertRaises(ValueError):
+                parse_geometry(geometry)
+
+    @override_settings(GLITTER_IMAGE_RENDITIONS={'hero': {'geometry': '1200x400', 'crop': True}})
+    def test_named_spec(self):
+        self.assertEqual(get_spec('hero'), RenditionSpec(width=1200, height=400, crop=True))
+        self.assertEqual(get_spec('admin_thumbnail').key, '200x200-crop')
+
+
+class RenditionTestCase(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.image = Image.objects.create(title='Test', file=create_image_file())
+        self.addCleanup(cache.clear)
+
+    def test_named_renditions_created_on_upload(self):
+        renditions = {
+            rendition.spec: (rendition.width, rendition.height)
+            for rendition in self.image.renditions.all()
+        }
+        self.assertEqual(renditions, {
+            '200x200-crop': (200, 200),
+            'x300': (400, 300),
+        })
+
+    def test_get_rendition(self):
+        rendition = self.image.get_rendition('400')
+        self.assertEqual((rendition.width, rendition.height), (400, 300))
+        self.assertEqual(rendition.url, rendition.file.url)
+        self.assertTrue(os.path.exists(rendition.file.path))
+
+        # Generated once, then looked up
+        with self.assertNumQueries(1):
+            self.assertEqual(self.image.get_rendition('400'), rendition)
+
+    def test_never_scaled_up(self):
+        rendition = self.image.get_rendition('2000')
+        self.assertEqual((rendition.width, rendition.height), (800, 600))
+
+    def test_prefetched_renditions(self):
+        image = Image.objects.prefetch_related('renditions').get(id=self.image.id)
+
+        with self.assertNumQueries(0):
+            rendition = image.get_rendition('admin_thumbnail')
+
+        self.assertEqual((rendition.width, rendition.height), (200, 200))
+
+    def test_png_with_transparency(self):
+        content = BytesIO()
+        PILImage.new('RGBA', (100, 100)).save(content, format='PNG')
+        image = Image.objects.create(
+            title='PNG', file=SimpleUploadedFile('test.png', content.getvalue())
+        )
+        rendition = image.get_rendition('50')
+        self.assertTrue(rendition.file.name.endswith('.png'))
+        self.assertEqual((rendition.width, rendition.height), (50, 50))
+
+    def test_file_change_removes_renditions(self):
+        rendition = self.image.get_rendition('400')
+        path = rendition.file.path
+
+        self.image.file = create_image_file(name='new.jpg', size=(100, 100))
+        self.image.save()
+
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(self.image.renditions.filter(spec='400x').exists())
+        self.assertEqual(self.image.get_rendition('admin_preview').height, 100)
+
+    def test_delete_removes_rendition_files(self):
+        path = self.image.get_rendition('400').file.path
+        self.image.delete()
+        self.assertFalse(os.path.exists(path))
+
+    def test_template_tag(self):
+        template = Template(
+            "{% load glitter_assets %}"
+            "{% rendition image 'admin_thumbnail' as thumb %}"
+            "{{ thumb.width }}x{{ thumb.height }}"
+        )
+        self.assertEqual(template.render(Context({'image': self.image})), '200x200')
+        self.assertEqual(template.render(Context({'image': None})), 'x')
+
+    def test_template_tag_cached(self):
+        template = Template(
+            "{% load glitter_assets %}{% rendition image '400' as thumb %}{{ thumb.url }}"
+        )
+        url = self.image.get_rendition('400').url
+        self.assertEqual(template.render(Context({'image': self.image})), url)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(template.render(Context({'image': self.image})), url)
+
+    def test_template_tag_rendition_deleted(self):
+        template = Template(
+            "{% load glitter_assets %}{% rendition image '400' as thumb %}{{ thumb.url }}"
+        )
+        template.render(Context({'image': self.image}))
+        self.image.renditions.filter(spec='400x').delete()
+
+        # Deleting the rendition clears the cache, so it's created again
+        template.render(Context({'image': self.image}))
+        self.assertTrue(self.image.renditions.filter(spec='400x').exists())
+
+    def test_template_tag_invalid_size(self):
+        template = Template(
+            "{% load glitter_assets %}{% rendition image 'big' as thumb %}{{ thumb|default:'-' }}"
+        )
+
+        with self.assertLogs('glitter.assets', level='WARNING'):
+            self.assertEqual(template.render(Context({'image': self.image})), '-')
+
+    def test_template_tag_missing_file(self):
+        os.remove(self.image.file.path)
+        template = Template(
+            "{% load glitter_assets %}{% rendition image '123' as thumb %}"
+            "{{ thumb.url }} {{ thumb.width }}x{{ thumb.height }}"
+        )
+        expected = '{} 800x600'.format(self.image.file.url)
+
+        # The original image is used instead
+        with self.assertLogs('glitter.assets', level='WARNING'):
+            self.assertEqual(template.render(Context({'image': self.image})), expected)
+
+        # And it isn't tried again for a while
+        with self.assertNumQueries(0):
+            self.assertEqual(template.render(Context({'image': self.image})), expected)
+
+
+class RenditionWorkerTestCase(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+
+        override = override_settings(
+            MEDIA_ROOT=self.media_root, GLITTER_IMAGE_RENDITION_WORKERS=2,
+            GLITTER_ASSETS_CELERY=False,
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def test_upload_queues_renditions(self):
+        # Renditions are queued once the transaction commits, which never happens in a test case
+        image = Image.objects.create(title='Test', file=create_image_file())
+        self.assertFalse(image.renditions.exists())
+
+    def test_generate_renditions(self):
+        image = Image.objects.create(title='Test', file=create_image_file())
+        renditions = generate_renditions(image.id)
+
+        self.assertEqual(
+            sorted((item.spec, item.width, item.height) for item in renditions),
+            [('200x200-crop', 200, 200), ('x300', 400, 300)],
+        )
+
+        # Nothing left to do
+        self.assertEqual(generate_renditions(image.id), [])
+
+    def test_generate_renditions_deleted_image(self):
+        self.assertEqual(generate_renditions(0), [])
+
+    def test_file_size_from_upload(self):
+        image = Image.objects.create(title='Test', file=create_image_file())
+        file_size = image.file_size
+        self.assertGreater(file_size, 0)
+
+        # The size is kept on later saves, without checking the file again
+        os.remove(image.file.path)
+        image.title = 'Changed'
+        image.save()
+        self.assertEqual(image.file_size, file_size)
+
+
+class ContentAddressedStorageTestCase(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def test_stored_by_hash(self):
+        upload = create_image_file(name='Photo.JPG')
+        file_hash = hashlib.sha256(upload.read()).hexdigest()
+
+        image = Image.objects.create(title='Test', file=upload)
+        self.assertEqual(image.file_hash, file_hash)
+        self.assertEqual(
+            image.file.name, 'assets/image/{}/{}.jpg'.format(file_hash[:2], file_hash)
+        )
+
+    def test_duplicate_upload_reuses_file(self):
+        first = File.objects.create(
+            title='First', category=FileCategory.objects.create(title='Files'),
+            file=SimpleUploadedFile('first.txt', b'Some content'),
+        )
+        second = File.objects.create(
+            title='Second', category=first.category,
+            file=SimpleUploadedFile('second.txt', b'Some content'),
+        )
+
+        self.assertEqual(first.file.name, second.file.name)
+        self.assertEqual(second.file_size, 12)
+        self.assertEqual(os.listdir(os.path.dirname(first.file.path)), [
+            os.path.basename(first.file.name),
+        ])
+
+        # The file is only removed once nothing else uses it
+        first.delete()
+        self.assertTrue(os.path.exists(second.file.path))
+        second.delete()
+        self.assertFalse(os.path.exists(second.file.path))
+
+    def test_replaced_file_removed(self):
+        image = Image.objects.create(title='Test', file=create_image_file())
+        old_path = image.file.path
+
+        image = Image.objects.get(id=image.id)
+        image.file = create_image_file(size=(100, 100))
+        image.save()
+
+        self.assertFalse(os.path.exists(old_path))
+        self.assertTrue(os.path.exists(image.file.path))
+
+    def test_no_lookup_on_save(self):
+        image = Image.objects.create(title='Test', file=create_image_file())
+        image = Image.objects.get(id=image.id)
+        image.title = 'Changed'
+
+        # The update, and checking for missing renditions
+        with self.assertNumQueries(2):
+            image.save()
+
+
+class AssetChoiceTestCase(TestCase):
+    def setUp(self):
+        self.category = FileCategory.objects.create(title='Reports')
+        File.objects.bulk_create([
+            File(
+                title='Report {}'.format(number), category=self.category,
+                file='assets/file/report.pdf', file_size=1,
+            ) for number in range(60)
+        ])
+        self.report = File.objects.get(title='Report 5')
+
+    def get_field(self):
+        return AssetForeignKey(File).formfield(queryset=File.objects.all())
+
+    def test_select_only_renders_chosen_asset(self):
+        field = self.get_field()
+        self.assertIsInstance(field.widget, AssetSelect)
+
+        with self.assertNumQueries(1):
+            rendered = field.widget.render('report', self.report.id)
+
+        self.assertIn('data-choices-url="{}"'.format(
+            reverse('admin:glitter_assets_file_choices')
+        ), rendered)
+        self.assertIn('<option value="{}" selected="selected">Report 5</option>'.format(
+            self.report.id
+        ), rendered)
+        self.assertEqual(rendered.count('<option'), 2)
+
+    def test_choices_view(self):
+        User.objects.create_superuser('admin', 'admin@example.com', 'admin')
+        self.client.login(username='admin', password='admin')
+        url = reverse('admin:glitter_assets_file_choices')
+
+        response = self.client.get(url)
+        data = json.loads(response.content.decode())
+        self.assertEqual(len(data['results']), 50)
+        self.assertTrue(data['more'])
+
+        response = self.client.get(url, {'q': 'report 5'})
+        data = json.loads(response.content.decode())
+        self.assertEqual(data['results'][0], {
+            'id': self.report.id, 'text': 'Report 5', 'group': 'Reports',
+        })
+        self.assertEqual(len(data['results']), 11)
+        self.assertFalse(data['more'])
+
+    def test_choices_view_needs_login(self):
+        response = self.client.get(reverse('admin:glitter_assets_file_choices'))
+        self.assertEqual(response.status_code, 302)
+
+    def test_choice_cache(self):
+        start_choice_cache()
+        self.addCleanup(clear_choice_cache)
+
+        with self.assertNumQueries(1):
+            first = list(self.get_field().choices)
+            second = list(self.get_field().choices)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(first[1][1]), 60)
+
+    def test_choice_cache_outside_request(self):
+        with self.assertNumQueries(2):
+            list(iter(self.get_field().choices))
+            list(iter(self.get_field().choices))
@@ -0,0 +1,86 @@
+from io import BytesIO
+import logging
+
+from django.conf import settings
+
+from glitter.concurrency import (
+    celery_enabled, get_background_executor, on_commit, run_in_background,
+)
+
+from .models import Image
+from .renditions import (
+    create_renditions, get_missing_specs, get_rendition_quality, resize_image, save_rendition,
+)
+
+
+logger = logging.getLogger('glitter.assets')
+
+# Sensible defaults if no other settings are provided
+GLITTER_IMAGE_RENDITION_WORKERS = 2
+
+
+def get_rendition_workers():
+    """
+    Return the number of threads used for creating renditions without Celery, where ``0`` means
+    renditions are created while saving the image.
+    """
+    return getattr(settings, 'GLITTER_IMAGE_RENDITION_WORKERS', GLITTER_IMAGE_RENDITION_WORKERS)
+
+
+def get_resize_executor():
+    """
+    Return the shared thread pool used for resizing images, creating it on first use.
+
+    Pillow releases the GIL while resizing, so the sizes for an image are created in parallel
+    without forking the web process.
+    """
+    return get_background_executor('assets.resize', max_workers=get_rendition_workers())
+
+
+def generate_renditions(image_id):
+    """
+    Create any missing named renditions for an image, resizing them in parallel.
+
+    Returns a list of renditions created.
+    """
+    try:
+        image = Image.objects.get(pk=image_id)
+        specs = get_missing_specs(image)
+
+        if not specs:
+            return []
+
+        with image.file.storage.open(image.file.name, 'rb') as image_file:
+            content = image_file.read()
+
+        quality = get_rendition_quality()
+        futures = [
+            (spec, get_resize_executor().submit(resize_image, BytesIO(content), spec, quality))
+            for spec in specs
+        ]
+
+        return [save_rendition(image, spec, future.result()) for spec, future in futures]
+    except Image.DoesNotExist:
+        # Deleted before we got to it, nothing to do
+        return []
+    except Exception:
+        logger.exception('Unable to create renditions for image %s', image_id)
+        return []
+
+
+def queue_renditions(image):
+    """
+    Queue the creation of named renditions for an image once the current transaction has been
+    committed, using Celery if it's enabled or a local pool of workers otherwise.
+    """
+    if celery_enabled('GLITTER_ASSETS_CELERY'):
+        from .tasks import rendition_task
+
+        on_commit(lambda: rendition_task.delay(pk=image.pk))
+    elif get_rendition_workers():
+        on_commit(lambda: run_in_background('assets', generate_renditions, image.pk))
+    else:
+        try:
+            create_renditions(image)
+        except (OSError, ValueError):
+            logger.warning('Unable to create renditions for image %s', image.pk, exc_info=True)
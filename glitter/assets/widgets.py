@@ -2,9 +2,11 @@ from django.contrib.admin.sites import AdminSite
 from django.contrib.admin.templatetags.admin_static import static
 from django.contrib.admin.views.main import IS_POPUP_VAR, TO_FIELD_VAR
 from django.contrib.admin.widgets import RelatedFieldWidgetWrapper
-from django.core.urlresolvers import reverse
+from django.core.urlresolvers import NoReverseMatch, reverse
+from django.forms.models import ModelChoiceIterator
 from django.forms.widgets import Media, Select
 from django.template.loader import render_to_string
+from django.utils.encoding import force_text
 
 from glitter.templatetags.glitter_admin_js import jquery_min
 from glitter.assets.models import ImageCategory
@@ -64,8 +66,57 @@ class ImageRelatedFieldWidgetWrapper(RelatedFieldWidgetWrapper):
         return self.widget.media + js_media + css_media
 
 
-class ImageSelect(Select):
+class AssetSelect(Select):
+    """
+    Select which only includes the chosen asset, rather than every asset. Other assets are searched
+    for with the admin choices view when they're needed.
+    """
+    lazy = True
+
     class Media:
+        js = ('glitter/js/widgets/asset_select.js',)
+
+    def get_choices_url(self):
+        opts = self.choices.queryset.model._meta
+        return reverse('admin:{}_{}_choices'.format(opts.app_label, opts.model_name))
+
+    def render(self, name, value, attrs=None, choices=()):
+        attrs = dict(attrs or {})
+
+        try:
+            attrs['data-choices-url'] = self.get_choices_url()
+            attrs['class'] = ' '.join(filter(None, ['glitter-asset-select', attrs.get('class')]))
+        except (AttributeError, NoReverseMatch):
+            # Without the choices view every asset needs to be listed
+            self.lazy = False
+
+        return super().render(name, value, attrs, choices)
+
+    def render_options(self, choices, selected_choices):
+        if not self.lazy or not isinstance(self.choices, ModelChoiceIterator):
+            return super().render_options(choices, selected_choices)
+
+        selected_choices = set(force_text(value) for value in selected_choices if value)
+        field = self.choices.field
+        output = []
+
+        if field.empty_label is not None:
+            output.append(self.render_option(selected_choices, '', field.empty_label))
+
+        try:
+            selected_objects = list(self.choices.queryset.filter(pk__in=selected_choices))
+        except (ValueError, TypeError):
+            selected_objects = []
+
+        for obj in selected_objects:
+            output.append(self.render_option(selected_choices, *self.choices.choice(obj)))
+
+        return '\n'.join(output)
+
+
+class ImageSelect(AssetSelect):
+    class Media:
+        extend = False
         css = {
             'all': ('glitter/css/widgets/images.min.css',)
         }
@@ -77,11 +128,17 @@ class ImageSelect(Select):
             value = ''
         options = self.render_options(choices, [value])
 
+        # Fetch an extra image to find out if there are any more to load
+        images = list(
+            self.choices.queryset.prefetch_related('renditions').order_by('-id')[
+                :LIMIT_IMAGES_TO + 1
+            ]
+        )
+
         context = {
             'options': options,
-            'images': self.choices.queryset.order_by(
-                '-created_at', 'modified_at', 'title'
-            )[:LIMIT_IMAGES_TO],
+            'images': images[:LIMIT_IMAGES_TO],
+            'has_more_images': len(images) > LIMIT_IMAGES_TO,
             'categories': ImageCategory.objects.all()
         }
         return context
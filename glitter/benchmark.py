@@ -0,0 +1,363 @@
+"""
+Benchmarks for rendering, editing and publishing glitter pages.
+
+Each benchmark builds its own synthetic data, so these should only ever be run against an empty
+test database - the ``glitter_benchmark`` management command takes care of this.
+"""
+from datetime import timedelta
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.contenttypes.models import ContentType
+from django.core.urlresolvers import reverse
+from django.db import connection, transaction
+from django.test import Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from .models import ContentBlock, Version
+from .templates import get_layout, get_templates
+from .views import render_page
+
+
+DEFAULT_BLOCK_COUNTS = (10, 100, 500)
+DEFAULT_TREE_DEPTH = 20
+DEFAULT_VERSION_COUNT = 1000
+DEFAULT_ACTION_COUNT = 100
+
+# Run in a fresh interpreter to time setting up Django, and find out what gets imported
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+duration = (time.perf_counter() - start) * 1000
+from django.apps import apps
+block_modules = {'%s.blocks' % app_config.name for app_config in apps.get_app_configs()}
+print(json.dumps({
+    'ms': duration,
+    'modules': len(sys.modules),
+    'block_modules': len([
+        name for name in block_modules
+        if name in sys.modules and not hasattr(sys.modules[name], '__path__')
+    ]),
+}))
+"""
+
+
+class Rollback(Exception):
+    pass
+
+
+def measure(func, repeat):
+    """
+    Call a function a number of times, returning timings (in milliseconds) and query counts.
+
+    The function is called in a transaction which is rolled back afterwards, so each call starts
+    with the same data.
+    """
+    durations = []
+    queries = []
+
+    for i in range(repeat):
+        try:
+            with transaction.atomic():
+                with CaptureQueriesContext(connection) as captured:
+                    start = time.perf_counter()
+                    func()
+                    durations.append((time.perf_counter() - start) * 1000)
+
+                queries.append(len(captured))
+                raise Rollback
+        except Rollback:
+            pass
+
+    return {
+        'repeat': repeat,
+        'min_ms': min(durations),
+        'median_ms': statistics.median(durations),
+        'max_ms': max(durations),
+        'queries': max(queries),
+    }
+
+
+def get_page_template():
+    from .pages.models import Page
+
+    template_choices = sorted(get_templates(Page))
+
+    if not template_choices:
+        raise LookupError('No layouts registered for pages')
+
+    return template_choices[0][0]
+
+
+def create_block(block_number, page_version, column, pages):
+    """
+    Create a block of a different type depending on the block number, from any installed blocks.
+    """
+    block_builders = []
+
+    if apps.is_installed('glitter.blocks.html'):
+        from .blocks.html.models import HTML
+
+        block_builders.append(lambda: HTML.objects.create(
+            content='<p>HTML block {}</p>'.format(block_number),
+        ))
+
+    if apps.is_installed('glitter.blocks.redactor'):
+        from .blocks.redactor.models import Redactor
+
+        block_builders.append(lambda: Redactor.objects.create(
+            content='<p>Text block {}</p>'.format(block_number),
+        ))
+
+    if apps.is_installed('glitter.blocks.related_pages'):
+        from .blocks.related_pages.models import RelatedPage, RelatedPagesBlock
+
+        def related_pages_block():
+            block = RelatedPagesBlock.objects.create()
+
+            for position, page in enumerate(pages[:5]):
+                RelatedPage.objects.create(related_pages_block=block, page=page, position=position)
+
+            return block
+
+        block_builders.append(related_pages_block)
+
+    if apps.is_installed('glitter.blocks.banner'):
+        from .blocks.banner.models import Banner, BannerBlock, BannerInline
+
+        def banner_block():
+            block = BannerBlock.objects.create()
+            banner = Banner.objects.create(title='Banner {}'.format(block_number))
+            BannerInline.objects.create(banner_block=block, banner=banner)
+            return block
+
+        block_builders.append(banner_block)
+
+    block = block_builders[block_number % len(block_builders)]()
+    content_block = ContentBlock.objects.create(
+        obj_version=page_version,
+        column=column,
+        position=block_number,
+        content_type=ContentType.objects.get_for_model(block),
+        object_id=block.id,
+    )
+    block.content_block = content_block
+    block.save(update_fields=['content_block'])
+    return block
+
+
+def create_page_tree(depth):
+    """
+    Create a chain of pages nested to the given depth, returning the list of pages.
+    """
+    from .pages.models import Page
+
+    pages = []
+    parent = None
+
+    for level in range(depth):
+        parent = Page.objects.create(
+            url='/benchmark-{}/'.format(level), title='Benchmark {}'.format(level), parent=parent,
+        )
+        pages.append(parent)
+
+    return pages
+
+
+def create_page(block_count, tree_depth, version_count, owner):
+    """
+    Create a published page at the bottom of a page tree, with a number of old versions and a
+    current version containing a mix of blocks spread over all columns.
+    """
+    from .pages.models import Page
+
+    pages = create_page_tree(tree_depth)
+    page = pages[-1]
+    content_type = ContentType.objects.get_for_model(Page)
+    template_name = get_page_template()
+    columns = list(get_layout(template_name)._meta.columns)
+
+    Version.objects.bulk_create([
+        Version(
+            content_type=content_type, object_id=page.id, template_name=template_name,
+            version_number=version_number, owner=owner,
+        ) for version_number in range(1, version_count)
+    ])
+
+    page_version = Version.objects.create(
+        content_type=content_type, object_id=page.id, template_name=template_name,
+        version_number=version_count, owner=owner,
+    )
+
+    for block_number in range(1, block_count + 1):
+        column = columns[block_number % len(columns)]
+        create_block(block_number, page_version, column, pages)
+
+    page = Page.objects.get(id=page.id)
+    page.current_version = page_version
+    page.save()
+    return page
+
+
+def get_superuser():
+    User = get_user_model()
+
+    try:
+        return User.objects.get(username='benchmark')
+    except User.DoesNotExist:
+        return User.objects.create_superuser('benchmark', 'benchmark@example.com', 'benchmark')
+
+
+def benchmark_render_page(page, repeat):
+    request = RequestFactory().get(page.url)
+    request.user = AnonymousUser()
+
+    def render():
+        response = render_page(request, page, page.current_version)
+        assert response.status_code == 200
+
+    return measure(render, repeat)
+
+
+def benchmark_duplicate_content(page, repeat, owner):
+    from .pages.models import Page
+
+    model_admin = admin.site._registry[Page]
+
+    def duplicate():
+        new_version = Version.objects.create(
+            content_type=page.current_version.content_type, object_id=page.id,
+            template_name=page.current_version.template_name, owner=owner,
+        )
+        model_admin.duplicate_content(page.current_version, new_version)
+
+    return measure(duplicate, repeat)
+
+
+def benchmark_block_move(page, repeat, owner):
+    from .forms import MoveBlockForm
+
+    # Blocks can only be moved in unsaved versions
+    version = page.current_version
+    version.version_number = None
+    version.save()
+
+    content_block = version.contentblock_set.order_by('position').last()
+    url = reverse('admin:glitter_pages_page_block_move', args=(content_block.id,))
+
+    client = Client()
+    client.login(username=owner.get_username(), password='benchmark')
+
+    def move():
+        response = client.post(url, {'move': MoveBlockForm.MOVE_TOP})
+        assert response.status_code == 200
+
+    return measure(move, repeat)
+
+
+def benchmark_process_actions(page, action_count, repeat, owner):
+    from .publisher.models import PublishAction
+    from .publisher.utils import process_actions
+
+    version = page.current_version
+    scheduled_time = timezone.now() - timedelta(minutes=1)
+
+    def process():
+        # Actions alternate between publishing and unpublishing, so every action changes the page
+        PublishAction.objects.bulk_create([
+            PublishAction(
+                content_type=version.content_type, object_id=page.id,
+                scheduled_time=scheduled_time, user=owner,
+                publish_version=(
+                    PublishAction.UNPUBLISH_CHOICE if action % 2 else version.version_number
+                ),
+            ) for action in range(action_count)
+        ])
+        assert process_actions() == action_count
+
+    result = measure(process, repeat)
+    result['actions_per_second'] = action_count / (result['median_ms'] / 1000)
+    return result
+
+
+def benchmark_startup(repeat):
+    """
+    Time how long ``django.setup()`` takes in a new process, along with the number of modules
+    imported - and how many block admin modules were imported, which should be none.
+    """
+    env = dict(os.environ)
+    env['DJANGO_SETTINGS_MODULE'] = settings.SETTINGS_MODULE
+    env['PYTHONPATH'] = os.pathsep.join(path for path in sys.path if path)
+
+    runs = []
+
+    for i in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', STARTUP_SCRIPT], env=env)
+        runs.append(json.loads(output.decode().strip().splitlines()[-1]))
+
+    durations = [run['ms'] for run in runs]
+
+    return {
+        'name': 'startup',
+        'repeat': repeat,
+        'min_ms': min(durations),
+        'median_ms': statistics.median(durations),
+        'max_ms': max(durations),
+        'modules': max(run['modules'] for run in runs),
+        'block_modules': max(run['block_modules'] for run in runs),
+    }
+
+
+def run_benchmarks(block_counts=DEFAULT_BLOCK_COUNTS, tree_depth=DEFAULT_TREE_DEPTH,
+                   version_count=DEFAULT_VERSION_COUNT, action_count=DEFAULT_ACTION_COUNT,
+                   repeat=5):
+    """
+    Run all benchmarks, returning a list of results.
+    """
+    results = []
+    owner = get_superuser()
+
+    for block_count in block_counts:
+        try:
+            with transaction.atomic():
+                page = create_page(block_count, tree_depth, version_count, owner)
+                parameters = {
+                    'blocks': block_count,
+                    'tree_depth': tree_depth,
+                    'versions': version_count,
+                }
+
+                benchmarks = [
+                    ('render_page', lambda: benchmark_render_page(page, repeat)),
+                    ('duplicate_content', lambda: benchmark_duplicate_content(
+                        page, repeat, owner,
+                    )),
+                    ('process_actions', lambda: benchmark_process_actions(
+                        page, action_count, repeat, owner,
+                    )),
+                    ('page_block_move_view', lambda: benchmark_block_move(page, repeat, owner)),
+                ]
+
+                for name, benchmark in benchmarks:
+                    result = {'name': name}
+                    result.update(parameters)
+                    result.update(benchmark())
+                    results.append(result)
+
+                raise Rollback
+        except Rollback:
+            pass
+
+    return results
@@ -1,4 +1,5 @@
 from functools import update_wrapper
+from threading import RLock
 
 from django.conf import settings
 from django.contrib import messages
@@ -20,6 +21,7 @@ from django.utils.translation import ugettext as _
 from django.views.decorators.cache import never_cache
 from django.views.decorators.csrf import csrf_protect
 
+from glitter import autodiscover_blocks
 from glitter.models import ContentBlock, Version
 from glitter.page import Glitter
 from glitter.templates import get_layout
@@ -31,12 +33,80 @@ class BlockAdminSite(AdminSite):
 
     def __init__(self, *args, **kwargs):
         # All blocks can be registered to this admin site
-        self.block_list = {}
+        self._block_list = {}
+        self._discovered = False
+        self._discovering = False
+        self._discover_lock = RLock()
+
+        # Changes made before the blocks modules are imported, such as a project unregistering
+        # one of glitter's blocks at startup, are kept until they can be applied
+        self._pending = []
 
         super().__init__(*args, **kwargs)
 
+    def discover(self):
+        """
+        Import the blocks module of every app, registering their block admins, then apply any
+        changes which were made before then.
+
+        This happens the first time the block admin is used rather than at startup, so processes
+        which never edit pages don't import any block admin classes, forms or widgets.
+        """
+        if self._discovered:
+            return
+
+        with self._discover_lock:
+            # Blocks modules register their admins while they're being discovered
+            if self._discovered or self._discovering:
+                return
+
+            self._discovering = True
+
+            try:
+                autodiscover_blocks()
+
+                for method, args, kwargs in self._pending:
+                    method(*args, **kwargs)
+
+                self._pending = []
+                self._discovered = True
+            finally:
+                self._discovering = False
+
+    def defer(self, method, *args, **kwargs):
+        """
+        Return True if a change to the registered blocks has been kept until the blocks modules
+        are imported, or False if it can be made straight away.
+        """
+        if self._discovered or self._discovering:
+            return False
+
+        with self._discover_lock:
+            if self._discovered or self._discovering:
+                return False
+
+            self._pending.append((method, args, kwargs))
+            return True
+
+    @property
+    def _registry(self):
+        self.discover()
+        return self._block_registry
+
+    @_registry.setter
+    def _registry(self, value):
+        self._block_registry = value
+
+    @property
+    def block_list(self):
+        self.discover()
+        return self._block_list
+
     # Use the block admin class by default
     def register(self, model_or_iterable, admin_class=None, **options):
+        if self.defer(self.register, model_or_iterable, admin_class, **options):
+            return
+
         if not admin_class:
             admin_class = BlockAdmin
 
@@ -46,21 +116,33 @@ class BlockAdminSite(AdminSite):
 
         super().register(model_or_iterable, admin_class, **options)
 
+    def unregister(self, model_or_iterable):
+        if self.defer(self.unregister, model_or_iterable):
+            return
+
+        super().unregister(model_or_iterable)
+
     # Blocks from the site or other apps can be registered
     def register_block(self, block_or_iterable, category):
-        if category not in self.block_list:
-            self.block_list[category] = []
+        if self.defer(self.register_block, block_or_iterable, category):
+            return
+
+        if category not in self._block_list:
+            self._block_list[category] = []
 
         if issubclass(block_or_iterable.__class__, ModelBase):
-            self.block_list[category].append(block_or_iterable)
+            self._block_list[category].append(block_or_iterable)
         else:
             for block in block_or_iterable:
-                self.block_list[category].append(block)
+                self._block_list[category].append(block)
 
     def unregister_block(self, block, category):
+        if self.defer(self.unregister_block, block, category):
+            return
+
         try:
-            self.block_list[category].remove(block)
-        except ValueError:
+            self._block_list[category].remove(block)
+        except (KeyError, ValueError):
             pass
 
     # Remove all of the default admin URLs, we only want the model views for
@@ -68,6 +150,8 @@ class BlockAdminSite(AdminSite):
     def get_urls(self):
         from django.conf.urls import url, include
 
+        self.discover()
+
         if settings.DEBUG:
             self.check_dependencies()
 
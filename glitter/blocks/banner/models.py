@@ -22,6 +22,7 @@ class Banner(models.Model):
 
 class BannerBlock(BaseBlock):
     render_function = 'glitter.blocks.banner.views.banner_view'
+    volatile = True
 
     class Meta:
         verbose_name = 'banner'
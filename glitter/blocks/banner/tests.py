@@ -10,7 +10,7 @@ from glitter.models import Version, ContentBlock
 from glitter.pages.models import Page
 
 from glitter.blocks.banner.models import Banner, BannerBlock, BannerInline
-from glitter.blocks.banner.admin import BannerInlineAdmin
+from glitter.blocks.banner.blocks import BannerInlineAdmin
 
 
 @modify_settings(INSTALLED_APPS={'append': 'glitter.tests.sample'})
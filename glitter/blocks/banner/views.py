@@ -12,7 +12,9 @@ def banner_view(block, request, rerender, content_block, block_classes):
 
     banner_inlines = None
     if block:
-        banner_inlines = block.bannerinline_set.select_related('banner__image').all()
+        banner_inlines = block.bannerinline_set.select_related(
+            'banner__image'
+        ).prefetch_related('banner__image__renditions')
 
     template_name = 'glitter/blocks/%s.html' % content_block.content_type.model
     context = {
@@ -1,13 +1,8 @@
 from django.contrib import admin
-from django.forms.widgets import Select
 
-from glitter.blockadmin import blocks
+from glitter.utils import moved_attributes
 
-from .models import (
-    Carousel, CarouselImage, ImageOnlyCarousel, CarouselBlock, ImageOnlyCarouselBlock,
-    ImageOnlyCarouselImage
-)
-from .widgets import CustomRelatedFieldWidgetWrapper
+from .models import Carousel, CarouselImage, ImageOnlyCarousel, ImageOnlyCarouselImage
 
 
 class CarouselImageInline(admin.StackedInline):
@@ -19,20 +14,6 @@ class CarouselAdmin(admin.ModelAdmin):
     inlines = [CarouselImageInline]
 
 
-class CarouselBlockAdmin(blocks.BlockAdmin):
-    def formfield_for_dbfield(self, db_field, **kwargs):
-        formfield = super().formfield_for_dbfield(db_field, **kwargs)
-        if db_field.name == 'carousel':
-            formfield.widget = CustomRelatedFieldWidgetWrapper(
-                widget=Select(),
-                rel=db_field.rel,
-                admin_site=self.admin_site,
-                can_add_related=True,
-                can_change_related=True,
-            )
-        return formfield
-
-
 class ImageOnlyCarouselImageInline(admin.TabularInline):
     model = ImageOnlyCarouselImage
     extra = 1
@@ -42,26 +23,11 @@ class ImageOnlyCarouselAdmin(admin.ModelAdmin):
     inlines = [ImageOnlyCarouselImageInline]
 
 
-class ImageOnlyCarouselBlockAdmin(blocks.BlockAdmin):
-    def formfield_for_dbfield(self, db_field, **kwargs):
-        formfield = super().formfield_for_dbfield(
-            db_field, **kwargs)
-        if db_field.name == 'carousel':
-            formfield.widget = CustomRelatedFieldWidgetWrapper(
-                widget=Select(),
-                rel=db_field.rel,
-                admin_site=self.admin_site,
-                can_add_related=True,
-                can_change_related=True,
-            )
-        return formfield
-
-
 admin.site.register(Carousel, CarouselAdmin)
 admin.site.register(ImageOnlyCarousel, ImageOnlyCarouselAdmin)
 
-blocks.site.register(CarouselBlock, CarouselBlockAdmin)
-blocks.site.register(ImageOnlyCarouselBlock, ImageOnlyCarouselBlockAdmin)
 
-blocks.site.register_block(CarouselBlock, 'Media')
-blocks.site.register_block(ImageOnlyCarouselBlock, 'Media')
+# Block admins have moved to blocks.py, which is only imported once the block admin is used
+moved_attributes(__name__, 'glitter.blocks.carousel.blocks', (
+    'CarouselBlockAdmin', 'ImageOnlyCarouselBlockAdmin',
+))
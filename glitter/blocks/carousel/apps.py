@@ -5,3 +5,7 @@ class CarouselConfig(AppConfig):
     name = 'glitter.blocks.carousel'
     label = 'glitter_carousel'
     verbose_name = 'Carousels'
+
+    def ready(self):
+        super().ready()
+        from . import listeners  # noqa
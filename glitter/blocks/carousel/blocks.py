@@ -0,0 +1,42 @@
+from django.forms.widgets import Select
+
+from glitter.blockadmin import blocks
+
+from .models import CarouselBlock, ImageOnlyCarouselBlock
+from .widgets import CustomRelatedFieldWidgetWrapper
+
+
+class CarouselBlockAdmin(blocks.BlockAdmin):
+    def formfield_for_dbfield(self, db_field, **kwargs):
+        formfield = super().formfield_for_dbfield(db_field, **kwargs)
+        if db_field.name == 'carousel':
+            formfield.widget = CustomRelatedFieldWidgetWrapper(
+                widget=Select(),
+                rel=db_field.rel,
+                admin_site=self.admin_site,
+                can_add_related=True,
+                can_change_related=True,
+            )
+        return formfield
+
+
+class ImageOnlyCarouselBlockAdmin(blocks.BlockAdmin):
+    def formfield_for_dbfield(self, db_field, **kwargs):
+        formfield = super().formfield_for_dbfield(
+            db_field, **kwargs)
+        if db_field.name == 'carousel':
+            formfield.widget = CustomRelatedFieldWidgetWrapper(
+                widget=Select(),
+                rel=db_field.rel,
+                admin_site=self.admin_site,
+                can_add_related=True,
+                can_change_related=True,
+            )
+        return formfield
+
+
+blocks.site.register(CarouselBlock, CarouselBlockAdmin)
+blocks.site.register(ImageOnlyCarouselBlock, ImageOnlyCarouselBlockAdmin)
+
+blocks.site.register_block(CarouselBlock, 'Media')
+blocks.site.register_block(ImageOnlyCarouselBlock, 'Media')
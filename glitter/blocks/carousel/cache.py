@@ -0,0 +1,37 @@
+from django.core.cache import cache
+
+
+SLIDES_KEY = 'glitter_carousel_slides_{}_{}'
+
+
+def get_slides_key(carousel_model, carousel_id):
+    return SLIDES_KEY.format(carousel_model._meta.model_name, carousel_id)
+
+
+def get_cached_slides(carousel_model, carousel_id, thumb_dimensions):
+    """
+    Return the cached list of slides for a carousel at a thumbnail size, or None if they haven't
+    been cached.
+    """
+    slides = cache.get(get_slides_key(carousel_model, carousel_id)) or {}
+    return slides.get(thumb_dimensions)
+
+
+def set_cached_slides(carousel_model, carousel_id, thumb_dimensions, slides):
+    """
+    Cache a list of slides for a carousel. Slides for every thumbnail size are kept together, so
+    they can all be cleared at once.
+    """
+    key = get_slides_key(carousel_model, carousel_id)
+    cached = cache.get(key) or {}
+    cached[thumb_dimensions] = slides
+    cache.set(key, cached, None)
+
+
+def clear_slides(carousel_model, carousel_ids):
+    """
+    Clear the cached slides for carousels, so they're fetched again next time they're rendered.
+    """
+    cache.delete_many([
+        get_slides_key(carousel_model, carousel_id) for carousel_id in carousel_ids
+    ])
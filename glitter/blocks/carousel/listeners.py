@@ -0,0 +1,35 @@
+from django.db.models.signals import post_delete, post_save
+
+from .cache import clear_slides
+from .models import Carousel, CarouselImage, ImageOnlyCarousel, ImageOnlyCarouselImage
+
+
+def carousel_update(sender, instance, **kwargs):
+    clear_slides(sender, [instance.pk])
+
+
+def carousel_image_update(sender, instance, **kwargs):
+    clear_slides(sender._meta.get_field('carousel').related_model, [instance.carousel_id])
+
+
+def rendition_delete(instance, **kwargs):
+    # Renditions are deleted when an image file is replaced, and the same image could be in any
+    # number of carousels
+    for carousel_image_model in (CarouselImage, ImageOnlyCarouselImage):
+        carousel_ids = carousel_image_model.objects.filter(
+            image_id=instance.image_id,
+        ).values_list('carousel_id', flat=True).distinct()
+        clear_slides(
+            carousel_image_model._meta.get_field('carousel').related_model, carousel_ids
+        )
+
+
+for carousel_model in (Carousel, ImageOnlyCarousel):
+    post_save.connect(carousel_update, sender=carousel_model)
+    post_delete.connect(carousel_update, sender=carousel_model)
+
+for carousel_image_model in (CarouselImage, ImageOnlyCarouselImage):
+    post_save.connect(carousel_image_update, sender=carousel_image_model)
+    post_delete.connect(carousel_image_update, sender=carousel_image_model)
+
+post_delete.connect(rendition_delete, sender='glitter_assets.Rendition')
@@ -43,6 +43,9 @@ class CarouselImage(BaseCarouselImage):
 class CarouselBlock(BaseBlock):
     carousel = models.ForeignKey(Carousel, on_delete=models.PROTECT)
 
+    render_function = 'glitter.blocks.carousel.views.carousel_view'
+    volatile = True
+
     class Meta:
         verbose_name = 'carousel'
 
@@ -74,5 +77,8 @@ class ImageOnlyCarouselImage(BaseImageOnlyCarouselImage):
 class ImageOnlyCarouselBlock(BaseBlock):
     carousel = models.ForeignKey(ImageOnlyCarousel, on_delete=models.PROTECT)
 
+    render_function = 'glitter.blocks.carousel.views.carousel_view'
+    volatile = True
+
     class Meta:
         verbose_name = 'image only carousel'
@@ -4,8 +4,25 @@ when you run "manage.py test".
 
 Replace this with more appropriate tests for your application.
 """
+import shutil
+import tempfile
 
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.urlresolvers import get_callable
+from django.test import TestCase, override_settings
+from django.test.client import RequestFactory
+
+from glitter.assets.models import Image
+from glitter.assets.tests import create_image_file
+from glitter.models import ContentBlock, Version
+from glitter.pages.models import Page
+
+from .models import (
+    Carousel, CarouselBlock, CarouselImage, ImageOnlyCarousel, ImageOnlyCarouselBlock,
+    ImageOnlyCarouselImage,
+)
 
 
 class SimpleTest(TestCase):
@@ -14,3 +31,114 @@ class SimpleTest(TestCase):
         Tests that 1 + 1 always equals 2.
         """
         self.assertEqual(1 + 1, 2)
+
+
+class CarouselViewTestCase(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        page = Page.objects.create(url='/carousel/', title='Carousel')
+        self.page_version = Version.objects.create(
+            content_type=ContentType.objects.get_for_model(Page),
+            object_id=page.id,
+            template_name='glitter/sample.html',
+            owner=User.objects.create_user(username='carousel', password='carousel'),
+        )
+
+        self.carousel = Carousel.objects.create(title='Carousel')
+        for position in range(3):
+            self.add_slide(position)
+
+        self.block = self.create_block(CarouselBlock, self.carousel)
+        self.request = RequestFactory().get('/')
+        self.view = get_callable(CarouselBlock.render_function)
+
+    def add_slide(self, position):
+        return CarouselImage.objects.create(
+            carousel=self.carousel,
+            title='Slide {}'.format(position),
+            image=Image.objects.create(title='Image', file=create_image_file()),
+            link='/slide-{}/'.format(position),
+            position=position,
+        )
+
+    def create_block(self, block_model, carousel):
+        block = block_model.objects.create(carousel=carousel)
+        block.content_block = ContentBlock.objects.create(
+            obj_version=self.page_version,
+            column='side',
+            position=ContentBlock.objects.count() + 1,
+            content_type=ContentType.objects.get_for_model(block_model),
+            object_id=block.id,
+        )
+        return block
+
+    def render(self, block):
+        return self.view(block, self.request, False, block.content_block, ['carousel'])
+
+    def test_slides(self):
+        rendered = self.render(self.block)
+
+        for position in range(3):
+            self.assertInHTML('<h2>Slide {}</h2>'.format(position), rendered)
+
+        self.assertEqual(rendered.count('width="320"'), 3)
+
+    def test_fixed_queries(self):
+        # Renditions are created on first use, so create them before counting queries
+        self.render(self.block)
+        self.add_slide(3)
+        self.render(self.block)
+        cache.clear()
+
+        # Carousel images with their images, and renditions
+        with self.assertNumQueries(2):
+            rendered = self.render(self.block)
+
+        self.assertEqual(rendered.count('width="320"'), 4)
+
+    def test_cached(self):
+        self.render(self.block)
+
+        with self.assertNumQueries(0):
+            rendered = self.render(self.block)
+
+        self.assertInHTML('<h2>Slide 0</h2>', rendered)
+
+    def test_cache_cleared(self):
+        self.render(self.block)
+
+        carousel_image = self.carousel.carousel_images.get(position=0)
+        carousel_image.title = 'Changed'
+        carousel_image.save()
+        self.assertInHTML('<h2>Changed</h2>', self.render(self.block))
+
+        carousel_image.delete()
+        self.assertNotIn('Changed', self.render(self.block))
+
+        image = self.carousel.carousel_images.first().image
+        image.file = create_image_file(size=(640, 320))
+        image.save()
+        self.assertIn('height="160"', self.render(self.block))
+
+    def test_image_only_carousel(self):
+        carousel = ImageOnlyCarousel.objects.create(title='Image only')
+        ImageOnlyCarouselImage.objects.create(
+            carousel=carousel, image=Image.objects.create(title='Image', file=create_image_file()),
+        )
+        block = self.create_block(ImageOnlyCarouselBlock, carousel)
+
+        self.assertEqual(self.render(block).count('width="320"'), 1)
+
+        ImageOnlyCarouselImage.objects.create(
+            carousel=carousel, image=Image.objects.create(title='Image', file=create_image_file()),
+        )
+        self.assertEqual(self.render(block).count('width="320"'), 2)
@@ -1 +1,69 @@
-# Create your views here.
+from django.template.loader import render_to_string
+
+from glitter.assets.templatetags.glitter_assets import rendition
+from glitter.templates import get_layout
+
+from .cache import get_cached_slides, set_cached_slides
+
+
+def get_slides(carousel_model, carousel_id, thumb_dimensions):
+    """
+    Return a list of slides for a carousel, with a thumbnail of each image.
+
+    Images and their renditions are fetched with a fixed number of queries, and the slides are
+    cached until the carousel changes.
+    """
+    slides = get_cached_slides(carousel_model, carousel_id, thumb_dimensions)
+
+    if slides is not None:
+        return slides
+
+    carousel_image_model = carousel_model._meta.get_field('carousel_images').related_model
+    carousel_images = carousel_image_model.objects.filter(
+        carousel_id=carousel_id,
+    ).select_related('image').prefetch_related('image__renditions')
+
+    slides = []
+    resized = True
+
+    for carousel_image in carousel_images:
+        thumb = rendition(carousel_image.image, thumb_dimensions, crop=True)
+        resized = resized and thumb is not None and thumb.resized
+
+        slides.append({
+            'title': getattr(carousel_image, 'title', ''),
+            'subtitle': getattr(carousel_image, 'subtitle', ''),
+            'link': getattr(carousel_image, 'link', ''),
+            'thumb': thumb and {'url': thumb.url, 'width': thumb.width, 'height': thumb.height},
+        })
+
+    # Images which couldn't be resized are tried again next time
+    if resized:
+        set_cached_slides(carousel_model, carousel_id, thumb_dimensions, slides)
+
+    return slides
+
+
+def carousel_view(block, request, rerender, content_block, block_classes):
+    css_classes = ' '.join(block_classes)
+
+    # Find the column
+    layout = get_layout(template_name=content_block.obj_version.template_name)
+    column = layout._meta.columns[content_block.column]
+    thumb_dimensions = '%d' % column.width
+
+    slides = None
+    if block:
+        carousel_model = block._meta.get_field('carousel').related_model
+        slides = get_slides(carousel_model, block.carousel_id, thumb_dimensions)
+
+    template_name = 'glitter/blocks/%s.html' % content_block.content_type.model
+    context = {
+        'content_block': content_block,
+        'css_classes': css_classes,
+        'object': block,
+        'column': column,
+        'thumb_dimensions': thumb_dimensions,
+        'slides': slides}
+    rendered = render_to_string(template_name, context, request=request)
+    return rendered
@@ -1,17 +1,6 @@
-from glitter.blockadmin import blocks
+from glitter.utils import moved_attributes
 
-from .models import DefinitionList, DefinitionListInline
-
-
-class DefinitionListInlineAdmin(blocks.TabularInline):
-    min_num = 1
-    extra = 0
-    model = DefinitionListInline
-
-
-class DefinitionListAdmin(blocks.BlockAdmin):
-    inlines = [DefinitionListInlineAdmin]
-
-
-blocks.site.register(DefinitionList, DefinitionListAdmin)
-blocks.site.register_block(DefinitionList, 'Common')
+# Block admins have moved to blocks.py, which is only imported once the block admin is used
+moved_attributes(__name__, 'glitter.blocks.definition_list.blocks', (
+    'DefinitionListAdmin', 'DefinitionListInlineAdmin',
+))
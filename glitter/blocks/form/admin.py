@@ -1,7 +1,28 @@
-from glitter.blockadmin import blocks
+from django.contrib import admin
 
-from .models import ContactFormBlock
+from .models import FormSubmission, FormSubmissionFile
 
 
-blocks.site.register(ContactFormBlock)
-blocks.site.register_block(ContactFormBlock, 'Forms')
+class FormSubmissionFileInline(admin.TabularInline):
+    model = FormSubmissionFile
+    fields = readonly_fields = ('name', 'content_type', 'size')
+    extra = 0
+    can_delete = False
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(FormSubmission)
+class FormSubmissionAdmin(admin.ModelAdmin):
+    date_hierarchy = 'created_at'
+    list_display = ('subject', 'recipient', 'reply_to', 'created_at', 'sent_at', 'attempts')
+    readonly_fields = (
+        'recipient', 'reply_to', 'subject', 'body', 'created_at', 'sent_at', 'attempts',
+        'next_attempt_at', 'last_error',
+    )
+    exclude = ('content_type', 'object_id')
+    inlines = [FormSubmissionFileInline]
+
+    def has_add_permission(self, request):
+        return False
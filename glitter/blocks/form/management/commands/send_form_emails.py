@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from glitter.blocks.form.utils import send_submissions
+
+
+class Command(BaseCommand):
+    help = 'Send emails for form block submissions which are due'
+
+    requires_system_checks = False
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=None,
+            help='Number of emails to send over each connection',
+        )
+
+    def handle(self, **options):
+        emails_sent = send_submissions(batch_size=options['batch_size'])
+        self.stdout.write('Emails sent: {}'.format(emails_sent))
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+import glitter.blocks.form.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('glitter_form', '0004_formsubmission_attempts'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='formsubmissionfile',
+            name='file',
+            field=glitter.blocks.form.models.FormSubmissionFileField(blank=True, upload_to=glitter.blocks.form.models.form_submission_upload_to),
+        ),
+    ]
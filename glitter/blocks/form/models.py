@@ -1,5 +1,16 @@
+import mimetypes
+import uuid
+
+from django.conf import settings
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.storage import get_storage_class
+from django.core.mail import EmailMessage
+from django.core.signals import setting_changed
 from django.db import models
 from django.forms.fields import EmailField
+from django.utils import timezone
+from django.utils.functional import LazyObject, empty
 
 from mptt.fields import TreeForeignKey
 
@@ -11,6 +22,7 @@ class BaseFormBlock(BaseBlock):
     success_page = TreeForeignKey('glitter_pages.Page', null=True, on_delete=models.SET_NULL)
 
     render_function = 'glitter.blocks.form.views.form_view'
+    volatile = True
 
     class Meta:
         abstract = True
@@ -28,6 +40,7 @@ class BaseFormNoEmailBlock(BaseBlock):
     success_page = TreeForeignKey('glitter_pages.Page', null=True, on_delete=models.SET_NULL)
 
     render_function = 'glitter.blocks.form.views.form_view'
+    volatile = True
 
     class Meta:
         abstract = True
@@ -38,3 +51,121 @@ class ContactFormBlock(BaseFormBlock):
 
     class Meta:
         verbose_name = 'contact form'
+
+
+class FormSubmission(models.Model):
+    """
+    A form sent from a form block, which acts as an outbox for the email sent to the recipient.
+    """
+    object_id = models.PositiveIntegerField()
+    content_type = models.ForeignKey(ContentType)
+    content_object = GenericForeignKey('content_type', 'object_id')
+    recipient = models.EmailField()
+    reply_to = models.EmailField(blank=True)
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    # Delivery attempts, which are retried with an increasing delay if sending fails
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ('-created_at',)
+        index_together = (('sent_at', 'next_attempt_at'),)
+
+    def __str__(self):
+        return '{} to {}'.format(self.subject, self.recipient)
+
+    def get_email_message(self, connection=None):
+        """
+        Return an email for this submission, with any uploaded files attached.
+
+        Files are read from storage one at a time as the email is built, rather than being kept
+        in memory while the form is processed.
+        """
+        email = EmailMessage(
+            subject=self.subject,
+            body=self.body,
+            to=[self.recipient],
+            reply_to=[self.reply_to] if self.reply_to else None,
+            connection=connection,
+        )
+
+        for submission_file in self.files.all():
+            email.attach(*submission_file.get_attachment())
+
+        return email
+
+
+class FormSubmissionStorage(LazyObject):
+    """
+    Storage for files uploaded with form blocks, set with the ``GLITTER_FORM_FILE_STORAGE``
+    setting - which should be somewhere the files can't be seen by visitors.
+    """
+    def __init__(self):
+        super().__init__()
+        # Pick up a different storage when settings are overridden, such as in tests
+        setting_changed.connect(self.setting_changed)
+
+    def _setup(self):
+        self._wrapped = get_storage_class(getattr(settings, 'GLITTER_FORM_FILE_STORAGE', None))()
+
+    def setting_changed(self, setting, **kwargs):
+        if setting in ('GLITTER_FORM_FILE_STORAGE', 'DEFAULT_FILE_STORAGE', 'MEDIA_ROOT'):
+            self._wrapped = empty
+
+
+form_submission_storage = FormSubmissionStorage()
+
+
+class FormSubmissionFileField(models.FileField):
+    def __init__(self, *args, **kwargs):
+        kwargs['storage'] = form_submission_storage
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        # The storage depends on settings, so it's left out of migrations
+        name, path, args, kwargs = super().deconstruct()
+        kwargs.pop('storage', None)
+        return name, path, args, kwargs
+
+
+def form_submission_upload_to(instance, filename):
+    # Each file gets a random directory, so uploads can't be found by guessing their names
+    return 'form/submissions/{}/{}'.format(uuid.uuid4().hex, filename)
+
+
+class FormSubmissionFile(models.Model):
+    """
+    A file uploaded with a form submission, which is removed from storage once it has been sent.
+    """
+    submission = models.ForeignKey(FormSubmission, related_name='files')
+    file = FormSubmissionFileField(upload_to=form_submission_upload_to, blank=True)
+    name = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=100, blank=True)
+    size = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return self.name
+
+    def get_attachment(self):
+        """
+        Return the filename, content and mimetype for attaching this file to an email.
+        """
+        mimetype = self.content_type or mimetypes.guess_type(self.name)[0]
+        mimetype = mimetype or 'application/octet-stream'
+
+        with self.file.storage.open(self.file.name, 'rb') as attachment:
+            content = attachment.read()
+
+        # Text attachments need to be text, anything which isn't is sent as it is
+        if mimetype.startswith('text/'):
+            try:
+                content = content.decode()
+            except UnicodeDecodeError:
+                mimetype = 'application/octet-stream'
+
+        return self.name, content, mimetype
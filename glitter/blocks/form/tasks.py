@@ -0,0 +1,11 @@
+from celery import shared_task
+
+from .utils import send_submissions
+
+
+@shared_task
+def send_form_emails_task():
+    """
+    Send emails for form block submissions from Celery.
+    """
+    send_submissions()
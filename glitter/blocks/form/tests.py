@@ -1,13 +1,31 @@
+from datetime import timedelta
+from io import StringIO
+import os
+import shutil
+import tempfile
+
+from django import forms
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
+from django.core import mail
+from django.core.management import call_command
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.urlresolvers import get_callable
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.test.client import RequestFactory
+from django.utils import timezone
 
+from glitter.exceptions import GlitterRedirectException
 from glitter.models import Version, ContentBlock
 from glitter.pages.models import Page
+from glitter.tests.smtp import LocalSMTPServer
 
-from .models import ContactFormBlock
+from .forms import ContactForm
+from .models import (
+    ContactFormBlock, FormSubmission, FormSubmissionFile, form_submission_storage,
+)
+from .utils import send_submissions
 
 
 class FormTestCase(TestCase):
@@ -47,3 +65,216 @@ class FormTestCase(TestCase):
         self.view(
             self.form_block, self.request, False, self.content_block, 'test-class'
         )
+
+
+class AttachmentForm(ContactForm):
+    attachment = forms.FileField(required=False)
+
+
+class PrivateStorage(FileSystemStorage):
+    pass
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class FormSubmissionTestCase(FormTestCase):
+    def setUp(self):
+        super().setUp()
+        self.success_page = Page.objects.create(url='/thanks/', title='Thanks')
+        self.form_block.success_page = self.success_page
+        self.form_block.save()
+
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def post_form(self, **extra):
+        data = {
+            'name': 'Visitor',
+            'email': 'visitor@example.com',
+            'message': 'Hello',
+        }
+        data.update(extra)
+        request = self.factory.post('/form/', data)
+
+        with self.assertRaises(GlitterRedirectException):
+            self.view(
+                self.form_block, request, False, self.content_block, ['test-class'],
+                form_class=AttachmentForm,
+            )
+
+    def test_submission_stored(self):
+        self.post_form(attachment=SimpleUploadedFile('notes.txt', b'Some notes'))
+
+        # Stored, but not emailed during the request
+        submission = FormSubmission.objects.get()
+        self.assertEqual(submission.recipient, 'test@blanc.ltd.uk')
+        self.assertEqual(submission.reply_to, 'visitor@example.com')
+        self.assertIn('Message: Hello', submission.body)
+        self.assertIsNone(submission.sent_at)
+        self.assertEqual(len(mail.outbox), 0)
+
+        submission_file = submission.files.get()
+        self.assertEqual(submission_file.name, 'notes.txt')
+        self.assertEqual(submission_file.size, 10)
+
+    def test_send_submission(self):
+        self.post_form(attachment=SimpleUploadedFile('notes.txt', b'Some notes'))
+        submission = FormSubmission.objects.get()
+
+        self.assertEqual(send_submissions(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+        email = mail.outbox[0]
+        self.assertEqual(email.to, ['test@blanc.ltd.uk'])
+        self.assertEqual(email.reply_to, ['visitor@example.com'])
+        self.assertEqual(email.attachments, [('notes.txt', 'Some notes', 'text/plain')])
+
+        # Only ever sent once
+        self.assertEqual(send_submissions(), 0)
+        self.assertEqual(len(mail.outbox), 1)
+        submission.refresh_from_db()
+        self.assertIsNotNone(submission.sent_at)
+
+    def test_sent_files_deleted(self):
+        self.post_form(attachment=SimpleUploadedFile('notes.txt', b'Some notes'))
+        submission_file = FormSubmissionFile.objects.get()
+        path = submission_file.file.path
+
+        # Stored in a directory which can't be guessed
+        self.assertNotIn(timezone.now().strftime('%Y/%m/%d'), submission_file.file.name)
+        self.assertTrue(os.path.exists(path))
+
+        send_submissions()
+
+        submission_file.refresh_from_db()
+        self.assertFalse(submission_file.file)
+        self.assertFalse(os.path.exists(path))
+
+    @override_settings(GLITTER_FORM_FILE_STORAGE='glitter.blocks.form.tests.PrivateStorage')
+    def test_file_storage(self):
+        self.assertIsInstance(form_submission_storage, PrivateStorage)
+
+    @override_settings(GLITTER_FORM_MAX_FILE_SIZE=5)
+    def test_file_too_big(self):
+        request = self.factory.post('/form/', {
+            'name': 'Visitor',
+            'email': 'visitor@example.com',
+            'message': 'Hello',
+            'attachment': SimpleUploadedFile('notes.txt', b'Some notes'),
+        })
+
+        rendered = self.view(
+            self.form_block, request, False, self.content_block, ['test-class'],
+            form_class=AttachmentForm,
+        )
+        self.assertIn('Files must be smaller than 5', rendered)
+        self.assertFalse(FormSubmission.objects.exists())
+
+    @override_settings(GLITTER_FORM_MAX_UPLOAD_SIZE=5)
+    def test_upload_too_big(self):
+        request = self.factory.post('/form/', {
+            'name': 'Visitor',
+            'email': 'visitor@example.com',
+            'message': 'Hello',
+            'attachment': SimpleUploadedFile('notes.txt', b'Some notes'),
+        })
+
+        rendered = self.view(
+            self.form_block, request, False, self.content_block, ['test-class'],
+            form_class=AttachmentForm,
+        )
+        self.assertIn('in total', rendered)
+        self.assertFalse(FormSubmission.objects.exists())
+
+
+class FormOutboxTestCase(TestCase):
+    def setUp(self):
+        self.page = Page.objects.create(url='/form/', title='Test page')
+        self.server = LocalSMTPServer()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+        override = override_settings(
+            EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend',
+            EMAIL_HOST='127.0.0.1', EMAIL_PORT=self.server.port,
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def create_submissions(self, count):
+        return [FormSubmission.objects.create(
+            content_object=self.page,
+            recipient='test@blanc.ltd.uk',
+            subject='Contact form',
+            body='Message {}'.format(number),
+        ) for number in range(count)]
+
+    def test_batch_uses_one_connection(self):
+        self.create_submissions(3)
+
+        self.assertEqual(send_submissions(), 3)
+        self.assertEqual(len(self.server.messages), 3)
+        self.assertEqual(self.server.connections, 1)
+        self.assertFalse(FormSubmission.objects.filter(sent_at=None).exists())
+
+    def test_batch_size(self):
+        self.create_submissions(3)
+
+        self.assertEqual(send_submissions(batch_size=2), 3)
+        self.assertEqual(self.server.connections, 2)
+
+    def test_retry(self):
+        failed, sent = self.create_submissions(2)
+        self.server.fail_messages = 1
+
+        with self.assertLogs('glitter.blocks.form', level='WARNING'):
+            self.assertEqual(send_submissions(), 1)
+
+        failed.refresh_from_db()
+        self.assertIsNone(failed.sent_at)
+        self.assertEqual(failed.attempts, 1)
+        self.assertIn('451', failed.last_error)
+        self.assertGreater(failed.next_attempt_at, timezone.now())
+
+        # Not due yet
+        self.assertEqual(send_submissions(), 0)
+
+        FormSubmission.objects.filter(id=failed.id).update(
+            next_attempt_at=timezone.now() - timedelta(seconds=1)
+        )
+        self.assertEqual(send_submissions(), 1)
+        self.assertEqual(len(self.server.messages), 2)
+
+    @override_settings(GLITTER_FORM_EMAIL_MAX_ATTEMPTS=1)
+    def test_gives_up(self):
+        submission, = self.create_submissions(1)
+        self.server.fail_messages = 1
+
+        with self.assertLogs('glitter.blocks.form', level='WARNING'):
+            self.assertEqual(send_submissions(), 0)
+
+        FormSubmission.objects.filter(id=submission.id).update(next_attempt_at=timezone.now())
+        self.assertEqual(send_submissions(), 0)
+        self.assertEqual(self.server.messages, [])
+
+    def test_connection_failure(self):
+        submissions = self.create_submissions(2)
+        self.server.stop()
+        self.server.close()
+
+        with self.assertLogs('glitter.blocks.form', level='WARNING'):
+            self.assertEqual(send_submissions(), 0)
+
+        for submission in submissions:
+            submission.refresh_from_db()
+            self.assertEqual(submission.attempts, 1)
+
+    def test_command(self):
+        self.create_submissions(2)
+        stdout = StringIO()
+
+        call_command('send_form_emails', stdout=stdout)
+        self.assertEqual(stdout.getvalue().strip(), 'Emails sent: 2')
@@ -0,0 +1,255 @@
+from datetime import timedelta
+import logging
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.mail import get_connection
+from django.forms.fields import FileField
+from django.template.defaultfilters import filesizeformat
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from glitter.concurrency import celery_enabled, on_commit, run_in_background
+
+from .models import FormSubmission, FormSubmissionFile
+
+
+logger = logging.getLogger('glitter.blocks.form')
+
+# Sensible defaults if no other settings are provided
+GLITTER_FORM_MAX_FILE_SIZE = 10 * 1024 * 1024
+GLITTER_FORM_MAX_UPLOAD_SIZE = 20 * 1024 * 1024
+GLITTER_FORM_EMAIL_BATCH_SIZE = 50
+GLITTER_FORM_EMAIL_MAX_ATTEMPTS = 5
+GLITTER_FORM_EMAIL_RETRY_DELAY = 60
+
+# How long a worker has to send a batch before it can be picked up by another worker
+LEASE_SECONDS = 10 * 60
+
+
+def get_max_file_size():
+    """
+    Return the largest file in bytes which can be uploaded with a form block.
+    """
+    return getattr(settings, 'GLITTER_FORM_MAX_FILE_SIZE', GLITTER_FORM_MAX_FILE_SIZE)
+
+
+def get_max_upload_size():
+    """
+    Return the largest total size in bytes of all files uploaded with a form block.
+    """
+    return getattr(settings, 'GLITTER_FORM_MAX_UPLOAD_SIZE', GLITTER_FORM_MAX_UPLOAD_SIZE)
+
+
+def get_file_uploads(form):
+    """
+    Return a list of field names and uploaded files for a valid form.
+    """
+    uploads = []
+
+    if form.is_multipart():
+        for field in form:
+            if isinstance(field.field, FileField):
+                file_upload = form.cleaned_data.get(field.name)
+
+                if file_upload:
+                    uploads.append((field.name, file_upload))
+
+    return uploads
+
+
+def check_upload_sizes(form):
+    """
+    Add errors to a form for any uploaded files which are too big, returning True if the sizes are
+    all acceptable.
+    """
+    max_file_size = get_max_file_size()
+    total_size = 0
+
+    for name, file_upload in get_file_uploads(form):
+        total_size += file_upload.size
+
+        if file_upload.size > max_file_size:
+            form.add_error(name, 'Files must be smaller than {}.'.format(
+                filesizeformat(max_file_size)
+            ))
+
+    if total_size > get_max_upload_size():
+        form.add_error(None, 'The files uploaded must be smaller than {} in total.'.format(
+            filesizeformat(get_max_upload_size())
+        ))
+
+    return not form.errors
+
+
+def create_submission(block, form, obj, request):
+    """
+    Store a form submission and any uploaded files, ready for emailing.
+    """
+    page_url = '%s://%s%s' % (request.scheme, request.get_host(), obj.get_absolute_url())
+
+    submission = FormSubmission.objects.create(
+        content_type=ContentType.objects.get_for_model(obj),
+        object_id=obj.pk,
+        recipient=block.recipient,
+        reply_to=block.get_replyto_address(form) or '',
+        subject=settings.EMAIL_SUBJECT_PREFIX + block._meta.verbose_name,
+        body=render_to_string('glitter/form_email.txt', {
+            'form': form,
+            'obj': obj,
+            'page_url': page_url,
+        }),
+    )
+
+    for name, file_upload in get_file_uploads(form):
+        # Uploads are copied to storage in chunks, rather than being read into memory
+        FormSubmissionFile.objects.create(
+            submission=submission,
+            file=file_upload,
+            name=file_upload.name,
+            content_type=getattr(file_upload, 'content_type', None) or '',
+            size=file_upload.size,
+        )
+
+    return submission
+
+
+def get_retry_delay(attempts):
+    """
+    Return how long to wait before trying to send an email again, doubling after each attempt.
+    """
+    retry_delay = getattr(
+        settings, 'GLITTER_FORM_EMAIL_RETRY_DELAY', GLITTER_FORM_EMAIL_RETRY_DELAY
+    )
+    return timedelta(seconds=retry_delay * 2 ** (attempts - 1))
+
+
+def claim_submissions(batch_size):
+    """
+    Return a batch of submissions which are due to be emailed.
+
+    Submissions are leased to this worker by moving their next attempt time forward, so they won't
+    be picked up by any other workers - or if this worker dies, they'll be tried again once the
+    lease has expired.
+    """
+    now = timezone.now()
+    max_attempts = getattr(
+        settings, 'GLITTER_FORM_EMAIL_MAX_ATTEMPTS', GLITTER_FORM_EMAIL_MAX_ATTEMPTS
+    )
+    lease = now + timedelta(seconds=LEASE_SECONDS)
+
+    due_ids = list(FormSubmission.objects.filter(
+        sent_at=None, next_attempt_at__lte=now, attempts__lt=max_attempts,
+    ).order_by('next_attempt_at', 'id').values_list('id', flat=True)[:batch_size])
+
+    if not due_ids:
+        return []
+
+    FormSubmission.objects.filter(
+        id__in=due_ids, sent_at=None, next_attempt_at__lte=now,
+    ).update(next_attempt_at=lease)
+
+    return list(FormSubmission.objects.filter(
+        id__in=due_ids, sent_at=None, next_attempt_at=lease,
+    ).order_by('id').prefetch_related('files'))
+
+
+def delete_submission_files(submissions):
+    """
+    Remove the uploaded files for submissions which have been sent, as they aren't needed once
+    they've been emailed.
+    """
+    for submission in submissions:
+        for submission_file in submission.files.all():
+            if not submission_file.file:
+                continue
+
+            try:
+                submission_file.file.delete(save=False)
+            except Exception:
+                logger.warning(
+                    'Unable to delete file %s for form submission %s', submission_file.id,
+                    submission.id, exc_info=True,
+                )
+
+    FormSubmissionFile.objects.filter(submission__in=submissions).update(file='')
+
+
+def send_batch(submissions):
+    """
+    Send emails for a batch of submissions over a single connection, returning the number sent.
+    """
+    sent_ids = []
+    failures = []
+    connection = get_connection()
+
+    try:
+        connection.open()
+    except Exception as error:
+        # Couldn't connect, so none of the batch can be sent
+        failures = [(submission, error) for submission in submissions]
+    else:
+        try:
+            for submission in submissions:
+                try:
+                    submission.get_email_message(connection=connection).send(fail_silently=False)
+                    sent_ids.append(submission.id)
+                except Exception as error:
+                    failures.append((submission, error))
+        finally:
+            connection.close()
+
+    now = timezone.now()
+    FormSubmission.objects.filter(id__in=sent_ids).update(sent_at=now)
+    delete_submission_files([
+        submission for submission in submissions if submission.id in sent_ids
+    ])
+
+    for submission, error in failures:
+        logger.warning('Unable to send form submission %s: %s', submission.id, error)
+        attempts = submission.attempts + 1
+        FormSubmission.objects.filter(id=submission.id).update(
+            attempts=attempts,
+            next_attempt_at=now + get_retry_delay(attempts),
+            last_error=str(error),
+        )
+
+    return len(sent_ids)
+
+
+def send_submissions(batch_size=None):
+    """
+    Send the emails for all submissions which are due, in batches.
+
+    Returns the number of emails sent.
+    """
+    if batch_size is None:
+        batch_size = getattr(
+            settings, 'GLITTER_FORM_EMAIL_BATCH_SIZE', GLITTER_FORM_EMAIL_BATCH_SIZE
+        )
+
+    emails_sent = 0
+
+    while True:
+        submissions = claim_submissions(batch_size)
+
+        if not submissions:
+            break
+
+        emails_sent += send_batch(submissions)
+
+    return emails_sent
+
+
+def queue_submission(submission):
+    """
+    Send the email for a form submission in the background once it has been saved, so visitors
+    don't have to wait for it. Uses Celery if it's enabled, or a background thread otherwise.
+    """
+    if celery_enabled('GLITTER_FORM_CELERY'):
+        from .tasks import send_form_emails_task
+
+        on_commit(send_form_emails_task.delay)
+    else:
+        # Anything unsent is kept, so it can be sent again later
+        on_commit(lambda: run_in_background('form', send_submissions))
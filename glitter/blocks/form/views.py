@@ -1,17 +1,15 @@
 from importlib import import_module
 
-from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
-from django.core.mail import EmailMessage
 from django.core.urlresolvers import get_mod_func
 from django.forms import ModelForm
-from django.forms.fields import FileField
 from django.template.loader import render_to_string
 
 from glitter.exceptions import GlitterRedirectException
 
 from .models import BaseFormBlock, BaseFormNoEmailBlock
 from .signals import form_valid
+from .utils import check_upload_sizes, create_submission, queue_submission
 
 
 def form_view(block, request, rerender, content_block, block_classes, form_class=None):
@@ -44,7 +42,7 @@ def form_view(block, request, rerender, content_block, block_classes, form_class
         # All should be okay to process the form!
         form = form_class(request.POST or None, request.FILES or None)
 
-        if form.is_valid():
+        if form.is_valid() and check_upload_sizes(form):
             version = content_block.obj_version
             obj = version.content_object
 
@@ -67,38 +65,9 @@ def form_view(block, request, rerender, content_block, block_classes, form_class
             if isinstance(block, BaseFormNoEmailBlock):
                 raise GlitterRedirectException(block.success_page.url)
 
-            # Additional information for emailing
-            page_url = '%s://%s%s' % (request.scheme, request.get_host(), obj.get_absolute_url())
-
-            email_subject = settings.EMAIL_SUBJECT_PREFIX + block._meta.verbose_name
-            email_body = render_to_string('glitter/form_email.txt', {
-                'form': form,
-                'obj': obj,
-                'page_url': page_url,
-            })
-            reply_to_email = block.get_replyto_address(form)
-            email_data = {
-                'subject': email_subject,
-                'body': email_body,
-                'to': [block.recipient],
-            }
-            if reply_to_email:
-                email_data.update({'reply_to': [reply_to_email]})
-
-            email = EmailMessage(**email_data)
-
-            # Add any attachments
-            if form.is_multipart():
-                for field in form:
-                    if isinstance(field.field, FileField):
-                        file_upload = form.cleaned_data[field.name]
-
-                        if file_upload:
-                            file_upload.open('rb')
-                            file_content = file_upload.read()
-                            email.attach(filename=file_upload.name, content=file_content)
-
-            email.send(fail_silently=False)
+            # Keep the submission and any files, the email is sent in the background
+            submission = create_submission(block=block, form=form, obj=obj, request=request)
+            queue_submission(submission)
             raise GlitterRedirectException(block.success_page.url)
 
     templates = ('glitter/blocks/%s.html' % content_block.content_type.model,
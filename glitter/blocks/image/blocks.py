@@ -0,0 +1,130 @@
+import os
+
+from django.conf.urls import url
+from django.forms.forms import pretty_name
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
+from django.template.loader import get_template
+
+from glitter.assets.forms import ImageForm
+from glitter.assets.models import Image
+from glitter.assets.widgets import LIMIT_IMAGES_TO, ImageRelatedFieldWidgetWrapper, ImageSelect
+from glitter.blockadmin import blocks
+
+from .forms import ImageBlockForm
+from .models import ImageBlock
+
+
+class ImageBlockAdmin(blocks.BlockAdmin):
+    form = ImageBlockForm
+
+    def formfield_for_dbfield(self, db_field, **kwargs):
+        """
+        Hook for specifying the form Field instance for a given database Field
+        instance.
+
+        If kwargs are given, they're passed to the form Field's constructor.
+        """
+        formfield = super().formfield_for_dbfield(db_field, **kwargs)
+        if db_field.name == 'image':
+            formfield.widget = ImageRelatedFieldWidgetWrapper(
+                ImageSelect(), db_field.rel, self.admin_site, can_add_related=True,
+                can_change_related=True,
+            )
+        return formfield
+
+    def get_urls(self):
+        urls = super().get_urls()
+        app_label, model_name = self.model._meta.app_label, self.model._meta.model_name
+        image_block_urls = [
+            url(
+                r'^get-lazy-images/$',
+                self.admin_site.admin_view(self.get_lazy_images),
+                name='get-lazy-images'
+            ),
+            url(
+                r'^drop-image/$',
+                self.drop_image,
+                name='{app_label}_{model_name}_drop_image'.format(
+                    app_label=app_label, model_name=model_name
+                )
+            ),
+        ]
+        return image_block_urls + urls
+
+    def get_image_queryset(self, request):
+        """
+        Return images for the image picker, filtered by category and title.
+
+        Images are ordered by ID so they can be paged through with ``last_image_id``, which never
+        skips or repeats images as new ones are uploaded.
+        """
+        images = Image.objects.order_by('-id')
+
+        category_id = request.GET.get('category', '')
+        if category_id.isdigit() and category_id != '0':
+            images = images.filter(category_id=category_id)
+
+        query = request.GET.get('q', '').strip()
+        if query:
+            images = images.filter(title__istartswith=query)
+
+        return images
+
+    def get_lazy_images(self, request):
+        last_image_id = request.GET.get('last_image_id', '')
+        if last_image_id and not last_image_id.isdigit():
+            response = JsonResponse({'error': 'Invalid last image id passed'})
+            response.status_code = 400
+            return response
+
+        images = self.get_image_queryset(request)
+        if last_image_id:
+            images = images.filter(id__lt=last_image_id)
+
+        # Fetch an extra image to find out if there are any more to come
+        images = list(images.prefetch_related('renditions')[:LIMIT_IMAGES_TO + 1])
+        has_more = len(images) > LIMIT_IMAGES_TO
+        images = images[:LIMIT_IMAGES_TO]
+
+        template = get_template('glitter/blocks/includes/lazy_images.html')
+        html = template.render({'images': images})
+
+        return JsonResponse({
+            'html': html,
+            'images': [{
+                'id': image.id,
+                'title': image.title,
+                'category_id': image.category_id,
+                'width': image.image_width,
+                'height': image.image_height,
+            } for image in images],
+            'last_image_id': images[-1].id if images else None,
+            'has_more': has_more,
+        })
+
+    def drop_image(self, request):
+
+        permission_name = '{}.edit_{}'.format(self.opts.app_label, self.opts.model_name)
+        if not request.user.has_perm(permission_name):
+            return HttpResponseForbidden('403 Forbidden', content_type='text/html')
+
+        form = ImageForm(request.POST, request.FILES or None)
+        if form.is_valid():
+            filename, ext = os.path.splitext(form.files['file'].name)
+            filename = pretty_name(filename)
+
+            image = form.save(commit=False)
+            image.title = filename
+            image.save()
+            return JsonResponse({'image_id': image.id, 'filename': filename})
+        else:
+            message = ''
+            for field_name, error_list in form.errors.items():
+                message = '{field} - {message}'.format(
+                    field=field_name.capitalize(), message=''.join(error_list)
+                )
+                return HttpResponse(message, status=403)
+
+
+blocks.site.register(ImageBlock, ImageBlockAdmin)
+blocks.site.register_block(ImageBlock, 'Common')
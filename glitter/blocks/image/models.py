@@ -14,6 +14,8 @@ class BaseImageBlock(BaseBlock):
     link = LinkField(blank=True)
     new_window = models.BooleanField('Open link in new window', default=False)
 
+    volatile = True
+
     objects = BaseImageBlockManager()
 
     class Meta:
@@ -1,6 +1,11 @@
+import json
+
+from django.contrib.auth.models import User
 from django.core.urlresolvers import reverse
 from django.test import TestCase
 
+from glitter.assets.models import Image, ImageCategory
+from glitter.assets.widgets import LIMIT_IMAGES_TO
 from glitter.blockadmin.blocks import BlockAdminSite
 
 
@@ -9,13 +14,16 @@ class TestImageBlockAdmin(TestCase):
 
     def setUp(self):
         self.site = BlockAdminSite(name='block_admin')
+        User.objects.create_user('editor', 'editor@test.com', 'editor', is_staff=True)
+        self.client.login(username='editor', password='editor')
 
     def test_lazy_loading(self):
         url = reverse('block_admin:get-lazy-images')
 
-        # Test if throws the errors without passing any arguments
+        # Without any arguments gets the newest images
         response = self.client.get(url)
-        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(2, len(response.context['images']))
 
         # Test by passing the string for the `last_image_image`
         response = self.client.get(url, {'last_image_id': 'test'})
@@ -25,3 +33,64 @@ class TestImageBlockAdmin(TestCase):
         response = self.client.get(url, {'last_image_id': 2})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(1, len(response.context['images']))
+
+    def test_lazy_loading_anonymous(self):
+        self.client.logout()
+
+        response = self.client.get(reverse('block_admin:get-lazy-images'))
+        self.assertEqual(response.status_code, 403)
+
+
+class TestImagePicker(TestCase):
+    def setUp(self):
+        self.url = reverse('block_admin:get-lazy-images')
+        User.objects.create_user('editor', 'editor@test.com', 'editor', is_staff=True)
+        self.client.login(username='editor', password='editor')
+
+        self.category = ImageCategory.objects.create(title='Category')
+
+        # Images without files, the picker only needs the database rows
+        Image.objects.bulk_create([
+            Image(
+                title='{} image {}'.format('Even' if number % 2 else 'Odd', number),
+                category=self.category if number % 3 else None,
+                file='assets/image/missing.jpg', image_width=100, image_height=100,
+            ) for number in range(LIMIT_IMAGES_TO + 5)
+        ])
+        self.images = list(Image.objects.order_by('id'))
+
+    def get_ids(self, **params):
+        # None of the images have files to create thumbnails from
+        with self.assertLogs('glitter.assets', level='WARNING'):
+            response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content.decode())
+        return [image['id'] for image in data['images']], data
+
+    def test_pages(self):
+        all_ids = [image.id for image in reversed(self.images)]
+
+        first_page, data = self.get_ids()
+        self.assertEqual(first_page, all_ids[:LIMIT_IMAGES_TO])
+        self.assertTrue(data['has_more'])
+        self.assertEqual(data['last_image_id'], first_page[-1])
+
+        # New uploads don't affect the next page
+        Image.objects.bulk_create([Image(
+            title='New', file='assets/image/missing.jpg', image_width=100, image_height=100,
+        )])
+        second_page, data = self.get_ids(last_image_id=data['last_image_id'])
+        self.assertEqual(second_page, all_ids[LIMIT_IMAGES_TO:])
+        self.assertFalse(data['has_more'])
+
+    def test_filter_category(self):
+        ids, data = self.get_ids(category=self.category.id)
+        self.assertEqual(ids, [
+            image.id for image in reversed(self.images) if image.category_id == self.category.id
+        ])
+
+    def test_filter_title(self):
+        ids, data = self.get_ids(q='even')
+        self.assertEqual(ids, [
+            image.id for image in reversed(self.images) if image.title.startswith('Even')
+        ])
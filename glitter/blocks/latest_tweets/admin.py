@@ -1,12 +1,6 @@
-from glitter.blockadmin import blocks
+from glitter.utils import moved_attributes
 
-from .forms import LatestTweetsBlockForm
-from .models import LatestTweetsBlock
-
-
-class LatestTweetsBlockAdmin(blocks.BlockAdmin):
-    form = LatestTweetsBlockForm
-
-
-blocks.site.register(LatestTweetsBlock, LatestTweetsBlockAdmin)
-blocks.site.register_block(LatestTweetsBlock, 'App Blocks')
+# Block admins have moved to blocks.py, which is only imported once the block admin is used
+moved_attributes(__name__, 'glitter.blocks.latest_tweets.blocks', (
+    'LatestTweetsBlockAdmin',
+))
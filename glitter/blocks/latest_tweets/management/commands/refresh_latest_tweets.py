@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from glitter.blocks.latest_tweets.models import LatestTweetsBlock
+from glitter.blocks.latest_tweets.utils import refresh_snapshot
+
+
+class Command(BaseCommand):
+    help = 'Refresh the snapshots of tweets shown in latest tweets blocks'
+
+    def handle(self, **options):
+        users = set(LatestTweetsBlock.objects.values_list('user', flat=True))
+
+        for user in sorted(users):
+            refresh_snapshot(user)
+
+        self.stdout.write('Snapshots refreshed: {}'.format(len(users)))
@@ -6,5 +6,8 @@ from glitter.models import BaseBlock
 class LatestTweetsBlock(BaseBlock):
     user = models.CharField(max_length=15, blank=True)
 
+    render_function = 'glitter.blocks.latest_tweets.views.latest_tweets_view'
+    volatile = True
+
     class Meta:
         verbose_name = 'latest tweets'
@@ -0,0 +1,11 @@
+from celery import shared_task
+
+from .utils import refresh_snapshot
+
+
+@shared_task
+def refresh_latest_tweets_task(user):
+    """
+    Refresh the snapshot of tweets for a Twitter user from Celery.
+    """
+    refresh_snapshot(user)
@@ -0,0 +1,102 @@
+import time
+from unittest import mock, skipIf
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from glitter import concurrency
+
+
+LATEST_TWEETS_MISSING = 'glitter.blocks.latest_tweets' not in settings.INSTALLED_APPS
+if not LATEST_TWEETS_MISSING:
+    from . import utils
+
+
+OLD_TWEETS = [{'html': 'Old tweet'}]
+NEW_TWEETS = [{'html': 'New tweet'}]
+
+
+@skipIf(LATEST_TWEETS_MISSING, 'glitter.blocks.latest_tweets is not installed')
+@override_settings(GLITTER_LATEST_TWEETS_CELERY=False, GLITTER_LATEST_TWEETS_MAX_AGE=60)
+class TestLatestTweets(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        patcher = mock.patch.object(utils, 'build_snapshot', return_value=NEW_TWEETS)
+        self.build_snapshot = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def set_snapshot(self, age):
+        cache.set(utils.SNAPSHOT_KEY.format('glitter'), (time.time() - age, OLD_TWEETS), None)
+
+    def wait_for_background(self):
+        # The background pool has a single worker, so anything queued earlier has finished
+        concurrency.get_background_executor('latest_tweets').submit(lambda: None).result()
+
+    def test_fresh_snapshot(self):
+        self.set_snapshot(age=0)
+
+        with mock.patch.object(utils, 'run_in_background') as run_in_background:
+            tweets = utils.get_latest_tweets('glitter')
+
+        self.assertEqual(tweets, OLD_TWEETS)
+        self.assertFalse(self.build_snapshot.called)
+        self.assertFalse(run_in_background.called)
+
+    def test_missing_snapshot(self):
+        with mock.patch.object(utils, 'run_in_background') as run_in_background:
+            tweets = utils.get_latest_tweets('glitter')
+
+        # Nothing to show yet, so the snapshot is built straight away
+        self.assertEqual(tweets, NEW_TWEETS)
+        self.build_snapshot.assert_called_once_with('glitter')
+        self.assertFalse(run_in_background.called)
+
+    def test_stale_snapshot(self):
+        self.set_snapshot(age=120)
+
+        with mock.patch.object(utils, 'run_in_background') as run_in_background:
+            tweets = utils.get_latest_tweets('glitter')
+
+        # The old tweets are shown while a refresh is queued
+        self.assertEqual(tweets, OLD_TWEETS)
+        self.assertFalse(self.build_snapshot.called)
+        run_in_background.assert_called_once_with(
+            'latest_tweets', utils.refresh_snapshot, 'glitter'
+        )
+
+    def test_refresh_queued_once(self):
+        self.set_snapshot(age=120)
+
+        with mock.patch.object(utils, 'run_in_background') as run_in_background:
+            for _ in range(3):
+                tweets = utils.get_latest_tweets('glitter')
+
+        # Other blocks don't queue a refresh while one is already waiting
+        self.assertEqual(tweets, OLD_TWEETS)
+        self.assertEqual(run_in_background.call_count, 1)
+
+    def test_refresh(self):
+        self.set_snapshot(age=120)
+
+        utils.get_latest_tweets('glitter')
+        self.wait_for_background()
+
+        self.assertEqual(utils.get_latest_tweets('glitter'), NEW_TWEETS)
+        self.assertIsNone(cache.get(utils.REFRESH_LOCK_KEY.format('glitter')))
+
+    def test_refresh_failure(self):
+        self.set_snapshot(age=120)
+        self.build_snapshot.side_effect = ValueError('Twitter is down')
+
+        with self.assertLogs('glitter.concurrency', level='ERROR'):
+            utils.get_latest_tweets('glitter')
+            self.wait_for_background()
+
+        # The old snapshot is kept, and the lock stops another refresh until it expires
+        with mock.patch.object(utils, 'run_in_background') as run_in_background:
+            self.assertEqual(utils.get_latest_tweets('glitter'), OLD_TWEETS)
+
+        self.assertFalse(run_in_background.called)
@@ -0,0 +1,102 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from latest_tweets.models import Tweet
+
+from glitter.concurrency import celery_enabled, run_in_background
+
+
+# Sensible defaults if no other settings are provided
+GLITTER_LATEST_TWEETS_MAX_AGE = 5 * 60
+
+# Number of tweets shown in each block
+TWEET_LIMIT = 4
+
+# How long to wait for a refresh which has been queued before another can be queued
+REFRESH_LOCK_SECONDS = 60
+
+SNAPSHOT_KEY = 'glitter_latest_tweets_snapshot_{}'
+REFRESH_LOCK_KEY = 'glitter_latest_tweets_refresh_{}'
+
+
+def get_max_age():
+    """
+    Return the number of seconds a snapshot of tweets is used for before it's refreshed.
+    """
+    return getattr(settings, 'GLITTER_LATEST_TWEETS_MAX_AGE', GLITTER_LATEST_TWEETS_MAX_AGE)
+
+
+def build_snapshot(user):
+    """
+    Return a list of the latest tweets for a Twitter user (or all users), as plain dicts which can
+    be kept in the cache.
+    """
+    tweets = Tweet.objects.exclude(is_reply=True)
+
+    if user:
+        tweets = tweets.filter(user=user)
+
+    return [{
+        'html': tweet.html,
+        'user': tweet.user,
+        'name': tweet.name,
+        'user_url': tweet.user_url(),
+        'retweeted_tweet_id': tweet.retweeted_tweet_id,
+        'retweeted_name': tweet.retweeted_name,
+        'retweeted_user_url': tweet.retweeted_user_url(),
+        'created': tweet.created,
+    } for tweet in tweets[:TWEET_LIMIT]]
+
+
+def refresh_snapshot(user):
+    """
+    Store a new snapshot of the latest tweets for a Twitter user, returning the tweets.
+    """
+    tweets = build_snapshot(user)
+
+    # Kept until it's replaced, an old snapshot is better than waiting for a new one
+    cache.set(SNAPSHOT_KEY.format(user), (time.time(), tweets), None)
+    cache.delete(REFRESH_LOCK_KEY.format(user))
+    return tweets
+
+
+def get_latest_tweets(user):
+    """
+    Return the latest tweets for a Twitter user (or all users if ``user`` is blank).
+
+    Tweets come from a snapshot in the cache, and a snapshot older than
+    ``GLITTER_LATEST_TWEETS_MAX_AGE`` is still used while a new one is created in the background.
+    Only a missing snapshot is created straight away.
+    """
+    snapshot = cache.get(SNAPSHOT_KEY.format(user))
+
+    if snapshot is None:
+        return refresh_snapshot(user)
+
+    refreshed_at, tweets = snapshot
+
+    if time.time() - refreshed_at > get_max_age():
+        queue_refresh(user)
+
+    return tweets
+
+
+def queue_refresh(user):
+    """
+    Refresh the snapshot of tweets for a Twitter user in the background. Uses Celery if it's
+    enabled, or a background thread otherwise.
+
+    Only one refresh is queued for each user at a time, however many blocks show their tweets.
+    """
+    if not cache.add(REFRESH_LOCK_KEY.format(user), True, REFRESH_LOCK_SECONDS):
+        return
+
+    if celery_enabled('GLITTER_LATEST_TWEETS_CELERY'):
+        from .tasks import refresh_latest_tweets_task
+
+        refresh_latest_tweets_task.delay(user=user)
+    else:
+        # If it fails the old snapshot is kept, and the lock expires so it'll be tried again later
+        run_in_background('latest_tweets', refresh_snapshot, user)
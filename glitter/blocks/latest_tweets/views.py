@@ -0,0 +1,20 @@
+from django.template.loader import render_to_string
+
+from .utils import get_latest_tweets
+
+
+def latest_tweets_view(block, request, rerender, content_block, block_classes):
+    css_classes = ' '.join(block_classes)
+    latest_tweets = None
+
+    if block:
+        latest_tweets = get_latest_tweets(block.user)
+
+    template_name = 'glitter/blocks/%s.html' % content_block.content_type.model
+    context = {
+        'content_block': content_block,
+        'css_classes': css_classes,
+        'object': block,
+        'latest_tweets': latest_tweets}
+    rendered = render_to_string(template_name, context, request=request)
+    return rendered
@@ -1,17 +1,6 @@
-from glitter.blockadmin import blocks
+from glitter.utils import moved_attributes
 
-
-from .models import RelatedPage, RelatedPagesBlock
-
-
-class RelatedPageInline(blocks.StackedInline):
-    model = RelatedPage
-    extra = 1
-
-
-class RelatedPagesBlockAdmin(blocks.BlockAdmin):
-    inlines = [RelatedPageInline]
-
-
-blocks.site.register(RelatedPagesBlock, RelatedPagesBlockAdmin)
-blocks.site.register_block(RelatedPagesBlock, 'App Blocks')
+# Block admins have moved to blocks.py, which is only imported once the block admin is used
+moved_attributes(__name__, 'glitter.blocks.related_pages.blocks', (
+    'RelatedPageInline', 'RelatedPagesBlockAdmin',
+))
@@ -0,0 +1,17 @@
+from glitter.blockadmin import blocks
+
+
+from .models import RelatedPage, RelatedPagesBlock
+
+
+class RelatedPageInline(blocks.StackedInline):
+    model = RelatedPage
+    extra = 1
+
+
+class RelatedPagesBlockAdmin(blocks.BlockAdmin):
+    inlines = [RelatedPageInline]
+
+
+blocks.site.register(RelatedPagesBlock, RelatedPagesBlockAdmin)
+blocks.site.register_block(RelatedPagesBlock, 'App Blocks')
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import re
+
+from django.db import migrations, models
+
+
+# Copied from the models, so later changes there don't affect this migration
+URL_PREFIX_RE = re.compile(r'^https?://(?:www\.)?', flags=re.IGNORECASE)
+
+
+def set_display_url(apps, schema_editor):
+    RelatedPage = apps.get_model('glitter_related_pages', 'RelatedPage')
+
+    for related_page in RelatedPage.objects.exclude(link=''):
+        related_page.display_url = URL_PREFIX_RE.sub('', related_page.link).rstrip('/')
+        related_page.save(update_fields=['display_url'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('glitter_related_pages', '0003_relatedpage_new_window'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='relatedpage',
+            name='display_url',
+            field=models.CharField(blank=True, editable=False, max_length=254),
+        ),
+        migrations.RunPython(set_display_url, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,5 @@
+import re
+
 from django.core.exceptions import ValidationError
 from django.db import models
 from mptt.fields import TreeForeignKey
@@ -7,10 +9,21 @@ from glitter.pages.models import Page
 from glitter.models import BaseBlock
 
 
+URL_PREFIX_RE = re.compile(r'^https?://(?:www\.)?', flags=re.IGNORECASE)
+
+
+def normalise_url(url):
+    """
+    Return a shorter URL for display, without the scheme, www or a trailing slash.
+    """
+    return URL_PREFIX_RE.sub('', url).rstrip('/')
+
+
 class RelatedPagesBlock(BaseBlock):
     title = models.CharField(max_length=100, blank=True, help_text='Defaults to "Related pages"')
 
     render_function = 'glitter.blocks.related_pages.views.relatedpages_view'
+    volatile = True
 
     class Meta:
         verbose_name = 'related pages'
@@ -24,6 +37,7 @@ class RelatedPage(models.Model):
     link = LinkField(blank=True)
     position = models.PositiveIntegerField(default=0, db_index=True)
     new_window = models.BooleanField('Open link in new window', default=False)
+    display_url = models.CharField(max_length=254, blank=True, editable=False)
 
     class Meta:
         ordering = ('position',)
@@ -40,3 +54,8 @@ class RelatedPage(models.Model):
 
         if self.link and not self.title:
             raise ValidationError('Need a title for a link')
+
+    def save(self, *args, **kwargs):
+        # Links are shortened once, URLs for pages depend on the site they're shown on
+        self.display_url = normalise_url(self.link) if self.link else ''
+        super().save(*args, **kwargs)
@@ -3,13 +3,13 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.urlresolvers import get_callable
 from django.test import TestCase
 from django.test.client import RequestFactory
-from django.test import modify_settings
+from django.test import modify_settings, override_settings
 
 from glitter.models import Version, ContentBlock
 from glitter.pages.models import Page
 
 
-from .models import RelatedPagesBlock
+from .models import RelatedPage, RelatedPagesBlock, normalise_url
 
 
 @modify_settings(
@@ -53,3 +53,58 @@ class RelatedPageTestCase(TestCase):
         self.view(
             self.related_page_block, self.request, False, self.content_block, 'test-class'
         )
+
+    def test_normalise_url(self):
+        self.assertEqual(normalise_url('https://www.example.com/about/'), 'example.com/about')
+        self.assertEqual(normalise_url('HTTP://example.com'), 'example.com')
+        self.assertEqual(normalise_url('ftp://example.com/'), 'ftp://example.com')
+
+    def test_display_url(self):
+        related_page = RelatedPage.objects.create(
+            related_pages_block=self.related_page_block, link='http://www.example.com/'
+        )
+        self.assertEqual(related_page.display_url, 'example.com')
+
+        related_page.link = ''
+        related_page.page = self.page
+        related_page.save()
+        self.assertEqual(related_page.display_url, '')
+
+    def test_links(self):
+        RelatedPage.objects.create(related_pages_block=self.related_page_block, page=self.page)
+        RelatedPage.objects.create(
+            related_pages_block=self.related_page_block, link='https://example.com/news/',
+            title='News',
+        )
+
+        rendered = self.view(
+            self.related_page_block, self.request, False, self.content_block, 'test-class'
+        )
+
+        self.assertInHTML(
+            '<a href="/related-page/">Test page <span>testserver/related-page</span></a>', rendered
+        )
+        self.assertInHTML(
+            '<a href="https://example.com/news/">News <span>example.com/news</span></a>', rendered
+        )
+
+    @override_settings(GLITTER_PAGE_URL_CACHE=True)
+    def test_links_url_cache(self):
+        for index in range(5):
+            page = Page.objects.create(url='/related-{}/'.format(index), title='Page')
+            RelatedPage.objects.create(related_pages_block=self.related_page_block, page=page)
+            RelatedPage.objects.create(
+                related_pages_block=self.related_page_block,
+                link='http://example.com/{}/'.format(index),
+            )
+
+        # Load the page links, then pages aren't needed at all for related pages
+        self.view(self.related_page_block, self.request, False, self.content_block, 'test-class')
+
+        with self.assertNumQueries(1):
+            rendered = self.view(
+                self.related_page_block, self.request, False, self.content_block, 'test-class'
+            )
+
+        self.assertInHTML('<span>testserver/related-4</span>', rendered)
+        self.assertInHTML('<span>example.com/4</span>', rendered)
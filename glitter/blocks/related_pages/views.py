@@ -1,34 +1,59 @@
-import re
-
 from django.contrib.syndication.views import add_domain
 from django.template.loader import render_to_string
 
+from glitter.pages.cache import PageLink, get_page_links, url_cache_enabled
+
+from .models import normalise_url
+
+
+def get_related_pages(block):
+    """
+    Return the related pages for a block, along with a dict of page IDs to page links.
+
+    With the page URL cache enabled, page links are already in memory so pages don't need to be
+    loaded at all.
+    """
+    if url_cache_enabled():
+        return list(block.relatedpage_set.all()), get_page_links()
+
+    related_pages = list(block.relatedpage_set.select_related('page'))
+    page_links = {
+        related_page.page_id: PageLink(url=related_page.page.url, title=related_page.page.title)
+        for related_page in related_pages if related_page.page_id
+    }
+    return related_pages, page_links
+
+
+def related_pages_generator(request, related_pages, page_links):
+    # Pages are on this site, so the shortened domain is the same for all of them
+    domain = normalise_url(add_domain(request.get_host(), '/', secure=request.is_secure()))
 
-def related_pages_generator(request, related_pages):
     for related_page in related_pages:
-        if related_page.page:
-            page_url = related_page.page.get_absolute_url()
-            url = add_domain(request.get_host(), page_url, secure=request.is_secure())
-        else:
-            url = related_page.link
+        if related_page.page_id:
+            page_link = page_links.get(related_page.page_id)
 
-        # Remove common prefix
-        url = re.sub(r'^https?://(?:www\.)?', '', url, flags=re.IGNORECASE)
+            if page_link is None:
+                continue
 
-        # Remove common suffix
-        if url.endswith('/'):
-            url = url.rstrip('/')
+            related_page.url = page_link.url
+            related_page.page_title = page_link.title
+            url = (domain + page_link.url).rstrip('/')
+        else:
+            related_page.url = related_page.link
+            related_page.page_title = ''
+            url = related_page.display_url or normalise_url(related_page.link)
 
         yield related_page, url
 
 
 def relatedpages_view(block, request, rerender, content_block, block_classes):
     css_classes = ' '.join(block_classes)
-    related_pages = None
+    related_pages = []
+    page_links = {}
 
     if block:
-        related_pages = block.relatedpage_set.select_related('page').all()
-    related_pages_links = related_pages_generator(request, related_pages)
+        related_pages, page_links = get_related_pages(block)
+    related_pages_links = related_pages_generator(request, related_pages, page_links)
 
     template_name = 'glitter/blocks/%s.html' % content_block.content_type.model
     context = {
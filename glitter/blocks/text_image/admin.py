@@ -1,27 +1,6 @@
-from django.contrib.admin.sites import AdminSite
+from glitter.utils import moved_attributes
 
-from glitter.assets.fields import AssetForeignKey
-from glitter.assets.widgets import ImageRelatedFieldWidgetWrapper, ImageSelect
-from glitter.blockadmin import blocks
-
-from .forms import BaseTextImageForm
-from .models import TextImageBlock
-
-
-class TextImageBlockAdmin(blocks.BlockAdmin):
-    form = BaseTextImageForm
-
-    formfield_overrides = {
-        AssetForeignKey: {
-            'widget': ImageRelatedFieldWidgetWrapper(
-                ImageSelect(),
-                TextImageBlock._meta.get_field('image').rel,
-                AdminSite(),
-                can_add_related=True
-            )
-        }
-    }
-
-
-blocks.site.register(TextImageBlock, TextImageBlockAdmin)
-blocks.site.register_block(TextImageBlock, 'Common')
+# Block admins have moved to blocks.py, which is only imported once the block admin is used
+moved_attributes(__name__, 'glitter.blocks.text_image.blocks', (
+    'TextImageBlockAdmin',
+))
@@ -9,6 +9,8 @@ class BaseTextImageBlock(BaseBlock):
     image = AssetForeignKey('glitter_assets.Image', on_delete=models.PROTECT)
     content = models.TextField()
 
+    volatile = True
+
     class Meta:
         abstract = True
 
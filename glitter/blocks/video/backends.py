@@ -0,0 +1,60 @@
+import json
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+from . import choices as video_choices
+
+
+class BaseBackend(object):
+    """
+    Base class for fetching video metadata from a provider.
+    """
+
+    def fetch(self, provider, video_id):
+        """
+        Return a dict of ``thumbnail_url``, ``duration``, ``width`` and ``height`` for a video,
+        with None for anything the provider doesn't give. Raise an exception if the video can't be
+        found.
+        """
+        raise NotImplementedError
+
+
+class OEmbedBackend(BaseBackend):
+    """
+    Fetches video metadata with the oEmbed API for each provider.
+    """
+    endpoints = {
+        video_choices.PROVIDER_YOUTUBE: 'https://www.youtube.com/oembed',
+        video_choices.PROVIDER_VIMEO: 'https://vimeo.com/api/oembed.json',
+    }
+    timeout = 10
+
+    def fetch(self, provider, video_id):
+        query = urlencode({
+            'url': video_choices.WATCH_URLS[provider].format(video_id),
+            'format': 'json',
+        })
+
+        with urlopen('{}?{}'.format(self.endpoints[provider], query), timeout=self.timeout) as f:
+            data = json.loads(f.read().decode('utf-8'))
+
+        return {
+            'thumbnail_url': data.get('thumbnail_url') or '',
+            'duration': data.get('duration'),
+            'width': data.get('width'),
+            'height': data.get('height'),
+        }
+
+
+class FakeBackend(BaseBackend):
+    """
+    Returns made up metadata without any network requests, for tests and local development.
+    """
+
+    def fetch(self, provider, video_id):
+        return {
+            'thumbnail_url': 'https://example.com/{}/{}.jpg'.format(provider, video_id),
+            'duration': 60,
+            'width': 640,
+            'height': 360,
+        }
@@ -0,0 +1,16 @@
+PROVIDER_YOUTUBE = 'youtube'
+PROVIDER_VIMEO = 'vimeo'
+PROVIDER_CHOICES = (
+    (PROVIDER_YOUTUBE, 'YouTube'),
+    (PROVIDER_VIMEO, 'Vimeo'),
+)
+
+EMBED_URLS = {
+    PROVIDER_YOUTUBE: 'https://www.youtube.com/embed/{}',
+    PROVIDER_VIMEO: 'https://player.vimeo.com/video/{}',
+}
+
+WATCH_URLS = {
+    PROVIDER_YOUTUBE: 'https://www.youtube.com/watch?v={}',
+    PROVIDER_VIMEO: 'https://vimeo.com/{}',
+}
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from glitter.blocks.video.utils import fetch_missing_metadata, metadata_enabled
+
+
+class Command(BaseCommand):
+    help = 'Fetch metadata for video blocks from each video provider'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--refresh', action='store_true', default=False,
+            help='Fetch metadata again for videos which already have it',
+        )
+
+    def handle(self, **options):
+        if not metadata_enabled():
+            raise CommandError('GLITTER_VIDEO_METADATA_BACKEND is not set')
+
+        fetched = fetch_missing_metadata(refresh=options['refresh'])
+        self.stdout.write('Videos fetched: {}'.format(fetched))
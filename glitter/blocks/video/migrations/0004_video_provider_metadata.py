@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import re
+
+from django.db import migrations, models
+
+
+# Copied from the validators, so later changes there don't affect this migration
+YOUTUBE_URL_RE = r"""
+    (?x)^
+    (
+        (?:https?://|//)                                     # http(s):// or protocol-independent URL
+        (?:(?:(?:(?:\w+\.)?[yY][oO][uU][tT][uU][bB][eE](?:-nocookie)?\.com/|
+           youtube\.googleapis\.com/)                        # the various hostnames, with wildcard subdomains
+        (?:.*?\#/)?                                          # handle anchor (#/) redirect urls
+        (?:                                                  # the various things that can precede the ID:
+            (?:(?:v|embed|e)/(?!videoseries))                # v/ or embed/ or e/
+            |(?:                                             # or the v= param in all its forms
+                (?:(?:watch|movie)(?:_popup)?(?:\.php)?/?)?  # preceding watch(_popup|.php) or nothing (like /?v=xxxx)
+                (?:\?|\#!?)                                  # the params delimiter ? or # or #!
+                (?:.*?&)??                                   # any other preceding param (like /?s=tuff&v=xxxx)
+                v=
+            )
+        ))
+        |(?:www\.)?cleanvideosearch\.com/media/action/yt/watch\?videoId=
+        )
+    )?                                                       # all until now is optional -> you can pass the naked ID
+    ([0-9A-Za-z_-]{11})                                      # here is it! the YouTube video ID
+    (?!.*?&list=)                                            # combined list/video URLs are handled by the playlist IE
+    (?(1).+)?                                                # if we found the ID, everything can follow
+    $
+"""  # noqa
+
+VIMEO_URL_RE = r"""
+    (?x)
+    https?://
+    (?:(?:www|(?P<player>player))\.)?
+    vimeo(?P<pro>pro)?\.com/
+    (?!channels/[^/?#]+/?(?:$|[?#])|album/)
+    (?:.*?/)?
+    (?:(?:play_redirect_hls|moogaloop\.swf)\?clip_id=)?
+    (?:videos?/)?
+    (?P<id>[0-9]+)
+    /?(?:[?&].*)?(?:[#].*)?$
+"""
+
+
+YOUTUBE_URL_PATTERN = re.compile(YOUTUBE_URL_RE)
+VIMEO_URL_PATTERN = re.compile(VIMEO_URL_RE)
+
+
+def parse_video_url(url):
+    match = VIMEO_URL_PATTERN.match(url)
+
+    if match:
+        return 'vimeo', match.group('id')
+
+    match = YOUTUBE_URL_PATTERN.match(url)
+
+    if match:
+        return 'youtube', match.group(2)
+
+    return None, None
+
+
+def set_provider(apps, schema_editor):
+    Video = apps.get_model('glitter_video', 'Video')
+
+    for video in Video.objects.exclude(url=''):
+        provider, video_id = parse_video_url(video.url)
+
+        if provider:
+            video.provider = provider
+            video.video_id = video_id
+            video.save(update_fields=['provider', 'video_id'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('glitter_video', '0003_delete_empty_blocks'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VideoMetadata',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.CharField(choices=[('youtube', 'YouTube'), ('vimeo', 'Vimeo')], max_length=16)),
+                ('video_id', models.CharField(max_length=32, verbose_name='video ID')),
+                ('thumbnail_url', models.URLField(blank=True, max_length=500, verbose_name='thumbnail URL')),
+                ('duration', models.PositiveIntegerField(blank=True, help_text='In seconds', null=True)),
+                ('width', models.PositiveIntegerField(blank=True, null=True)),
+                ('height', models.PositiveIntegerField(blank=True, null=True)),
+                ('fetched_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'video metadata',
+                'verbose_name_plural': 'video metadata',
+            },
+        ),
+        migrations.AddField(
+            model_name='video',
+            name='provider',
+            field=models.CharField(blank=True, choices=[('youtube', 'YouTube'), ('vimeo', 'Vimeo')], editable=False, max_length=16),
+        ),
+        migrations.AddField(
+            model_name='video',
+            name='video_id',
+            field=models.CharField(blank=True, editable=False, max_length=32, verbose_name='video ID'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='videometadata',
+            unique_together=set([('provider', 'video_id')]),
+        ),
+        migrations.RunPython(set_provider, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,9 @@
-import re
-
 from django.db import models
 
 from glitter.models import BaseBlock
 
-from .validators import validate_url, YOUTUBE_URL_RE, VIMEO_URL_RE
+from . import choices as video_choices
+from .validators import parse_video_url, validate_url
 
 
 class Video(BaseBlock):
@@ -15,29 +14,77 @@ class Video(BaseBlock):
     )
     html = models.TextField(editable=False)
     title = models.CharField(max_length=150, blank=True, help_text='Used for accessibility')
+    provider = models.CharField(
+        max_length=16, choices=video_choices.PROVIDER_CHOICES, blank=True, editable=False
+    )
+    video_id = models.CharField('video ID', max_length=32, blank=True, editable=False)
+
+    render_function = 'glitter.blocks.video.views.video_view'
+    volatile = True
 
     class Meta:
         verbose_name = 'video'
 
     def get_embed_url(self):
         """ Get correct embed url for Youtube or Vimeo. """
-        embed_url = None
-        youtube_embed_url = 'https://www.youtube.com/embed/{}'
-        vimeo_embed_url = 'https://player.vimeo.com/video/{}'
+        if not self.provider:
+            return None
+
+        return video_choices.EMBED_URLS[self.provider].format(self.video_id)
 
-        # Get video ID from url.
-        if re.match(YOUTUBE_URL_RE, self.url):
-            embed_url = youtube_embed_url.format(re.match(YOUTUBE_URL_RE, self.url).group(2))
-        if re.match(VIMEO_URL_RE, self.url):
-            embed_url = vimeo_embed_url.format(re.match(VIMEO_URL_RE, self.url).group(3))
-        return embed_url
+    def get_metadata(self):
+        """
+        Return the cached provider metadata for this video, or None if it hasn't been fetched.
+        """
+        return VideoMetadata.objects.filter(
+            provider=self.provider, video_id=self.video_id,
+        ).first()
 
     def save(self, force_insert=False, force_update=False, using=None, update_fields=None):
-        """ Set html field with correct iframe. """
+        """ Set provider, video ID and html field with correct iframe. """
         if self.url:
+            provider, video_id = parse_video_url(self.url)
+            self.provider = provider or ''
+            self.video_id = video_id or ''
+
             iframe_html = '<iframe src="{}" frameborder="0" title="{}" allowfullscreen></iframe>'
             self.html = iframe_html.format(
                 self.get_embed_url(),
                 self.title
             )
-        return super().save(force_insert, force_update, using, update_fields)
+        super().save(force_insert, force_update, using, update_fields)
+
+        if self.provider:
+            from .utils import queue_metadata  # avoid a circular import
+
+            queue_metadata(self.provider, self.video_id)
+
+
+class VideoMetadata(models.Model):
+    """
+    Details about a video from its provider, shared by every block showing the same video.
+    """
+    provider = models.CharField(max_length=16, choices=video_choices.PROVIDER_CHOICES)
+    video_id = models.CharField('video ID', max_length=32)
+    thumbnail_url = models.URLField('thumbnail URL', max_length=500, blank=True)
+    duration = models.PositiveIntegerField(null=True, blank=True, help_text='In seconds')
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    fetched_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'video metadata'
+        verbose_name_plural = 'video metadata'
+        unique_together = (('provider', 'video_id'),)
+
+    def __str__(self):
+        return '{} {}'.format(self.get_provider_display(), self.video_id)
+
+    @property
+    def aspect_ratio(self):
+        """
+        Return the height as a percentage of the width, for sizing a player before it has loaded.
+        """
+        if self.width and self.height:
+            return round(self.height / self.width * 100, 4)
+        return None
@@ -0,0 +1,32 @@
+(function() {
+    /**
+     * Video blocks with a poster image only load the player once the poster is clicked.
+     */
+    // Included by every video block, so only listen for clicks once
+    if (window.glitterVideoPosters) {
+        return;
+    }
+
+    window.glitterVideoPosters = true;
+
+    document.addEventListener('click', function(event) {
+        var poster = event.target.closest ? event.target.closest('.embed-poster') : null;
+
+        if (!poster) {
+            return;
+        }
+
+        event.preventDefault();
+
+        var iframe = document.createElement('iframe');
+        var separator = poster.getAttribute('data-embed-url').indexOf('?') === -1 ? '?' : '&';
+
+        iframe.src = poster.getAttribute('data-embed-url') + separator + 'autoplay=1';
+        iframe.title = poster.getAttribute('data-title');
+        iframe.setAttribute('frameborder', '0');
+        iframe.setAttribute('allow', 'autoplay; fullscreen');
+        iframe.setAttribute('allowfullscreen', '');
+
+        poster.parentNode.replaceChild(iframe, poster);
+    });
+})();
@@ -0,0 +1,11 @@
+from celery import shared_task
+
+from .utils import fetch_metadata
+
+
+@shared_task
+def fetch_video_metadata_task(provider, video_id):
+    """
+    Fetch metadata for a video from Celery.
+    """
+    fetch_metadata(provider, video_id)
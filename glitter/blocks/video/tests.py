@@ -0,0 +1,192 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.core.urlresolvers import get_callable
+from django.test import TestCase, override_settings
+from django.test.client import RequestFactory
+from django.utils.six import StringIO
+
+from glitter.models import ContentBlock, Version
+from glitter.pages.models import Page
+
+from . import choices as video_choices
+from .backends import FakeBackend
+from .models import Video, VideoMetadata
+from .utils import fetch_metadata, fetch_missing_metadata, queue_metadata
+from .validators import parse_video_url, validate_url
+
+
+FAKE_BACKEND = 'glitter.blocks.video.backends.FakeBackend'
+
+
+class VideoURLTestCase(TestCase):
+    def test_parse_youtube(self):
+        for url in (
+            'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+            'https://youtube.com/embed/dQw4w9WgXcQ',
+            '//www.youtube-nocookie.com/v/dQw4w9WgXcQ',
+        ):
+            self.assertEqual(
+                parse_video_url(url), (video_choices.PROVIDER_YOUTUBE, 'dQw4w9WgXcQ')
+            )
+
+    def test_parse_vimeo(self):
+        for url in (
+            'https://vimeo.com/76979871',
+            'https://player.vimeo.com/video/76979871',
+            'https://vimeo.com/channels/staffpicks/76979871',
+        ):
+            self.assertEqual(parse_video_url(url), (video_choices.PROVIDER_VIMEO, '76979871'))
+
+    def test_invalid_url(self):
+        self.assertEqual(parse_video_url('https://example.com/video/'), (None, None))
+
+        with self.assertRaises(ValidationError):
+            validate_url('https://example.com/video/')
+
+    def test_save(self):
+        video = Video.objects.create(
+            url='https://www.youtube.com/watch?v=dQw4w9WgXcQ', title='Video'
+        )
+
+        self.assertEqual(video.provider, video_choices.PROVIDER_YOUTUBE)
+        self.assertEqual(video.video_id, 'dQw4w9WgXcQ')
+        self.assertEqual(video.get_embed_url(), 'https://www.youtube.com/embed/dQw4w9WgXcQ')
+        self.assertHTMLEqual(video.html, (
+            '<iframe src="https://www.youtube.com/embed/dQw4w9WgXcQ" frameborder="0" '
+            'title="Video" allowfullscreen></iframe>'
+        ))
+
+        video.url = 'https://vimeo.com/76979871'
+        video.save()
+
+        self.assertEqual(video.provider, video_choices.PROVIDER_VIMEO)
+        self.assertEqual(video.get_embed_url(), 'https://player.vimeo.com/video/76979871')
+
+    def test_get_embed_url_without_provider(self):
+        self.assertIsNone(Video().get_embed_url())
+
+
+@override_settings(GLITTER_VIDEO_METADATA_BACKEND=FAKE_BACKEND, GLITTER_VIDEO_CELERY=False)
+class VideoMetadataTestCase(TestCase):
+    def setUp(self):
+        self.video = Video.objects.create(url='https://vimeo.com/76979871')
+
+    def test_fetch_metadata(self):
+        metadata = fetch_metadata(video_choices.PROVIDER_VIMEO, '76979871')
+
+        self.assertEqual(metadata.thumbnail_url, 'https://example.com/vimeo/76979871.jpg')
+        self.assertEqual(metadata.duration, 60)
+        self.assertEqual(metadata.aspect_ratio, 56.25)
+        self.assertEqual(self.video.get_metadata(), metadata)
+
+    def test_fetch_metadata_once(self):
+        fetch_metadata(video_choices.PROVIDER_VIMEO, '76979871')
+
+        with mock.patch.object(FakeBackend, 'fetch') as fetch:
+            fetch_metadata(video_choices.PROVIDER_VIMEO, '76979871')
+            self.assertFalse(fetch.called)
+
+            fetch.return_value = {'thumbnail_url': 'https://example.com/new.jpg'}
+            metadata = fetch_metadata(video_choices.PROVIDER_VIMEO, '76979871', refresh=True)
+
+        self.assertEqual(metadata.thumbnail_url, 'https://example.com/new.jpg')
+        self.assertEqual(VideoMetadata.objects.count(), 1)
+
+    def test_fetch_metadata_error(self):
+        with mock.patch.object(FakeBackend, 'fetch', side_effect=OSError):
+            with self.assertLogs('glitter.blocks.video', 'WARNING'):
+                metadata = fetch_metadata(video_choices.PROVIDER_VIMEO, '76979871')
+
+        self.assertIsNone(metadata)
+        self.assertFalse(VideoMetadata.objects.exists())
+
+    def test_fetch_missing_metadata(self):
+        Video.objects.create(url='https://player.vimeo.com/video/76979871')
+        Video.objects.create(url='https://www.youtube.com/watch?v=dQw4w9WgXcQ')
+
+        self.assertEqual(fetch_missing_metadata(), 2)
+        self.assertEqual(fetch_missing_metadata(), 0)
+        self.assertEqual(fetch_missing_metadata(refresh=True), 2)
+
+    def test_queue_metadata(self):
+        with mock.patch('glitter.blocks.video.utils.on_commit') as on_commit:
+            queue_metadata(video_choices.PROVIDER_VIMEO, '76979871')
+
+        with mock.patch('glitter.blocks.video.utils.run_in_background') as run_in_background:
+            on_commit.call_args[0][0]()
+
+        run_in_background.assert_called_once_with(
+            'video', fetch_metadata, video_choices.PROVIDER_VIMEO, '76979871'
+        )
+
+    @override_settings(GLITTER_VIDEO_METADATA_BACKEND=None)
+    def test_queue_metadata_disabled(self):
+        with mock.patch('glitter.blocks.video.utils.on_commit') as on_commit:
+            queue_metadata(video_choices.PROVIDER_VIMEO, '76979871')
+
+        self.assertFalse(on_commit.called)
+
+    def test_command(self):
+        stdout = StringIO()
+        call_command('fetch_video_metadata', stdout=stdout)
+
+        self.assertEqual(stdout.getvalue().strip(), 'Videos fetched: 1')
+
+
+class VideoViewTestCase(TestCase):
+    def setUp(self):
+        page = Page.objects.create(url='/video/', title='Video')
+        page_version = Version.objects.create(
+            content_type=ContentType.objects.get_for_model(Page),
+            object_id=page.id,
+            template_name='glitter/sample.html',
+            owner=User.objects.create_user(username='video', password='video'),
+        )
+
+        self.video = Video.objects.create(url='https://vimeo.com/76979871', title='Video')
+        self.content_block = ContentBlock.objects.create(
+            obj_version=page_version,
+            column='main_content',
+            position=1,
+            content_type=ContentType.objects.get_for_model(Video),
+            object_id=self.video.id,
+        )
+        self.request = RequestFactory().get('/')
+        self.view = get_callable(Video.render_function)
+
+    def render(self):
+        return self.view(self.video, self.request, False, self.content_block, ['video'])
+
+    def test_without_metadata(self):
+        with self.assertNumQueries(0):
+            rendered = self.render()
+
+        self.assertInHTML(self.video.html, rendered)
+        self.assertIn('glitter/css/video.css', rendered)
+        self.assertNotIn('glitter/js/video.js', rendered)
+
+    @override_settings(GLITTER_VIDEO_METADATA_BACKEND=FAKE_BACKEND)
+    def test_with_metadata(self):
+        VideoMetadata.objects.create(
+            provider=video_choices.PROVIDER_VIMEO, video_id='76979871',
+            thumbnail_url='https://example.com/poster.jpg', width=400, height=300,
+        )
+
+        with self.assertNumQueries(1):
+            rendered = self.render()
+
+        self.assertIn('padding-bottom: 75.0%', rendered)
+        self.assertInHTML(
+            '<a class="embed-poster" href="https://vimeo.com/76979871" '
+            'data-embed-url="https://player.vimeo.com/video/76979871" data-title="Video">'
+            '<img src="https://example.com/poster.jpg" alt="Video"></a>',
+            rendered,
+        )
+
+        # The poster needs the script to load the player
+        self.assertIn('glitter/css/video.css', rendered)
+        self.assertIn('glitter/js/video.js', rendered)
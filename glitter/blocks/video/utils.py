@@ -0,0 +1,94 @@
+import logging
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from glitter.concurrency import celery_enabled, on_commit, run_in_background
+
+from .models import Video, VideoMetadata
+
+
+logger = logging.getLogger('glitter.blocks.video')
+
+
+def get_backend():
+    """
+    Return the backend used to fetch video metadata, or None if the
+    ``GLITTER_VIDEO_METADATA_BACKEND`` setting isn't set.
+    """
+    backend_path = getattr(settings, 'GLITTER_VIDEO_METADATA_BACKEND', None)
+
+    if not backend_path:
+        return None
+
+    return import_string(backend_path)()
+
+
+def metadata_enabled():
+    """
+    Return a boolean if video metadata is fetched and used when rendering videos.
+    """
+    return bool(getattr(settings, 'GLITTER_VIDEO_METADATA_BACKEND', None))
+
+
+def fetch_metadata(provider, video_id, refresh=False):
+    """
+    Fetch and store metadata for a video, unless it has already been fetched.
+
+    Returns the metadata, or None if it couldn't be fetched.
+    """
+    if not refresh:
+        metadata = VideoMetadata.objects.filter(provider=provider, video_id=video_id).first()
+
+        if metadata is not None:
+            return metadata
+
+    try:
+        data = get_backend().fetch(provider, video_id)
+    except Exception:
+        logger.warning(
+            'Unable to fetch metadata for %s video %s', provider, video_id, exc_info=True
+        )
+        return None
+
+    metadata, created = VideoMetadata.objects.update_or_create(
+        provider=provider, video_id=video_id, defaults=data,
+    )
+    return metadata
+
+
+def fetch_missing_metadata(refresh=False):
+    """
+    Fetch metadata for every video which doesn't have any yet, or all videos if ``refresh`` is
+    set.
+
+    Returns the number of videos with metadata fetched.
+    """
+    videos = set(Video.objects.exclude(provider='').values_list('provider', 'video_id'))
+
+    if not refresh:
+        videos -= set(VideoMetadata.objects.values_list('provider', 'video_id'))
+
+    fetched = 0
+
+    for provider, video_id in sorted(videos):
+        if fetch_metadata(provider, video_id, refresh=refresh) is not None:
+            fetched += 1
+
+    return fetched
+
+
+def queue_metadata(provider, video_id):
+    """
+    Fetch metadata for a video in the background once it has been saved, so editors don't have to
+    wait for the provider. Uses Celery if it's enabled, or a background thread otherwise.
+    """
+    if not metadata_enabled():
+        return
+
+    if celery_enabled('GLITTER_VIDEO_CELERY'):
+        from .tasks import fetch_video_metadata_task
+
+        on_commit(lambda: fetch_video_metadata_task.delay(provider=provider, video_id=video_id))
+    else:
+        on_commit(lambda: run_in_background('video', fetch_metadata, provider, video_id))
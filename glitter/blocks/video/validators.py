@@ -2,6 +2,8 @@ import re
 
 from django.core.exceptions import ValidationError
 
+from . import choices as video_choices
+
 
 YOUTUBE_URL_RE = r"""
     (?x)^
@@ -42,7 +44,31 @@ VIMEO_URL_RE = r"""
 """
 
 
+YOUTUBE_URL_PATTERN = re.compile(YOUTUBE_URL_RE)
+VIMEO_URL_PATTERN = re.compile(VIMEO_URL_RE)
+
+
+def parse_video_url(url):
+    """
+    Return the provider and video ID for a YouTube or Vimeo URL, or ``(None, None)`` for anything
+    else.
+    """
+    match = VIMEO_URL_PATTERN.match(url)
+
+    if match:
+        return video_choices.PROVIDER_VIMEO, match.group('id')
+
+    match = YOUTUBE_URL_PATTERN.match(url)
+
+    if match:
+        return video_choices.PROVIDER_YOUTUBE, match.group(2)
+
+    return None, None
+
+
 def validate_url(value):
     """ Validate url. """
-    if not re.match(VIMEO_URL_RE, value) and not re.match(YOUTUBE_URL_RE, value):
+    provider, video_id = parse_video_url(value)
+
+    if provider is None:
         raise ValidationError('Invalid URL - only Youtube, Vimeo can be used.')
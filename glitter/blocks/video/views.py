@@ -0,0 +1,21 @@
+from django.template.loader import render_to_string
+
+from .utils import metadata_enabled
+
+
+def video_view(block, request, rerender, content_block, block_classes):
+    css_classes = ' '.join(block_classes)
+    metadata = None
+
+    # Metadata is only ever read here, anything missing is fetched in the background after saving
+    if block and block.provider and metadata_enabled():
+        metadata = block.get_metadata()
+
+    template_name = 'glitter/blocks/%s.html' % content_block.content_type.model
+    context = {
+        'content_block': content_block,
+        'css_classes': css_classes,
+        'object': block,
+        'metadata': metadata}
+    rendered = render_to_string(template_name, context, request=request)
+    return rendered
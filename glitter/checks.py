@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.core.checks import Error, Warning, register
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+
+from .templates import templates
+
+
+@register('templates')
+def check_layout_templates(app_configs, **kwargs):
+    """
+    Check the template for every registered layout can be found by the template loaders.
+    """
+    errors = []
+
+    for template_name, template in sorted(templates.items()):
+        try:
+            get_template(template_name)
+        except TemplateDoesNotExist:
+            errors.append(Error(
+                'Template %s for layout %s does not exist.' % (
+                    template_name, template.layout.__name__,
+                ),
+                hint='Add the template, or change the template for the layout.',
+                obj=template.layout,
+                id='glitter.E001',
+            ))
+
+    default_template = getattr(settings, 'GLITTER_DEFAULT_TEMPLATE', None)
+
+    if default_template is not None and default_template not in templates:
+        errors.append(Warning(
+            'GLITTER_DEFAULT_TEMPLATE %s is not a registered layout template.' % (
+                default_template,
+            ),
+            id='glitter.W001',
+        ))
+
+    return errors
@@ -0,0 +1,197 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from threading import Lock
+
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+from django.utils import translation
+
+from . import instrumentation
+
+
+logger = logging.getLogger('glitter.concurrency')
+
+
+# Sensible defaults if no other settings are provided
+GLITTER_CONCURRENT_RENDER_WORKERS = 4
+GLITTER_CONCURRENT_RENDER_TIMEOUT = 5
+
+_executor = None
+_executor_lock = Lock()
+
+# Blocks which were given up on while still running, each holding on to a worker
+_abandoned = set()
+
+# Named thread pools for work done in the background, outside of rendering
+_background_executors = {}
+
+
+def concurrent_render_enabled():
+    """
+    Return a boolean if blocks marked with ``concurrent_render`` can be rendered in a thread pool.
+    """
+    return getattr(settings, 'GLITTER_CONCURRENT_RENDER', False)
+
+
+def get_render_timeout():
+    """
+    Return the number of seconds to wait for a concurrently rendered block.
+    """
+    return getattr(
+        settings, 'GLITTER_CONCURRENT_RENDER_TIMEOUT', GLITTER_CONCURRENT_RENDER_TIMEOUT
+    )
+
+
+def get_max_workers():
+    return getattr(
+        settings, 'GLITTER_CONCURRENT_RENDER_WORKERS', GLITTER_CONCURRENT_RENDER_WORKERS
+    )
+
+
+def get_executor():
+    """
+    Return the shared thread pool used for rendering blocks, creating it on first use.
+
+    The pool is bounded by the ``GLITTER_CONCURRENT_RENDER_WORKERS`` setting, and is shared by all
+    requests in the process.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=get_max_workers())
+
+    return _executor
+
+
+def _call_in_thread(language, query_counters, func, *args, **kwargs):
+    # Worker threads keep their database connections between blocks, in the same way they're
+    # kept between requests - anything past CONN_MAX_AGE or unusable is closed.
+    close_old_connections()
+
+    try:
+        with translation.override(language), instrumentation.count_queries(*query_counters):
+            return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+def submit(func, *args, **kwargs):
+    """
+    Submit a function to the render thread pool, returning a future for the result.
+
+    The function is called with the language active in the calling thread, and any queries it
+    makes are counted towards the render timings of the calling thread.
+    """
+    return get_executor().submit(
+        _call_in_thread, translation.get_language(), instrumentation.get_query_counters(),
+        func, *args, **kwargs
+    )
+
+
+def run_in_executor(loop, func, *args):
+    """
+    Run a function in the render thread pool from an event loop, returning an awaitable.
+
+    Cancelling the awaitable, such as when it times out, abandons the function in the same way as
+    a block which timed out in a regular render.
+    """
+    future = submit(func, *args)
+    wrapped = asyncio.wrap_future(future, loop=loop)
+
+    def cancelled(wrapped):
+        if wrapped.cancelled():
+            abandon(future)
+
+    wrapped.add_done_callback(cancelled)
+    return wrapped
+
+
+def abandon(future):
+    """
+    Stop waiting for a block which has taken too long.
+
+    A block which has already started can't be stopped, and holds on to its worker until it
+    finishes. Once every worker is held by an abandoned block, the pool is replaced so other pages
+    aren't stuck behind them - the old threads finish in their own time.
+    """
+    global _executor
+
+    if future.cancel():
+        return
+
+    with _executor_lock:
+        _abandoned.add(future)
+        future.add_done_callback(_abandoned.discard)
+
+        if _executor is not None and len(_abandoned) >= get_max_workers():
+            logger.warning(
+                'All %d block render workers are busy with blocks which timed out, replacing '
+                'the thread pool', len(_abandoned),
+            )
+            _executor.shutdown(wait=False)
+            _executor = None
+            _abandoned.clear()
+
+
+def celery_enabled(setting_name):
+    """
+    Return a boolean if Celery tasks are enabled for an app.
+
+    If the app's setting (such as ``GLITTER_FORM_CELERY``) is ``True`` or ``False`` - then that
+    value will be used. However if the setting isn't defined, then this will be enabled
+    automatically if Celery is installed.
+    """
+    enabled = getattr(settings, setting_name, None)
+
+    if enabled is None:
+        try:
+            import celery  # noqa
+            enabled = True
+        except ImportError:
+            enabled = False
+
+    return enabled
+
+
+def on_commit(func):
+    """
+    Call a function once the current transaction has been committed.
+    """
+    # Django 1.8 doesn't have on_commit hooks, so call straight away
+    if hasattr(transaction, 'on_commit'):
+        transaction.on_commit(func)
+    else:
+        func()
+
+
+def get_background_executor(name, max_workers=1):
+    """
+    Return a named thread pool used for work in the background, creating it on first use.
+    """
+    with _executor_lock:
+        if name not in _background_executors:
+            _background_executors[name] = ThreadPoolExecutor(max_workers=max_workers)
+
+    return _background_executors[name]
+
+
+def _call_in_background(func, *args, **kwargs):
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        logger.exception('Unable to run %s in the background', func.__name__)
+    finally:
+        # Background threads can sit idle for a long time, don't leave connections hanging around
+        connections.close_all()
+
+
+def run_in_background(name, func, *args, **kwargs):
+    """
+    Call a function in a named background thread pool, returning a future for the result.
+
+    Any exception is logged rather than raised, and the thread's database connections are closed
+    once the function has finished.
+    """
+    return get_background_executor(name).submit(_call_in_background, func, *args, **kwargs)
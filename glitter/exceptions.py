@@ -12,3 +12,12 @@ class GlitterUnpublishedException(Exception):
 
     def __str__(self):
         return '%s is not published' % (self.obj,)
+
+
+class GlitterTemplateNotRegistered(KeyError):
+    def __init__(self, template_name):
+        super().__init__(template_name)
+        self.template_name = template_name
+
+    def __str__(self):
+        return 'No layout is registered for template %s' % (self.template_name,)
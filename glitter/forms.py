@@ -44,7 +44,7 @@ class BaseNewPageTemplateForm(forms.ModelForm):
 
 
 def get_newpagetemplateform(model):
-    template_choices = sorted(get_templates(model=model), key=lambda x: x[1])
+    template_choices = get_templates(model=model)
     initial_template = getattr(settings, 'GLITTER_DEFAULT_TEMPLATE', None)
 
     class NewPageTemplateForm(BaseNewPageTemplateForm):
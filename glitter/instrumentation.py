@@ -0,0 +1,332 @@
+from collections import namedtuple
+from contextlib import contextmanager
+import logging
+import socket
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+from django.utils.module_loading import import_string
+
+
+logger = logging.getLogger('glitter.render')
+
+Timing = namedtuple('Timing', ['kind', 'name', 'duration', 'queries'])
+
+# Query counters active in each thread
+_local = threading.local()
+
+
+class QueryCounter(object):
+    """
+    Number of queries made for a block, column or page, which can be added to from any thread.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def increment(self):
+        with self.lock:
+            self.count += 1
+
+
+class QueryCountingCursor(object):
+    """
+    Wraps a database cursor to count each query with the counters active in the current thread.
+    """
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def __getattr__(self, attr):
+        return getattr(self.cursor, attr)
+
+    def __iter__(self):
+        return iter(self.cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self.cursor.__exit__(exc_type, exc_value, traceback)
+
+    def count_query(self):
+        for counter in set(get_query_counters()):
+            counter.increment()
+
+    def callproc(self, *args, **kwargs):
+        self.count_query()
+        return self.cursor.callproc(*args, **kwargs)
+
+    def execute(self, *args, **kwargs):
+        self.count_query()
+        return self.cursor.execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        self.count_query()
+        return self.cursor.executemany(*args, **kwargs)
+
+
+def wrap_cursor(connection):
+    """
+    Wrap cursors from a database connection with ``QueryCountingCursor``, if they aren't already.
+    """
+    if getattr(connection, 'glitter_count_queries', False):
+        return
+
+    cursor = connection.cursor
+
+    def counting_cursor(*args, **kwargs):
+        return QueryCountingCursor(cursor(*args, **kwargs))
+
+    connection.cursor = counting_cursor
+    connection.glitter_count_queries = True
+
+
+def get_query_counters():
+    """
+    Return the query counters active in the current thread.
+    """
+    return getattr(_local, 'counters', ())
+
+
+@contextmanager
+def count_queries(*counters):
+    """
+    Count queries made in the current thread, on any database connection, with each counter.
+
+    Counters are added and removed individually, so blocks rendered at the same time from an event
+    loop don't replace each other's counters.
+    """
+    if not counters:
+        yield
+        return
+
+    # Each thread has its own connections, which are wrapped the first time queries are counted
+    for connection in connections.all():
+        wrap_cursor(connection)
+
+    _local.counters = get_query_counters() + counters
+
+    try:
+        yield
+    finally:
+        remaining = list(get_query_counters())
+
+        for counter in counters:
+            remaining.remove(counter)
+
+        _local.counters = tuple(remaining)
+
+
+class NullTimer(object):
+    """
+    Timer used when instrumentation is disabled, which does as little as possible.
+    """
+
+    def measure(self, kind, obj):
+        # Acts as its own context manager to avoid creating anything new for each measurement
+        return self
+
+    def count_queries(self, *objs):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def start(self):
+        pass
+
+    def add_timing(self, kind, obj, duration):
+        pass
+
+    def record(self, request):
+        pass
+
+    def process_response(self, request, response):
+        pass
+
+
+class RenderTimer(object):
+    """
+    Collects timings and query counts for a page render, and passes them on to each sink.
+
+    Queries are counted with a wrapper around each database cursor. Queries made by blocks in the
+    render thread pool count towards the block, column and page which sent them there.
+    """
+
+    def __init__(self, sinks):
+        self.sinks = sinks
+        self.timings = []
+        self.counters = {}
+
+    def get_counter(self, obj):
+        if obj not in self.counters:
+            self.counters[obj] = QueryCounter()
+
+        return self.counters[obj]
+
+    def count_queries(self, *objs):
+        """
+        Count queries made in the current thread towards each object, without timing anything.
+        """
+        return count_queries(*[self.get_counter(obj) for obj in objs])
+
+    @contextmanager
+    def measure(self, kind, obj):
+        start = time.perf_counter()
+
+        try:
+            with self.count_queries(obj):
+                yield
+        finally:
+            self.add_timing(kind, obj, time.perf_counter() - start)
+
+    def add_timing(self, kind, obj, duration):
+        """
+        Add a timing measured by the caller, with all of the queries counted for the object.
+        """
+        self.timings.append(Timing(
+            kind=kind, name=get_timing_name(kind, obj), duration=duration,
+            queries=self.get_counter(obj).count,
+        ))
+
+    def start(self):
+        """
+        Start collecting timings for a new render.
+        """
+        self.timings = []
+        self.counters = {}
+
+    def record(self, request):
+        """
+        Send the collected timings to each sink once a page has been rendered.
+        """
+        for sink in self.sinks:
+            sink.record(request=request, timings=self.timings)
+
+    def process_response(self, request, response):
+        """
+        Allow each sink to add the collected timings to the response.
+        """
+        for sink in self.sinks:
+            sink.process_response(request=request, response=response, timings=self.timings)
+
+
+def get_timing_name(kind, obj):
+    if kind == 'block':
+        return '{}.{}.{}'.format(obj.column.name, obj.block_number, obj.block._meta.label_lower)
+    elif kind == 'column':
+        return obj.name
+    else:
+        return obj.version.template_name
+
+
+def get_timer():
+    """
+    Return a timer for rendering a page, which will be a no-op timer unless any sinks are set
+    with the ``GLITTER_RENDER_INSTRUMENTATION`` setting.
+    """
+    sink_paths = getattr(settings, 'GLITTER_RENDER_INSTRUMENTATION', None)
+
+    if not sink_paths:
+        return NullTimer()
+
+    return RenderTimer(sinks=[import_string(sink_path)() for sink_path in sink_paths])
+
+
+class BaseSink(object):
+    """
+    Base class for anything which wants to receive render timings.
+    """
+
+    def record(self, request, timings):
+        pass
+
+    def process_response(self, request, response, timings):
+        pass
+
+
+class LoggingSink(BaseSink):
+    """
+    Logs each timing to the ``glitter.render`` logger.
+    """
+
+    def record(self, request, timings):
+        for timing in timings:
+            logger.info(
+                '%s %s %.2fms %d queries',
+                timing.kind, timing.name, timing.duration * 1000, timing.queries,
+            )
+
+
+class StatsdSink(BaseSink):
+    """
+    Sends timings to a statsd compatible listener over UDP.
+
+    Uses the ``GLITTER_STATSD_HOST``, ``GLITTER_STATSD_PORT`` and ``GLITTER_STATSD_PREFIX``
+    settings, defaulting to a listener on ``localhost:8125``.
+    """
+
+    def __init__(self):
+        self.host = getattr(settings, 'GLITTER_STATSD_HOST', 'localhost')
+        self.port = getattr(settings, 'GLITTER_STATSD_PORT', 8125)
+        self.prefix = getattr(settings, 'GLITTER_STATSD_PREFIX', 'glitter.render')
+
+    def record(self, request, timings):
+        metrics = []
+
+        for timing in timings:
+            if timing.kind == 'block':
+                # Individual block positions would be too many metrics, group by block type
+                name = timing.name.rsplit('.', 2)[-2:]
+                name = '.'.join(name)
+            else:
+                name = timing.name.replace('.', '_').replace('/', '_')
+
+            metric = '{}.{}.{}'.format(self.prefix, timing.kind, name)
+            metrics.append('{}:{:.3f}|ms'.format(metric, timing.duration * 1000))
+            # Sent as a timer rather than a counter, so statsd keeps the mean and percentiles
+            # for each render instead of adding the counts together
+            metrics.append('{}.queries:{}|ms'.format(metric, timing.queries))
+
+        self.send(metrics)
+
+    def send(self, metrics):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+        try:
+            sock.sendto('\n'.join(metrics).encode(), (self.host, self.port))
+        except OSError:
+            # Metrics are a best effort, never break a page because of them
+            pass
+        finally:
+            sock.close()
+
+
+class ServerTimingSink(BaseSink):
+    """
+    Adds a ``Server-Timing`` header to responses for staff users, for viewing in browser developer
+    tools.
+    """
+
+    def process_response(self, request, response, timings):
+        user = getattr(request, 'user', None)
+
+        if user is None or not user.is_staff:
+            return
+
+        metrics = []
+
+        for number, timing in enumerate(timings):
+            metrics.append('glitter-{}-{};dur={:.2f};desc="{} {} ({} queries)"'.format(
+                timing.kind, number, timing.duration * 1000, timing.kind, timing.name,
+                timing.queries,
+            ))
+
+        response['Server-Timing'] = ', '.join(metrics)
@@ -1,5 +1,8 @@
-from django.conf import settings
 from importlib import import_module
+from types import MappingProxyType
+
+from django.apps import apps
+from django.utils.module_loading import module_has_submodule
 
 
 class GlitterApp(object):
@@ -19,10 +22,10 @@ class GlitterAppPool(object):
     """
     An interface to the Glitter App configs in the current project.
 
-    Will lazily discover Glitter App configs when needed.
+    Glitter App configs are discovered once all apps are ready, or when first needed.
     """
     def __init__(self):
-        self.glitter_apps = {}
+        self.glitter_apps = MappingProxyType({})
         self.discovered = False
 
     def get_glitter_app(self, glitter_app_name):
@@ -41,16 +44,21 @@ class GlitterAppPool(object):
     def discover_glitter_apps(self):
         """
         Find all the Glitter App configurations in the current project.
+
+        Only apps with a ``glitter_apps`` module are imported, so any errors in those modules
+        aren't hidden.
         """
-        for app_name in settings.INSTALLED_APPS:
-            module_name = '{app_name}.glitter_apps'.format(app_name=app_name)
-            try:
+        glitter_apps = {}
+
+        for app_config in apps.get_app_configs():
+            if module_has_submodule(app_config.module, 'glitter_apps'):
+                module_name = '{app_name}.glitter_apps'.format(app_name=app_config.name)
                 glitter_apps_module = import_module(module_name)
+
                 if hasattr(glitter_apps_module, 'apps'):
-                    self.glitter_apps.update(glitter_apps_module.apps)
-            except ImportError:
-                pass
+                    glitter_apps.update(glitter_apps_module.apps)
 
+        self.glitter_apps = MappingProxyType(glitter_apps)
         self.discovered = True
 
     def get_glitter_apps(self):
@@ -0,0 +1,56 @@
+import json
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from glitter.benchmark import (
+    DEFAULT_ACTION_COUNT, DEFAULT_BLOCK_COUNTS, DEFAULT_TREE_DEPTH, DEFAULT_VERSION_COUNT,
+    benchmark_startup, run_benchmarks,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark rendering, editing and publishing Glitter pages in a test database, and '
+        'starting up Django'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--blocks', type=int, nargs='+', default=DEFAULT_BLOCK_COUNTS,
+            help='Number of blocks on each benchmarked page',
+        )
+        parser.add_argument('--tree-depth', type=int, default=DEFAULT_TREE_DEPTH)
+        parser.add_argument('--versions', type=int, default=DEFAULT_VERSION_COUNT)
+        parser.add_argument('--actions', type=int, default=DEFAULT_ACTION_COUNT)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--output', help='Write JSON results to a file instead of stdout')
+
+    def handle(self, **options):
+        # Never touch the real database, benchmarks get a fresh test database of their own
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+
+        try:
+            results = run_benchmarks(
+                block_counts=options['blocks'],
+                tree_depth=options['tree_depth'],
+                version_count=options['versions'],
+                action_count=options['actions'],
+                repeat=options['repeat'],
+            )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        results.append(benchmark_startup(options['repeat']))
+
+        output = json.dumps(results, indent=2, sort_keys=True)
+
+        if options['output']:
+            with open(options['output'], 'w') as output_file:
+                output_file.write(output)
+        else:
+            self.stdout.write(output)
@@ -89,5 +89,18 @@ class BaseBlock(models.Model):
     # Override if more complex view logic is needed
     render_function = 'glitter.block_views.baseblock'
 
+    # Set for blocks which spend most of their time waiting on external services, these can be
+    # rendered in a thread pool when GLITTER_CONCURRENT_RENDER is enabled
+    concurrent_render = False
+
+    # Set for blocks which can change without a new version being published (such as blocks showing
+    # assets or other models which are edited separately, or anything specific to a request),
+    # pages with these blocks won't get an ETag
+    volatile = False
+
+    # Set to False for blocks which change the session or messages while rendering, these are
+    # rendered before a streamed page is sent so the changes aren't lost
+    stream_render = True
+
     class Meta:
         abstract = True
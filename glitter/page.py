@@ -1,23 +1,35 @@
-from collections import OrderedDict, defaultdict
+import asyncio
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import TimeoutError
 from importlib import import_module
+import logging
+import re
+import time
 
 from django.apps import apps
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.signals import got_request_exception
 from django.core.urlresolvers import get_mod_func, reverse
 from django.db.models import Q
 from django.forms.widgets import Select
 from django.template.defaultfilters import slugify
 from django.template.loader import render_to_string
+from django.utils.crypto import get_random_string
 from django.utils.encoding import force_text
 from django.utils.functional import cached_property
 from django.utils.http import urlencode
+from django.utils.safestring import mark_safe
 from django.utils.text import capfirst
 
+from . import concurrency, instrumentation
 from .models import Version
 from .templates import get_layout, get_templates
 from .widgets import AddBlockSelect, ChooseColumnSelect, MoveBlockSelect
 
+
+logger = logging.getLogger('glitter.page')
+
 # If no other settings are provided, show text/image/HTML blocks
 GLITTER_FALLBACK_BLOCKS = (
     'glitter_redactor.Redactor',
@@ -25,6 +37,9 @@ GLITTER_FALLBACK_BLOCKS = (
     'glitter_html.HTML',
 )
 
+COLUMN_PLACEHOLDER = '<!--glitter-column:{column}:{key}-->'
+COLUMN_PLACEHOLDER_RE = r'<!--glitter-column:(\w+):{key}-->'
+
 
 class GlitterBlock(object):
     def __init__(self, content_block, column, block_number):
@@ -33,19 +48,147 @@ class GlitterBlock(object):
         self.column = column
         self.glitter_page = column.glitter_page
         self.block_number = block_number
+        self.future = None
+        self.deadline = None
+        self.rendered = False
+
+    def get_block_view(self):
+        mod_name, func_name = get_mod_func(self.block.render_function)
+        return getattr(import_module(mod_name), func_name)
+
+    def render(self, rerender, catch_errors=False):
+        # Blocks which can't be streamed are rendered before the rest of the page
+        if self.rendered:
+            return
+
+        with self.glitter_page.timer.measure('block', self):
+            try:
+                self.render_block(rerender)
+            except Exception:
+                if not catch_errors:
+                    raise
+
+                # Part of the page has already been sent, so it's too late for an error page
+                logger.exception('Unable to render block %s', self.content_block.id)
+                got_request_exception.send(
+                    sender=self.__class__, request=self.glitter_page.request
+                )
+                self.html = render_to_string('glitter/include/block_error.html', {
+                    'content_block': self.content_block,
+                    'css_classes': ' '.join(self.css_classes()),
+                    'object': self.block,
+                })
+
+        self.rendered = True
+
+    def render_block(self, rerender):
+        # Block already sent off to the thread pool, just wait for it
+        if self.future is not None:
+            self.join()
+            return
 
-    def render(self, rerender):
         # Add some classes to the block to help style it
         block_classes = self.css_classes()
 
         # Render the block
-        mod_name, func_name = get_mod_func(self.block.render_function)
-        block_view = getattr(import_module(mod_name), func_name)
+        block_view = self.get_block_view()
 
         self.html = block_view(
             self.block, self.glitter_page.request, rerender, self.content_block, block_classes
         )
 
+        # Native coroutine block views need an event loop of their own in the sync path
+        if asyncio.iscoroutine(self.html):
+            loop = asyncio.new_event_loop()
+            try:
+                self.html = loop.run_until_complete(self.html)
+            finally:
+                loop.close()
+
+    async def arender(self, rerender, loop=None):
+        """
+        Render the block from an event loop.
+
+        Coroutine block views are awaited directly, and regular block views are run in the render
+        thread pool so they never block the loop. Blocks which take longer than
+        ``GLITTER_CONCURRENT_RENDER_TIMEOUT`` are replaced with a placeholder.
+        """
+        timer = self.glitter_page.timer
+        start = time.perf_counter()
+
+        block_classes = self.css_classes()
+        block_view = self.get_block_view()
+        block_args = (
+            self.block, self.glitter_page.request, rerender, self.content_block, block_classes
+        )
+
+        # Other blocks are rendered while this one is waiting, so queries are only counted
+        # towards this block in the thread pool
+        with timer.count_queries(self.glitter_page, self.column, self):
+            if asyncio.iscoroutinefunction(block_view):
+                render = block_view(*block_args)
+            else:
+                render = concurrency.run_in_executor(loop, block_view, *block_args)
+
+        try:
+            self.html = await asyncio.wait_for(
+                render, timeout=concurrency.get_render_timeout(), loop=loop
+            )
+        except asyncio.TimeoutError:
+            self.html = self.render_timeout()
+
+        timer.add_timing('block', self, time.perf_counter() - start)
+        self.rendered = True
+
+    def can_render_concurrently(self):
+        """
+        Return a boolean if this block can be rendered in the background thread pool.
+
+        Only blocks which are marked as I/O bound with ``concurrent_render`` are sent to the pool,
+        everything else is rendered in the request thread.
+        """
+        return getattr(self.block, 'concurrent_render', False)
+
+    def dispatch(self, rerender):
+        """
+        Start rendering this block in the background thread pool.
+
+        The result is collected when the column is rendered.
+        """
+        block_classes = self.css_classes()
+        block_view = self.get_block_view()
+
+        self.deadline = time.monotonic() + concurrency.get_render_timeout()
+
+        # Queries made in the thread pool count towards this block, its column and the page
+        with self.glitter_page.timer.count_queries(self.glitter_page, self.column, self):
+            self.future = concurrency.submit(
+                block_view,
+                self.block, self.glitter_page.request, rerender, self.content_block, block_classes
+            )
+
+    def join(self):
+        """
+        Wait for a concurrently rendered block, using a placeholder if it takes too long.
+        """
+        timeout = max(self.deadline - time.monotonic(), 0)
+
+        try:
+            self.html = self.future.result(timeout=timeout)
+        except TimeoutError:
+            concurrency.abandon(self.future)
+            self.html = self.render_timeout()
+
+    def render_timeout(self):
+        """
+        Return a placeholder for a block which took too long to render.
+        """
+        return render_to_string('glitter/include/block_timeout.html', {
+            'content_block': self.content_block,
+            'css_classes': ' '.join(self.css_classes()),
+            'object': self.block,
+        })
+
     def css_classes(self):
         # Add some classes to the block to help style it
 
@@ -120,11 +263,18 @@ class GlitterColumn(object):
             block = GlitterBlock(content_block, self, block_num)
             self.blocks.append(block)
 
-    def render(self, edit_mode=False, rerender=False):
-        # Render all the blocks
-        for block in self.blocks:
-            block.render(rerender)
+    def render(self, edit_mode=False, rerender=False, catch_errors=False):
+        with self.glitter_page.timer.measure('column', self):
+            # Render all the blocks
+            for block in self.blocks:
+                block.render(rerender, catch_errors=catch_errors)
 
+            return self.render_column(edit_mode=edit_mode)
+
+    def render_column(self, edit_mode=False):
+        """
+        Render the column structure around blocks which have already been rendered.
+        """
         # Column structure
         column_template = 'glitter/include/column.html'
         column_context = {
@@ -226,6 +376,7 @@ class Glitter(object):
 
     saved_pages = None
     unsaved_pages = None
+    stream_columns = None
 
     def __init__(self, page_version, request=None):
         self.version = page_version
@@ -233,6 +384,7 @@ class Glitter(object):
         self.content_type = ContentType.objects.get_for_model(self.obj)
         self.opts = self.obj._meta
         self.request = request
+        self.timer = instrumentation.get_timer()
 
         if request is None:
             self.user = None
@@ -261,8 +413,11 @@ class Glitter(object):
             if content_block.content_object is not None:
                 self.column_blocks[content_block.column].append(content_block)
 
-    def render(self, edit_mode=False, rerender=False):
-        columns = OrderedDict()
+    def get_columns(self):
+        """
+        Return a list of columns for the layout, containing the blocks for this version.
+        """
+        glitter_columns = []
 
         for column_name in self.layout._meta.columns:
             verbose_name = self.layout.get_column_name(column_name)
@@ -273,10 +428,144 @@ class Glitter(object):
                 glitter_page=self,
                 content_blocks=self.column_blocks[column_name]
             )
-            columns[column_name] = column.render(edit_mode=edit_mode, rerender=rerender)
+            glitter_columns.append(column)
+
+        return glitter_columns
+
+    def dispatch_blocks(self, glitter_columns, rerender=False):
+        """
+        Send slow blocks off to be rendered in the background first, so the page only waits as
+        long as the slowest of them.
+        """
+        if concurrency.concurrent_render_enabled():
+            for column in glitter_columns:
+                for block in column.blocks:
+                    if block.can_render_concurrently():
+                        block.dispatch(rerender)
+
+    def render(self, edit_mode=False, rerender=False):
+        columns = OrderedDict()
+        self.timer.start()
+
+        with self.timer.measure('page', self):
+            glitter_columns = self.get_columns()
+
+            self.dispatch_blocks(glitter_columns, rerender=rerender)
+
+            for column in glitter_columns:
+                columns[column.name] = column.render(edit_mode=edit_mode, rerender=rerender)
+
+        self.timer.record(self.request)
 
         return columns
 
+    async def arender(self, edit_mode=False, rerender=False, loop=None):
+        """
+        Render the page from an event loop, with all blocks rendered concurrently.
+
+        Blocks are loaded when the page object is created, so this only covers block rendering.
+        """
+        columns = OrderedDict()
+        self.timer.start()
+        start = time.perf_counter()
+
+        with self.timer.count_queries(self):
+            glitter_columns = self.get_columns()
+
+        await asyncio.gather(*[
+            block.arender(rerender, loop=loop)
+            for column in glitter_columns for block in column.blocks
+        ], loop=loop)
+
+        with self.timer.count_queries(self):
+            for column in glitter_columns:
+                with self.timer.measure('column', column):
+                    columns[column.name] = column.render_column(edit_mode=edit_mode)
+
+        self.timer.add_timing('page', self, time.perf_counter() - start)
+        self.timer.record(self.request)
+
+        return columns
+
+    def column_placeholders(self):
+        """
+        Return placeholders for each column, to be used in place of rendered columns in a template.
+
+        The rendered template can then be given to ``stream`` which renders each column as it's
+        reached.
+        """
+        self.placeholder_key = get_random_string(length=12)
+        columns = OrderedDict()
+
+        for column_name in self.layout._meta.columns:
+            columns[column_name] = mark_safe(COLUMN_PLACEHOLDER.format(
+                column=column_name, key=self.placeholder_key,
+            ))
+
+        return columns
+
+    def prepare_stream(self, rerender=False):
+        """
+        Get ready to stream the page, before anything has been sent.
+
+        Slow blocks are sent off to be rendered in the background, and blocks which can't be
+        streamed are rendered straight away - while the request is still going through
+        middleware, so any changes they make to the session or messages are saved.
+        """
+        self.timer.start()
+        self.stream_columns = self.get_columns()
+        self.dispatch_blocks(self.stream_columns, rerender=rerender)
+
+        for column in self.stream_columns:
+            for block in column.blocks:
+                if not getattr(block.block, 'stream_render', True):
+                    block.render(rerender)
+
+    def stream(self, rendered, edit_mode=False, rerender=False):
+        """
+        Generator which yields a template rendered with ``column_placeholders`` in chunks, with
+        each column only rendered once everything before it has been sent.
+
+        Blocks which raise an exception are logged and replaced with a placeholder, as the status
+        code has already been sent.
+        """
+        if self.stream_columns is None:
+            self.prepare_stream(rerender=rerender)
+
+        glitter_columns = {column.name: column for column in self.stream_columns}
+
+        placeholder_re = re.compile(COLUMN_PLACEHOLDER_RE.format(key=self.placeholder_key))
+
+        # Columns used more than once in a template are kept around, everything else can be
+        # thrown away as soon as it's sent
+        column_count = Counter(placeholder_re.findall(rendered))
+        rendered_columns = {}
+        position = 0
+
+        for match in placeholder_re.finditer(rendered):
+            column_name = match.group(1)
+
+            yield rendered[position:match.start()]
+
+            if column_name in rendered_columns:
+                yield rendered_columns[column_name]
+            else:
+                column = glitter_columns[column_name].render(
+                    edit_mode=edit_mode, rerender=rerender, catch_errors=True
+                )
+
+                if column_count[column_name] > 1:
+                    rendered_columns[column_name] = column
+
+                yield column
+
+            position = match.end()
+
+        yield rendered[position:]
+
+        # Page timings would include waiting on the client, so only columns and blocks are sent
+        self.timer.record(self.request)
+
     def owner_versions(self):
         # Fiddly queryset which hides unsaved versions of other users
         return Version.objects.select_related('owner').filter(
@@ -305,7 +594,7 @@ class Glitter(object):
             return None
 
     def change_template_widget(self):
-        change_template_options = sorted(get_templates(self.obj.__class__), key=lambda x: x[1])
+        change_template_options = get_templates(self.obj.__class__)
 
         widget = Select(attrs={
             'id': 'id_template_name',
@@ -0,0 +1,112 @@
+from collections import namedtuple
+from types import MappingProxyType
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.crypto import get_random_string
+
+from glitter.concurrency import on_commit
+
+
+PAGE_URLS_VERSION_KEY = 'glitter_pages_page_urls_version'
+APP_URLS_VERSION_KEY = 'glitter_pages_app_urls_version'
+
+PageLink = namedtuple('PageLink', ['url', 'title'])
+
+# Page URLs and links for this process, along with the cache version they were loaded for
+_page_urls = (None, frozenset(), MappingProxyType({}))
+
+
+def url_cache_enabled():
+    """
+    Return a boolean if the page URL cache can be used to skip page lookups.
+    """
+    return getattr(settings, 'GLITTER_PAGE_URL_CACHE', False)
+
+
+def get_version(key):
+    """
+    Return the current version number for something kept in memory by each process, which is
+    changed in the shared cache when every process needs to reload it.
+    """
+    version = cache.get(key)
+
+    if version is None:
+        version = get_random_string(length=12)
+        cache.set(key, version, None)
+
+    return version
+
+
+def load_page_urls():
+    """
+    Return a set of all page URLs, and a dict of page IDs to the URL and title of each page.
+
+    The URLs are kept in memory for each process, with a version number in the shared cache used to
+    find out when they need reloading.
+    """
+    global _page_urls
+
+    # Imported here as it causes migrations for pages if app is not installed apps.
+    from .models import Page
+
+    version = get_version(PAGE_URLS_VERSION_KEY)
+
+    if _page_urls[0] != version:
+        links = {
+            page_id: PageLink(url=url, title=title)
+            for page_id, url, title in Page.objects.values_list('id', 'url', 'title')
+        }
+        _page_urls = (
+            version,
+            frozenset(link.url for link in links.values()),
+            MappingProxyType(links),
+        )
+
+    return _page_urls[1:]
+
+
+def get_page_urls():
+    """
+    Return a set of all page URLs.
+    """
+    return load_page_urls()[0]
+
+
+def get_page_links():
+    """
+    Return a dict of page IDs to the URL and title of each page.
+    """
+    return load_page_urls()[1]
+
+
+def bump_version(key):
+    """
+    Change the version number for something kept in memory by each process, once the current
+    transaction has been committed - otherwise other processes could reload it before the change
+    can be seen, and keep the old data with the new version.
+    """
+    on_commit(lambda: cache.set(key, get_random_string(length=12), None))
+
+
+def clear_page_urls(**kwargs):
+    """
+    Signal handler to reload the page URLs in every process when a page is changed.
+    """
+    bump_version(PAGE_URLS_VERSION_KEY)
+
+
+def get_app_urls_version():
+    """
+    Return the version of the glitter app URL patterns which every process should be using.
+    """
+    return get_version(APP_URLS_VERSION_KEY)
+
+
+def clear_app_urls(instance, **kwargs):
+    """
+    Signal handler to rebuild glitter app URL patterns in every process when a page with a glitter
+    app is changed.
+    """
+    if instance.glitter_app_name or getattr(instance, '_loaded_glitter_app_name', ''):
+        bump_version(APP_URLS_VERSION_KEY)
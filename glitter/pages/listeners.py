@@ -1,5 +1,6 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 
+from .cache import clear_app_urls, clear_page_urls
 from .models import Page
 
 
@@ -16,3 +17,10 @@ def version_update(instance, raw=False, **kwargs):
 
 
 post_save.connect(version_update, sender='glitter.Version')
+
+
+post_save.connect(clear_page_urls, sender=Page)
+post_delete.connect(clear_page_urls, sender=Page)
+
+post_save.connect(clear_app_urls, sender=Page)
+post_delete.connect(clear_app_urls, sender=Page)
@@ -1,11 +1,8 @@
-import importlib
-from threading import Lock
-import sys
-
+from django.conf import settings
 from django.http import Http404, HttpResponseRedirect
 
 from glitter.exceptions import GlitterRedirectException, GlitterUnpublishedException
-from glitter.pages.models import Page
+from glitter.pages.cache import get_page_urls, url_cache_enabled
 
 
 class PageFallbackMiddleware(object):
@@ -17,6 +14,10 @@ class PageFallbackMiddleware(object):
         if response.status_code != 404:
             return response  # No need to check for a page for non-404 responses.
 
+        # Avoid any queries for URLs which can't possibly be a page
+        if url_cache_enabled() and not self.is_page_url(request.path_info):
+            return response
+
         try:
             return glitter(request=request, url=request.path_info)
         except Http404:
@@ -29,27 +30,29 @@ class PageFallbackMiddleware(object):
 
         return None
 
+    def is_page_url(self, url):
+        """
+        Return a boolean if a page exists for the URL, or a page which it'd be redirected to.
+        """
+        page_urls = get_page_urls()
+
+        if url in page_urls:
+            return True
 
-_urlconf_pages = []
-_urlconf_lock = Lock()
+        return not url.endswith('/') and settings.APPEND_SLASH and url + '/' in page_urls
 
 
 class GlitterUrlConfMiddleware(object):
     def process_request(self, request):
         """
-        Reloads glitter URL patterns if page URLs change.
+        Reloads glitter URL patterns if glitter app pages change.
 
-        Avoids having to restart the server to recreate the glitter URLs being used by Django.
+        Avoids having to restart the server to recreate the glitter URLs being used by Django. Only
+        a version number in the shared cache is checked for each request, the URL patterns are
+        rebuilt from the database when they're next used.
         """
-        global _urlconf_pages
-
-        page_list = list(
-            Page.objects.exclude(glitter_app_name='').values_list('id', 'url').order_by('id')
-        )
-
-        with _urlconf_lock:
-            if page_list != _urlconf_pages:
-                glitter_urls = 'glitter.urls'
-                if glitter_urls in sys.modules:
-                    importlib.reload(sys.modules[glitter_urls])
-                _urlconf_pages = page_list
+        # Imported here to avoid loading the URLconf when the middleware is created.
+        from glitter.urls import app_urls_changed, reload_app_urls
+
+        if app_urls_changed():
+            reload_app_urls()
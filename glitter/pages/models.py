@@ -36,6 +36,14 @@ class Page(MPTTModel, GlitterMixin):
     def __str__(self):
         return '%s -- %s' % (self.title, self.url)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+
+        # Keep the original glitter app, so app URLs can be rebuilt if it gets removed
+        instance._loaded_glitter_app_name = instance.__dict__.get('glitter_app_name', '')
+        return instance
+
     class Meta(GlitterMixin.Meta):
         verbose_name = 'page'
         ordering = ('url',)
@@ -61,6 +69,7 @@ class Page(MPTTModel, GlitterMixin):
         self.unpublished_count = unpublished_pages.count()
 
         super().save(*args, **kwargs)
+        self._loaded_glitter_app_name = self.glitter_app_name
 
     @property
     def is_visible(self):
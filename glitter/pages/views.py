@@ -4,6 +4,7 @@ from django.http import Http404, HttpResponsePermanentRedirect
 from django.shortcuts import get_object_or_404
 
 from glitter.views import render_object_unpublished, render_page
+from .cache import get_page_urls, url_cache_enabled
 from .models import Page
 
 
@@ -18,12 +19,23 @@ def glitter(request, url):
     page_opts = Page._meta.app_label, Page._meta.model_name
 
     try:
+        # Skip the lookup if the page URLs are already known
+        if url_cache_enabled() and url not in get_page_urls():
+            raise Http404
+
         page = get_object_or_404(
             Page.objects.select_related('current_version'), url__exact=url)
     except Http404:
         if not url.endswith('/') and settings.APPEND_SLASH:
             url += '/'
-            page = get_object_or_404(Page, url__exact=url)
+
+            # Page URLs might already be known, saving a query
+            if url_cache_enabled():
+                if url not in get_page_urls():
+                    raise
+            else:
+                get_object_or_404(Page, url__exact=url)
+
             return HttpResponsePermanentRedirect('%s/' % request.path)
         else:
             raise
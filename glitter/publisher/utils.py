@@ -1,6 +1,7 @@
-from django.conf import settings
 from django.utils import timezone
 
+from glitter import concurrency
+
 from .models import PublishAction
 
 
@@ -30,19 +31,7 @@ def process_actions(action_ids=None):
 
 def celery_enabled():
     """
-    Return a boolean if Celery tasks are enabled for this app.
-
-    If the ``GLITTER_PUBLISHER_CELERY`` setting is ``True`` or ``False`` - then that value will be
-    used. However if the setting isn't defined, then this will be enabled automatically if Celery
-    is installed.
+    Return a boolean if Celery tasks are enabled for the publisher, using the
+    ``GLITTER_PUBLISHER_CELERY`` setting.
     """
-    enabled = getattr(settings, 'GLITTER_PUBLISHER_CELERY', None)
-
-    if enabled is None:
-        try:
-            import celery  # noqa
-            enabled = True
-        except ImportError:
-            enabled = False
-
-    return enabled
+    return concurrency.celery_enabled('GLITTER_PUBLISHER_CELERY')
@@ -0,0 +1 @@
+default_app_config = 'glitter.reminders.apps.RemindersConfig'
@@ -3,5 +3,9 @@ from django.apps import AppConfig
 
 class RemindersConfig(AppConfig):
     name = 'glitter.reminders'
-    label = 'glitter_reminders'
+    label = 'reminders'
     verbose_name = 'reminders'
+
+    def ready(self):
+        super().ready()
+        from . import listeners  # noqa
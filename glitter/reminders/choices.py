@@ -1,3 +1,6 @@
+from dateutil.relativedelta import relativedelta
+
+
 INTERVAL_2_WEEKS = 1
 INTERVAL_ONE_MONTH = 2
 INTERVAL_THREE_MONTHS = 3
@@ -10,3 +13,11 @@ INTERVAL_CHOICES = (
     (INTERVAL_SIX_MONTHS, 'Every 6 months'),
     (INTERVAL_ONE_YEAR, 'Every year'),
 )
+
+INTERVAL_DELTAS = {
+    INTERVAL_2_WEEKS: relativedelta(weeks=2),
+    INTERVAL_ONE_MONTH: relativedelta(months=1),
+    INTERVAL_THREE_MONTHS: relativedelta(months=3),
+    INTERVAL_SIX_MONTHS: relativedelta(months=6),
+    INTERVAL_ONE_YEAR: relativedelta(years=1),
+}
@@ -0,0 +1,21 @@
+from django.apps import apps
+from django.db.models.signals import post_save
+
+from glitter.mixins import GlitterMixin
+
+from .models import Reminder
+
+
+def object_update(sender, instance, raw=False, **kwargs):
+    # Don't update on loaddata
+    if raw:
+        return
+
+    # Reminders are only due once published content hasn't been changed for a while
+    Reminder.objects.update_next_due(instance)
+
+
+# Only models which can have reminders need to be checked when they're saved
+for model in apps.get_models():
+    if issubclass(model, GlitterMixin):
+        post_save.connect(object_update, sender=model)
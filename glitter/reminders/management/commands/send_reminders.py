@@ -1,6 +1,8 @@
+from collections import OrderedDict
+
 from django.conf import settings
 from django.contrib.sites.models import Site
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
@@ -10,55 +12,108 @@ from glitter.reminders.models import Reminder
 class Command(BaseCommand):
     help = 'Management command to send reminder about out dated content.'
 
-    def handle(self, *args, **options):
+    def get_content_objects(self, reminders):
+        """
+        Return a dict of content objects for reminders, with one query for each content type.
+        """
+        object_ids = {}
+
+        for reminder in reminders:
+            object_ids.setdefault(reminder.content_type, set()).add(reminder.object_id)
+
+        content_objects = {}
+
+        for content_type, ids in object_ids.items():
+            for obj_id, obj in content_type.model_class()._default_manager.in_bulk(ids).items():
+                content_objects[(content_type.id, obj_id)] = obj
+
+        return content_objects
 
+    def get_message(self, site, email, content_objects, connection=None):
+        """
+        Return a single email for a user listing all of their outdated content.
+        """
+        model_names = [obj._meta.model_name.title() for obj in content_objects]
+
+        if len(content_objects) == 1:
+            subject = '{site_name} - Outdated content for {model}'.format(
+                site_name=site.name, model=model_names[0],
+            )
+        else:
+            subject = '{site_name} - Outdated content for {count} items'.format(
+                site_name=site.name, count=len(content_objects),
+            )
+
+        lines = [
+            '{model} {obj} https://{domain}{url}'.format(
+                model=model_name, obj=obj, domain=site.domain, url=obj.get_absolute_url(),
+            )
+            for model_name, obj in zip(model_names, content_objects)
+        ]
+
+        return EmailMessage(
+            subject=subject,
+            body='Please update the outdated content:\n\n{}\n'.format('\n'.join(lines)),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[email],
+            connection=connection,
+        )
+
+    def handle(self, *args, **options):
         self.verbosity = options.get('verbosity')
+        now = timezone.now()
 
-        for reminder in Reminder.objects.select_related(
-                'content_type'
-        ).exclude(
-            user__email=''
-        ).iterator():
-            content_obj = reminder.content_object
-
-            if content_obj.current_version and content_obj.published:
-
-                date_difference = timezone.now() - content_obj.current_version.modified
-                reminder_difference = timezone.now() - reminder.sent_at
-
-                if (
-                        date_difference >= reminder.get_interval_timedelta() and
-                        reminder_difference >= reminder.get_interval_timedelta()
-                ):
-
-                    current_site = Site.objects.get_current()
-
-                    send_mail(
-                        subject='{site_name} - Outdated content for {model}'.format(
-                            site_name=current_site.name,
-                            model=content_obj._meta.model_name.title(),
-                        ),
-                        message=(
-                            'Please update the outdated content for {model} '
-                            'https://{domain}{url}'.format(
-                                model=content_obj._meta.model_name.title(),
-                                domain=current_site.domain,
-                                url=content_obj.get_absolute_url(),
-                            )
-                        ),
-                        from_email=settings.DEFAULT_FROM_EMAIL,
-                        recipient_list=[reminder.user.email],
-                    )
-                    self.stdout.write(
-                        'Email for {} is sent to: {}'.format(content_obj, reminder.user.email)
+        reminders = list(Reminder.objects.due(now=now).select_related('content_type', 'user'))
+        content_objects = self.get_content_objects(reminders)
+
+        # Group reminders for each user into a single digest email
+        digests = OrderedDict()
+
+        for reminder in reminders:
+            obj = content_objects.get((reminder.content_type_id, reminder.object_id))
+
+            if obj is not None:
+                digests.setdefault(reminder.user.email, []).append((reminder, obj))
+
+        sent_ids = []
+
+        if digests:
+            current_site = Site.objects.get_current()
+            connection = get_connection()
+            connection.open()
+
+            try:
+                for email, user_reminders in digests.items():
+                    message = self.get_message(
+                        site=current_site,
+                        email=email,
+                        content_objects=[obj for reminder, obj in user_reminders],
+                        connection=connection,
                     )
-                    # Update the updated_at date to make sure it's not get send reminders.
-                    reminder.sent_at = timezone.now()
-                    reminder.save()
-                else:
-                    if self.verbosity == 3:
-                        self.stdout.write(
-                            'Email for {} is not sent to: {}'.format(
-                                content_obj, reminder.user.email
-                            )
-                        )
+
+                    try:
+                        message.send()
+                    except Exception as error:
+                        self.stderr.write('Unable to send email to {}: {}'.format(email, error))
+                        continue
+
+                    for reminder, obj in user_reminders:
+                        sent_ids.append(reminder.id)
+                        self.stdout.write('Email for {} is sent to: {}'.format(obj, email))
+            finally:
+                connection.close()
+
+        # Update the sent_at date to make sure they don't get sent again
+        Reminder.objects.mark_sent(sent_ids, now=now)
+
+        if self.verbosity == 3:
+            not_sent = Reminder.objects.exclude(
+                id__in=sent_ids,
+            ).exclude(
+                user__email='',
+            ).select_related('user').prefetch_related('content_object')
+
+            for reminder in not_sent:
+                self.stdout.write('Email for {} is not sent to: {}'.format(
+                    reminder.content_object, reminder.user.email
+                ))
@@ -0,0 +1,43 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.db.models import Case, Value, When
+from django.utils import timezone
+
+from . import choices as reminders_choices
+
+
+class ReminderManager(models.Manager):
+    def due(self, now=None):
+        """
+        Return reminders which need to be sent, where both the content and the last reminder are
+        older than the reminder interval.
+        """
+        if now is None:
+            now = timezone.now()
+
+        return self.filter(next_due_at__lte=now).exclude(user__email='')
+
+    def mark_sent(self, reminder_ids, now=None):
+        """
+        Record reminders as being sent with a single update, setting when each one is next due
+        based on its interval.
+        """
+        if now is None:
+            now = timezone.now()
+
+        self.filter(id__in=reminder_ids).update(sent_at=now, next_due_at=Case(*[
+            When(interval=interval, then=Value(now + delta))
+            for interval, delta in reminders_choices.INTERVAL_DELTAS.items()
+        ], output_field=models.DateTimeField()))
+
+    def update_next_due(self, obj):
+        """
+        Recalculate when reminders for an object are due, after the object has been changed.
+        """
+        reminders = self.filter(
+            content_type=ContentType.objects.get_for_model(obj), object_id=obj.pk,
+        )
+
+        for reminder in reminders:
+            reminder.content_object = obj
+            self.filter(id=reminder.id).update(next_due_at=reminder.get_next_due_at())
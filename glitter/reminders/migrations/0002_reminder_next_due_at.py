@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from dateutil.relativedelta import relativedelta
+from django.core.exceptions import FieldError
+from django.db import migrations, models
+
+
+# Copied from the choices, so later changes there don't affect this migration
+INTERVAL_DELTAS = {
+    1: relativedelta(weeks=2),
+    2: relativedelta(months=1),
+    3: relativedelta(months=3),
+    4: relativedelta(months=6),
+    5: relativedelta(years=1),
+}
+
+
+def set_next_due_at(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    Reminder = apps.get_model('reminders', 'Reminder')
+
+    for reminder in Reminder.objects.all():
+        content_type = ContentType.objects.get(id=reminder.content_type_id)
+
+        try:
+            model = apps.get_model(content_type.app_label, content_type.model)
+            modified = model._default_manager.filter(
+                pk=reminder.object_id, published=True,
+            ).exclude(
+                current_version=None,
+            ).values_list('current_version__modified', flat=True).first()
+        except (LookupError, FieldError):
+            continue
+
+        if modified is None:
+            continue
+
+        last_changed = max(modified, reminder.sent_at or modified)
+        reminder.next_due_at = last_changed + INTERVAL_DELTAS[reminder.interval]
+        reminder.save(update_fields=['next_due_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reminders', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reminder',
+            name='next_due_at',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.RunPython(set_next_due_at, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,3 @@
-import datetime
-from calendar import monthrange
-
-from dateutil.relativedelta import relativedelta
-
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
@@ -10,6 +5,7 @@ from django.db import models
 from django.utils import timezone
 
 from . import choices as reminders_choices
+from .managers import ReminderManager
 
 
 class Reminder(models.Model):
@@ -20,6 +16,9 @@ class Reminder(models.Model):
     interval = models.IntegerField(choices=reminders_choices.INTERVAL_CHOICES)
     sent_at = models.DateTimeField(auto_now_add=True, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    next_due_at = models.DateTimeField(blank=True, null=True, db_index=True, editable=False)
+
+    objects = ReminderManager()
 
     class Meta:
         unique_together = ('user', 'object_id', 'content_type',)
@@ -33,31 +32,29 @@ class Reminder(models.Model):
 
     def get_interval_timedelta(self):
         """ Spits out the timedelta in days. """
-
         now_datetime = timezone.now()
-        current_month_days = monthrange(now_datetime.year, now_datetime.month)[1]
+        return (now_datetime + reminders_choices.INTERVAL_DELTAS[self.interval]) - now_datetime
 
-        # Two weeks
-        if self.interval == reminders_choices.INTERVAL_2_WEEKS:
-            interval_timedelta = datetime.timedelta(days=14)
+    def get_next_due_at(self):
+        """
+        Return when the next reminder should be sent - one interval after both the content was
+        last modified and the last reminder was sent, or None for unpublished content.
+        """
+        obj = self.content_object
 
-        # One month
-        elif self.interval == reminders_choices.INTERVAL_ONE_MONTH:
-            interval_timedelta = datetime.timedelta(days=current_month_days)
+        if obj is None or not getattr(obj, 'published', False) or obj.current_version is None:
+            return None
 
-        # Three months
-        elif self.interval == reminders_choices.INTERVAL_THREE_MONTHS:
-            three_months = now_datetime + relativedelta(months=+3)
-            interval_timedelta = three_months - now_datetime
+        last_changed = [obj.current_version.modified]
 
-        # Six months
-        elif self.interval == reminders_choices.INTERVAL_SIX_MONTHS:
-            six_months = now_datetime + relativedelta(months=+6)
-            interval_timedelta = six_months - now_datetime
+        if self.sent_at is not None:
+            last_changed.append(self.sent_at)
+        elif self._state.adding:
+            # sent_at gets set when a reminder is created
+            last_changed.append(timezone.now())
 
-        # One year
-        elif self.interval == reminders_choices.INTERVAL_ONE_YEAR:
-            one_year = now_datetime + relativedelta(years=+1)
-            interval_timedelta = one_year - now_datetime
+        return max(last_changed) + reminders_choices.INTERVAL_DELTAS[self.interval]
 
-        return interval_timedelta
+    def save(self, *args, **kwargs):
+        self.next_due_at = self.get_next_due_at()
+        super().save(*args, **kwargs)
@@ -0,0 +1,95 @@
+(function($) {
+    /**
+     * Asset selects only include the chosen asset, so add a search box which fetches matching
+     * assets from the admin as they're needed.
+     */
+    function setup_asset_select(select){
+        var $select = $(select);
+
+        // Skip the hidden template for new inline rows, and anything already set up
+        if ($select.data('asset-search') || $select.closest('.empty-form').length){
+            return;
+        }
+
+        var $search = $('<input>', {
+            'type': 'search',
+            'class': 'glitter-asset-search',
+            'placeholder': 'Search'
+        });
+        var $empty_option = $select.find('option[value=""]').first().clone();
+        var search_timeout = null;
+        var request = null;
+        var loaded = false;
+
+        $select.before($search).data('asset-search', $search);
+
+        function load_choices(){
+            if (request){
+                request.abort();
+            }
+
+            request = $.getJSON($select.data('choices-url'), {'q': $search.val()}, function(data){
+                var $selected = $select.find('option:selected').filter(function(){
+                    return this.value !== '';
+                }).detach();
+                var groups = {};
+
+                $select.empty().append($empty_option.clone()).append($selected);
+
+                $.each(data.results, function(index, result){
+                    if (String(result.id) === $selected.val()){
+                        return;
+                    }
+
+                    var $option = $('<option>', {value: result.id, text: result.text});
+
+                    if (result.group){
+                        if (!(result.group in groups)){
+                            groups[result.group] = $('<optgroup>', {label: result.group});
+                            $select.append(groups[result.group]);
+                        }
+                        groups[result.group].append($option);
+                    } else {
+                        $select.append($option);
+                    }
+                });
+
+                if (data.more){
+                    $select.append($('<option>', {
+                        'disabled': true,
+                        'text': 'More assets found, search to narrow the list'
+                    }));
+                }
+            });
+            request.always(function(){
+                request = null;
+            });
+        }
+
+        // Fetch the first assets when the select is first used
+        $select.on('mousedown focus', function(){
+            if (!loaded){
+                loaded = true;
+                load_choices();
+            }
+        });
+
+        $search.on('input', function(){
+            loaded = true;
+            clearTimeout(search_timeout);
+            search_timeout = setTimeout(load_choices, 300);
+        });
+    }
+
+    $(document).ready(function(){
+        $('select.glitter-asset-select').each(function(){
+            setup_asset_select(this);
+        });
+    });
+
+    $(document).on('formset:added', function(event, $row){
+        $row.find('select.glitter-asset-select').each(function(){
+            setup_asset_select(this);
+        });
+    });
+})(django.jQuery);
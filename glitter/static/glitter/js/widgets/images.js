@@ -149,6 +149,14 @@
         $('.block-image-selector').on('click', 'img', function(){
             obj_id = $(this).attr('obj-id');
             $select_image = $(this).closest('.block-image-selector').parent().find('.image-related-field');
+
+            // Only the current image is in the select, so add any others when chosen
+            if ($select_image.find('option[value="' + obj_id + '"]').length === 0){
+                $select_image.append($('<option>', {
+                    value: obj_id,
+                    text: $(this).closest('.grid-item').find('h5').text()
+                }));
+            }
             $select_image.val(obj_id);
             $('.block-image-selector').hide();
         });
@@ -157,38 +165,11 @@
             $(this).closest('.block-image-selector').hide();
         });
 
-        /**
-         * Display correct images when category is changed.
-         */
-        $('select#category').change(function(){
-            $('.image-grid img').each(function(index, elem){
-                $(elem).closest('.grid-item').show();
-                $(elem).closest('.grid-item').attr('visible', 'true');
-            });
-
-            var category_id = $(this).val();
-            if (category_id == "0"){
-                $('.image-grid img').each(function(index, elem){
-                     $(elem).closest('.grid-item').show();
-                     $(elem).closest('.grid-item').attr('visible', 'true');
-                });
-
-            } else {
-                $('.image-grid img[data-category-id!='+category_id+']').each(function(index, elem){
-                     $(elem).closest('.grid-item').hide();
-                     $(elem).closest('.grid-item').attr('visible', 'false');
-                });
-            }
-            check_window_size();
-        });
-
-        // Array to hold what ID's been called for the images:
-        IDS_CALLED = [];
-        function inject_images(data){
-            $('.image-grid').append(data.html);
-            reveal_images();
-            check_window_size();
-        }
+        // Whether there are more images to load for the current filters, and any request which
+        // is already on its way.
+        var has_more = $('.block-image-selector').attr('data-has-more') == 'true';
+        var request = null;
+        var search_timeout = null;
 
         function toggle_loader(show){
             if (show === true){
@@ -198,31 +179,75 @@
             }
         }
 
+        /**
+         * Load the next page of images for the current category and title search. Images are
+         * paged by ID, so pass the ID of the last image shown to carry on from there.
+         */
+        function load_images(selector, reset){
+            if (reset){
+                // Filters have changed, the old results aren't wanted any more
+                if (request){
+                    request.abort();
+                }
+            } else if (request || !has_more){
+                return;
+            }
+
+            var params = {
+                'category': $('select#category').val(),
+                'q': $('#image-search').val()
+            };
+
+            if (!reset){
+                params.last_image_id = $(selector).find('.grid-item').last().find('img').attr('obj-id');
+            }
+
+            toggle_loader(true);
+            var current = $.get(selector.dataset.url, params, function(data){
+                if (reset){
+                    $('.image-grid').empty();
+                }
+                $('.image-grid').append(data.html);
+                has_more = data.has_more;
+                reveal_images();
+            }, "json");
+            request = current;
+            current.always(function(){
+                // An aborted request mustn't clear the one which replaced it
+                if (request === current){
+                    request = null;
+                    toggle_loader(false);
+                }
+            });
+        }
+
+        /**
+         * Start again from the newest images when the category or title search changes.
+         */
+        $('select#category').change(function(){
+            load_images($(this).closest('.block-image-selector')[0], true);
+        });
+
+        $('#image-search').on('input', function(){
+            var selector = $(this).closest('.block-image-selector')[0];
+            clearTimeout(search_timeout);
+            search_timeout = setTimeout(function(){
+                load_images(selector, true);
+            }, 300);
+        });
+
         $('.block-image-selector').scroll(function(){
             // Load images when reached the bottom of 20%.
             var LAZY_THRESHOLD = 20;
 
-            // Ajax load image url.
-            var AJAX_LOAD_IMAGES_URL = this.dataset.url;
-
             // Measurement of the height of an element's content, including content not visible on the scree due to overlfow.
             var scroll_height = this.scrollHeight;
 
             // Variable at what pixel height should start loading the images.
-            var load_images =  (scroll_height - (scroll_height * (LAZY_THRESHOLD/100)));
-
-            // Get last image id.
-            var last_image_id = $(this).find($('.grid-item')).last().find('img').attr('obj-id');
-
-            if (load_images <= (this.scrollTop + this.offsetHeight)){
-                if (IDS_CALLED.indexOf(last_image_id) < 0){
-                    IDS_CALLED.push(last_image_id);
-                    toggle_loader(show=true);
-                    $.get(AJAX_LOAD_IMAGES_URL, {'last_image_id': last_image_id}, function(data){
-                        toggle_loader(show=false);
-                        inject_images(data);
-                    }, "json");
-                }
+            var load_at =  (scroll_height - (scroll_height * (LAZY_THRESHOLD/100)));
+
+            if (load_at <= (this.scrollTop + this.offsetHeight)){
+                load_images(this, false);
             }
         });
     });
@@ -1,8 +1,10 @@
 from collections import namedtuple
+from types import MappingProxyType
 
 from django.apps import apps
 from django.db.models.base import ModelBase
 
+from .exceptions import GlitterTemplateNotRegistered
 from .layouts import PageLayoutBase
 
 
@@ -22,17 +24,48 @@ def register(class_or_iterable, model_class):
 
         templates[template_name] = Template(layout=layout, model=model_class)
 
+    # Anything registered late gets included when the index is next needed
+    _index.clear()
+
+
+def finalize():
+    """
+    Build the index of template choices for each model, once all layouts have been registered.
+
+    Templates registered for a model are also usable by the model's parents, so each template is
+    added to every model class in its model's MRO. Choices are stored as tuples sorted by name.
+    """
+    model_templates = {}
 
-def get_templates(model):
-    """ Return a list of templates usable by a model. """
     for template_name, template in templates.items():
-        if issubclass(template.model, model):
-            yield (template_name, template.layout._meta.verbose_name)
+        for model in template.model.__mro__:
+            if isinstance(model, ModelBase):
+                model_templates.setdefault(model, []).append(
+                    (template_name, template.layout._meta.verbose_name)
+                )
+
+    _index.clear()
+    _index['choices'] = MappingProxyType({
+        model: tuple(sorted(choices, key=lambda x: x[1]))
+        for model, choices in model_templates.items()
+    })
+    return _index['choices']
+
+
+def get_templates(model):
+    """ Return template choices usable by a model, sorted by name. """
+    if 'choices' not in _index:
+        finalize()
+
+    return _index['choices'].get(model, ())
 
 
 def get_layout(template_name):
     """ Return a registered layout from a template name. """
-    return templates[template_name].layout
+    try:
+        return templates[template_name].layout
+    except KeyError:
+        raise GlitterTemplateNotRegistered(template_name)
 
 
 def attach(*layouts, **kwargs):
@@ -51,3 +84,4 @@ def attach(*layouts, **kwargs):
     return _model_admin_wrapper
 
 templates = {}
+_index = {}
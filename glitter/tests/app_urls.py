@@ -0,0 +1,6 @@
+from django.conf.urls import include, url
+
+
+urlpatterns = [
+    url(r'^', include('glitter.urls')),
+]
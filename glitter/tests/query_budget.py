@@ -0,0 +1,37 @@
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetMixin(object):
+    """
+    Test case mixin to check views stay within the query budgets in the
+    ``GLITTER_QUERY_BUDGETS`` setting.
+    """
+
+    def get_query_budget(self, name, blocks=0):
+        """
+        Return the maximum number of queries allowed for a view with a number of blocks.
+        """
+        queries, queries_per_block = settings.GLITTER_QUERY_BUDGETS[name]
+        return queries + queries_per_block * blocks
+
+    @contextmanager
+    def assertQueryBudget(self, name, blocks=0):
+        budget = self.get_query_budget(name, blocks=blocks)
+
+        with CaptureQueriesContext(connection) as captured:
+            yield
+
+        executed = len(captured)
+
+        if executed > budget:
+            queries = '\n'.join(
+                '{}. {}'.format(number, query['sql'])
+                for number, query in enumerate(captured.captured_queries, start=1)
+            )
+            self.fail('{} executed {} queries with {} blocks, budget is {}:\n{}'.format(
+                name, executed, blocks, budget, queries,
+            ))
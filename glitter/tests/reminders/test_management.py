@@ -2,9 +2,12 @@ from datetime import timedelta
 import io
 from unittest import mock
 
+from dateutil.relativedelta import relativedelta
+
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
-from django.core import management
+from django.contrib.sites.models import Site
+from django.core import mail, management
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
@@ -125,3 +128,139 @@ class ReminderManagementTestCase(TestCase):
                 self.reminder.content_object, self.reminder.user.email
             )
         )
+
+
+@override_settings(
+    ROOT_URLCONF='glitter.reminders.tests.urls',
+)
+class ReminderDigestTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='joe', email='joe@example.com')
+        cls.other_user = User.objects.create_user(username='ann', email='ann@example.com')
+        cls.content_type = ContentType.objects.get_for_model(Page)
+
+    def create_page(self, url, days_old, published=True):
+        page = Page.objects.create(url=url, title=url, published=published)
+        version = Version.objects.create(
+            content_type=self.content_type, object_id=page.id,
+            template_name='glitter/sample.html', version_number=1,
+        )
+        Version.objects.filter(id=version.id).update(
+            modified=timezone.now() - timedelta(days=days_old)
+        )
+        version.refresh_from_db()
+        page.current_version = version
+        page.save()
+        return page
+
+    def create_reminder(self, page, user, days_since_sent=100):
+        reminder = Reminder.objects.create(
+            content_type=self.content_type, object_id=page.id, user=user,
+            interval=choices.INTERVAL_2_WEEKS,
+        )
+        # sent_at is set when reminders are created
+        reminder.sent_at = timezone.now() - timedelta(days=days_since_sent)
+        reminder.save()
+        return reminder
+
+    def send_reminders(self):
+        management.call_command('send_reminders', stdout=io.StringIO())
+
+    def test_digest(self):
+        reminders = [
+            self.create_reminder(self.create_page('/first/', days_old=30), self.user),
+            self.create_reminder(self.create_page('/second/', days_old=30), self.user),
+        ]
+        self.send_reminders()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['joe@example.com'])
+        self.assertIn('/first/', mail.outbox[0].body)
+        self.assertIn('/second/', mail.outbox[0].body)
+
+        for reminder in reminders:
+            reminder.refresh_from_db()
+            self.assertGreater(reminder.sent_at, timezone.now() - timedelta(minutes=1))
+
+        # Not due again until the next interval
+        self.send_reminders()
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_due(self):
+        due = self.create_reminder(self.create_page('/due/', days_old=30), self.user)
+        self.create_reminder(self.create_page('/recent/', days_old=3), self.user)
+        self.create_reminder(self.create_page('/sent/', days_old=30), self.other_user, 1)
+        self.create_reminder(
+            self.create_page('/unpublished/', days_old=30, published=False), self.other_user
+        )
+
+        self.assertQuerysetEqual(Reminder.objects.due(), [due.id], lambda x: x.id)
+
+    def test_no_reminders(self):
+        with self.assertNumQueries(1):
+            self.send_reminders()
+
+        self.assertEqual(mail.outbox, [])
+
+    def test_query_count(self):
+        """
+        The number of queries doesn't depend on the number of reminders or users.
+        """
+        for number in range(2):
+            page = self.create_page('/page-{}/'.format(number), days_old=30)
+            self.create_reminder(page, self.user)
+
+        Site.objects.clear_cache()
+        with self.assertNumQueries(4):
+            self.send_reminders()
+
+        for number in range(2, 6):
+            page = self.create_page('/page-{}/'.format(number), days_old=30)
+            self.create_reminder(page, self.user)
+            self.create_reminder(page, self.other_user)
+
+        Site.objects.clear_cache()
+        with self.assertNumQueries(4):
+            self.send_reminders()
+
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_next_due_at(self):
+        page = self.create_page('/page/', days_old=30)
+        reminder = self.create_reminder(page, self.user, days_since_sent=100)
+        self.assertEqual(
+            reminder.next_due_at, page.current_version.modified + relativedelta(weeks=2)
+        )
+
+        # Publishing a new version pushes the reminder back
+        version = Version.objects.create(
+            content_type=self.content_type, object_id=page.id,
+            template_name='glitter/sample.html', version_number=2,
+        )
+        page.current_version = version
+        page.save()
+        reminder.refresh_from_db()
+        self.assertEqual(reminder.next_due_at, version.modified + relativedelta(weeks=2))
+
+        # Unpublished content is never due
+        page.published = False
+        page.save()
+        reminder.refresh_from_db()
+        self.assertIsNone(reminder.next_due_at)
+
+    def test_other_models_not_checked(self):
+        # Only the update itself, without looking for reminders
+        with self.assertNumQueries(1):
+            self.user.save()
+
+    def test_mark_sent(self):
+        page = self.create_page('/page/', days_old=30)
+        reminder = self.create_reminder(page, self.user)
+        now = timezone.now()
+
+        Reminder.objects.mark_sent([reminder.id], now=now)
+        reminder.refresh_from_db()
+        self.assertEqual(reminder.sent_at, now)
+        self.assertEqual(reminder.next_due_at, now + relativedelta(weeks=2))
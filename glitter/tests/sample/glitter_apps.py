@@ -0,0 +1,6 @@
+from glitter.integration import GlitterApp
+
+
+apps = {
+    'sample': GlitterApp(name='Sample', url_conf='glitter.tests.sample.urls', namespace='sample'),
+}
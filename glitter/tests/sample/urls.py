@@ -0,0 +1,11 @@
+from django.conf.urls import url
+from django.http import HttpResponse
+
+
+def app_view(request):
+    return HttpResponse('Sample app')
+
+
+urlpatterns = [
+    url(r'^$', app_view, name='list'),
+]
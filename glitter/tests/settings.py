@@ -51,18 +51,19 @@ INSTALLED_APPS = (
     'glitter',
     'glitter.assets',
     'glitter.blocks.banner',
+    'glitter.blocks.carousel',
     'glitter.blocks.form',
     'glitter.blocks.html',
     'glitter.blocks.image',
     'glitter.blocks.redactor',
     'glitter.blocks.related_pages',
+    'glitter.blocks.video',
     'glitter.pages',
     'glitter.publisher',
     'glitter.reminders',
     'glitter.tests.sample',
     'glitter.tests.sampleblocks',
     'mptt',
-    'sorl.thumbnail',
     'taggit',
 )
 
@@ -74,6 +75,9 @@ APPEND_SLASH = True
 
 GLITTER_LOGIN_PERMS = True
 
+# Create image renditions straight away, rather than in a pool of workers
+GLITTER_IMAGE_RENDITION_WORKERS = 0
+
 
 TEMPLATES = [
     {
@@ -102,3 +106,30 @@ TEMPLATES = [
 PASSWORD_HASHERS = [
     'django.contrib.auth.hashers.MD5PasswordHasher',
 ]
+
+
+# Maximum number of queries for each view, as a fixed number of queries and the number of queries
+# allowed per block on the page (or per page for navigation). Query budget tests use an even mix of
+# HTML, text, banner and related pages blocks - banner and related pages blocks need a query each.
+GLITTER_QUERY_BUDGETS = {
+    # Public pages
+    'page': (7, 0.5),
+
+    # Glitter admin editor
+    'page_version': (13, 0.5),
+    'page_edit': (15, 0.5),
+    'page_edit_copy': (13, 6.25),
+    'block_move': (15, 0.5),
+    'block_column': (15, 0.5),
+    'block_delete': (26, 0.5),
+
+    # Block admin
+    'block_add': (10, 0),
+    'block_change': (13, 0),
+    'block_continue': (11, 0.5),
+
+    # Navigation template tags
+    'navigation_root_pages': (2, 0),
+    'navigation_pages_at_level': (1, 0),
+    'navigation_tree_from_root': (2, 0),
+}
@@ -0,0 +1,58 @@
+import asyncore
+import smtpd
+import threading
+
+
+class LocalSMTPServer(smtpd.SMTPServer):
+    """
+    SMTP server for tests, which keeps messages in memory rather than delivering them.
+
+    Use as a context manager, and point the SMTP email backend at ``server.port``. Set
+    ``fail_messages`` to reject that many messages with a temporary failure.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0):
+        super().__init__((host, port), None, map={}, decode_data=True)
+        self.messages = []
+        self.connections = 0
+        self.fail_messages = 0
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def port(self):
+        return self.socket.getsockname()[1]
+
+    def handle_accepted(self, conn, addr):
+        self.connections += 1
+        super().handle_accepted(conn, addr)
+
+    def process_message(self, peer, mailfrom, rcpttos, data, **kwargs):
+        if self.fail_messages:
+            self.fail_messages -= 1
+            return '451 Temporary failure, try again later'
+
+        self.messages.append({'from': mailfrom, 'to': rcpttos, 'data': data})
+
+    def serve(self):
+        while not self._stopped.is_set():
+            asyncore.loop(timeout=0.01, count=1, map=self._map)
+
+        asyncore.close_all(map=self._map)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
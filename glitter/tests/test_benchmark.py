@@ -0,0 +1,29 @@
+from django.test import TestCase
+
+from glitter.benchmark import benchmark_startup, run_benchmarks
+
+
+class TestBenchmarks(TestCase):
+    def test_run_benchmarks(self):
+        results = run_benchmarks(
+            block_counts=[4], tree_depth=3, version_count=3, action_count=2, repeat=1,
+        )
+
+        self.assertEqual([result['name'] for result in results], [
+            'render_page', 'duplicate_content', 'process_actions', 'page_block_move_view',
+        ])
+
+        for result in results:
+            self.assertEqual(result['blocks'], 4)
+            self.assertGreater(result['queries'], 0)
+            self.assertGreater(result['median_ms'], 0)
+
+    def test_startup(self):
+        result = benchmark_startup(repeat=1)
+
+        self.assertEqual(result['name'], 'startup')
+        self.assertGreater(result['median_ms'], 0)
+        self.assertGreater(result['modules'], 0)
+
+        # Block admins are only imported once the block admin is used
+        self.assertEqual(result['block_modules'], 0)
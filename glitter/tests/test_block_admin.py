@@ -16,7 +16,7 @@ from glitter.pages.models import Page
 
 SAMPLE_BLOCK_MISSING = 'glitter.tests.sampleblocks' not in settings.INSTALLED_APPS
 if not SAMPLE_BLOCK_MISSING:
-    from glitter.tests.sampleblocks.admin import SampleInlineAdmin
+    from glitter.tests.sampleblocks.blocks import SampleInlineAdmin
 
 
 class MockRequest(object):
@@ -63,6 +63,34 @@ class TestBlockAdminSite(TestCase):
         # Run again whe `Common` is added in self.block_list
         self.site.register_block(HTML, 'Common')
 
+    def test_changes_before_discovery(self):
+        site = BlockAdminSite(name='startup_block_admin')
+        site.register(HTML, category='Common')
+        site.register_block(HTML, 'Other')
+        site.unregister_block(HTML, 'Other')
+
+        # Kept until the blocks modules have been imported
+        self.assertFalse(site._discovered)
+        self.assertIn(HTML, site._registry)
+        self.assertTrue(site._discovered)
+        self.assertEqual(site.block_list, {'Common': [HTML], 'Other': []})
+
+    def test_unregister_before_discovery(self):
+        site = BlockAdminSite(name='startup_block_admin')
+        site.register(HTML)
+
+        # Unregistering at startup doesn't raise NotRegistered
+        site.unregister(HTML)
+        self.assertNotIn(HTML, site._registry)
+
+    def test_moved_admin_import(self):
+        from glitter.blocks.image import blocks as image_blocks
+
+        with self.assertWarns(DeprecationWarning):
+            from glitter.blocks.image.admin import ImageBlockAdmin
+
+        self.assertIs(ImageBlockAdmin, image_blocks.ImageBlockAdmin)
+
     def test_get_urls(self):
         with self.settings(DEBUG=True):
             self.site.get_urls()
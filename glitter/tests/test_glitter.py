@@ -1,5 +1,12 @@
+import asyncio
+import time
+from unittest import mock
+
 from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase, modify_settings, override_settings
+from django.utils import translation
+
+from glitter import concurrency
 
 from glitter.blocks.html.models import HTML
 from glitter.models import ContentBlock, Version
@@ -72,3 +79,216 @@ class TestGlitterQueries(TestCase):
         with self.assertNumQueries(2):
             glitter = Glitter(page_version=self.page_version)
             glitter.render()
+
+
+def slow_block_view(block, request, rerender, content_block, block_classes):
+    time.sleep(0.2)
+    return '<p>Slow block {}</p>'.format(block.id)
+
+
+@mock.patch.object(HTML, 'concurrent_render', True)
+@mock.patch.object(HTML, 'render_function', 'glitter.tests.test_glitter.slow_block_view')
+class TestGlitterConcurrentRender(TestCase):
+    def setUp(self):
+        self.page = Page.objects.create(url='/test/', title='Test page')
+        self.page_version = Version.objects.create(
+            content_type=ContentType.objects.get_for_model(Page),
+            object_id=self.page.id,
+            template_name='glitter/sample.html',
+        )
+        html_content_type = ContentType.objects.get_for_model(HTML)
+
+        for block_position, column in enumerate(('main_content', 'main_content', 'side'), start=1):
+            html_block = HTML.objects.create(content='<p>HTML Block</p>')
+            content_block = ContentBlock.objects.create(
+                obj_version=self.page_version,
+                column=column,
+                position=block_position,
+                content_type=html_content_type,
+                object_id=html_block.id,
+            )
+            html_block.content_block = content_block
+            html_block.save(update_fields=['content_block'])
+
+    @override_settings(GLITTER_CONCURRENT_RENDER=True)
+    def test_concurrent_render(self):
+        glitter = Glitter(page_version=self.page_version)
+
+        start = time.monotonic()
+        columns = glitter.render()
+        elapsed = time.monotonic() - start
+
+        # Three slow blocks, but only waiting for the slowest one
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(columns['main_content'].count('Slow block'), 2)
+        self.assertEqual(columns['side'].count('Slow block'), 1)
+
+    @override_settings(GLITTER_CONCURRENT_RENDER=True, GLITTER_CONCURRENT_RENDER_TIMEOUT=0.01)
+    def test_concurrent_render_timeout(self):
+        glitter = Glitter(page_version=self.page_version)
+        columns = glitter.render()
+
+        self.assertNotIn('Slow block', columns['main_content'])
+        self.assertIn('glitter_page_block_timeout', columns['main_content'])
+
+    @override_settings(GLITTER_CONCURRENT_RENDER=False)
+    def test_concurrent_render_disabled(self):
+        glitter = Glitter(page_version=self.page_version)
+
+        with mock.patch('glitter.concurrency.submit') as mock_submit:
+            columns = glitter.render()
+
+        self.assertFalse(mock_submit.called)
+        self.assertEqual(columns['main_content'].count('Slow block'), 2)
+
+    @override_settings(GLITTER_CONCURRENT_RENDER=True)
+    def test_concurrent_render_language(self):
+        glitter = Glitter(page_version=self.page_version)
+        render_function = 'glitter.tests.test_glitter.language_block_view'
+
+        with mock.patch.object(HTML, 'render_function', render_function):
+            with translation.override('fr'):
+                columns = glitter.render()
+
+        self.assertEqual(columns['main_content'].count('Language fr'), 2)
+
+    @override_settings(
+        GLITTER_CONCURRENT_RENDER=True, GLITTER_CONCURRENT_RENDER_TIMEOUT=0.01,
+        GLITTER_CONCURRENT_RENDER_WORKERS=3,
+    )
+    def test_concurrent_render_stuck_workers(self):
+        concurrency.get_executor().shutdown()
+        concurrency._executor = None
+        self.addCleanup(setattr, concurrency, '_executor', None)
+
+        executor = concurrency.get_executor()
+        render_function = 'glitter.tests.test_glitter.stuck_block_view'
+
+        with mock.patch.object(HTML, 'render_function', render_function):
+            with self.assertLogs('glitter.concurrency', 'WARNING'):
+                Glitter(page_version=self.page_version).render()
+
+        # Every worker was stuck, so the next page gets a new pool
+        self.assertIsNot(concurrency.get_executor(), executor)
+
+
+class TestBackground(TestCase):
+    @override_settings(GLITTER_TEST_CELERY=False)
+    def test_celery_disabled(self):
+        self.assertFalse(concurrency.celery_enabled('GLITTER_TEST_CELERY'))
+
+    @override_settings(GLITTER_TEST_CELERY=True)
+    def test_celery_enabled(self):
+        self.assertTrue(concurrency.celery_enabled('GLITTER_TEST_CELERY'))
+
+    def test_run_in_background(self):
+        future = concurrency.run_in_background('test', sum, [1, 2, 3])
+        self.assertEqual(future.result(timeout=5), 6)
+
+    def test_run_in_background_error(self):
+        with self.assertLogs('glitter.concurrency', 'ERROR'):
+            future = concurrency.run_in_background('test', int, 'not a number')
+            self.assertIsNone(future.result(timeout=5))
+
+
+def language_block_view(block, request, rerender, content_block, block_classes):
+    return '<p>Language {}</p>'.format(translation.get_language())
+
+
+def stuck_block_view(block, request, rerender, content_block, block_classes):
+    time.sleep(0.3)
+    return ''
+
+
+async def async_block_view(block, request, rerender, content_block, block_classes):
+    await asyncio.sleep(0.2)
+    return '<p>Async block {}</p>'.format(block.id)
+
+
+class TestGlitterAsyncRender(TestCase):
+    def setUp(self):
+        self.page = Page.objects.create(url='/test/', title='Test page')
+        self.page_version = Version.objects.create(
+            content_type=ContentType.objects.get_for_model(Page),
+            object_id=self.page.id,
+            template_name='glitter/sample.html',
+        )
+        html_content_type = ContentType.objects.get_for_model(HTML)
+
+        for block_position in range(1, 4):
+            html_block = HTML.objects.create(content='<p>HTML Block</p>')
+            content_block = ContentBlock.objects.create(
+                obj_version=self.page_version,
+                column='main_content',
+                position=block_position,
+                content_type=html_content_type,
+                object_id=html_block.id,
+            )
+            html_block.content_block = content_block
+            html_block.save(update_fields=['content_block'])
+
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    @mock.patch.object(HTML, 'render_function', 'glitter.tests.test_glitter.async_block_view')
+    def test_async_block_views(self):
+        glitter = Glitter(page_version=self.page_version)
+
+        start = time.monotonic()
+        columns = self.loop.run_until_complete(glitter.arender(loop=self.loop))
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(columns['main_content'].count('Async block'), 3)
+        self.assertIn('glitter_column_side', columns['side'])
+
+    @mock.patch.object(HTML, 'render_function', 'glitter.tests.test_glitter.slow_block_view')
+    def test_sync_block_views(self):
+        glitter = Glitter(page_version=self.page_version)
+
+        start = time.monotonic()
+        columns = self.loop.run_until_complete(glitter.arender(loop=self.loop))
+        elapsed = time.monotonic() - start
+
+        # Regular block views are run in the thread pool, even without concurrent_render
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(columns['main_content'].count('Slow block'), 3)
+
+    def test_sync_block_views_in_executor(self):
+        glitter = Glitter(page_version=self.page_version)
+
+        with mock.patch(
+            'glitter.concurrency.run_in_executor', wraps=concurrency.run_in_executor
+        ) as run_in_executor:
+            columns = self.loop.run_until_complete(glitter.arender(loop=self.loop))
+
+        # Nothing is rendered in the loop's thread
+        self.assertEqual(run_in_executor.call_count, 3)
+        self.assertEqual(columns['main_content'].count('HTML Block'), 3)
+
+    @override_settings(GLITTER_CONCURRENT_RENDER_TIMEOUT=0.01)
+    @mock.patch.object(HTML, 'render_function', 'glitter.tests.test_glitter.async_block_view')
+    def test_async_render_timeout(self):
+        glitter = Glitter(page_version=self.page_version)
+        columns = self.loop.run_until_complete(glitter.arender(loop=self.loop))
+
+        self.assertNotIn('Async block', columns['main_content'])
+        self.assertEqual(columns['main_content'].count('glitter_page_block_timeout'), 3)
+
+    @override_settings(GLITTER_CONCURRENT_RENDER_TIMEOUT=0.01)
+    @mock.patch.object(HTML, 'render_function', 'glitter.tests.test_glitter.stuck_block_view')
+    def test_sync_render_timeout(self):
+        glitter = Glitter(page_version=self.page_version)
+
+        with mock.patch('glitter.concurrency.abandon') as abandon:
+            columns = self.loop.run_until_complete(glitter.arender(loop=self.loop))
+
+        self.assertEqual(columns['main_content'].count('glitter_page_block_timeout'), 3)
+        self.assertTrue(abandon.called)
+
+    @mock.patch.object(HTML, 'render_function', 'glitter.tests.test_glitter.async_block_view')
+    def test_async_block_views_sync_render(self):
+        glitter = Glitter(page_version=self.page_version)
+        columns = glitter.render()
+
+        self.assertEqual(columns['main_content'].count('Async block'), 3)
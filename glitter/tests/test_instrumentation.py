@@ -0,0 +1,198 @@
+import asyncio
+import socket
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+
+from glitter.blocks.html.models import HTML
+from glitter.instrumentation import BaseSink, NullTimer, StatsdSink
+from glitter.models import ContentBlock
+from glitter.page import Glitter
+from glitter.tests.factories import PageVersionFactory
+
+
+def query_block_view(block, request, rerender, content_block, block_classes):
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+        cursor.execute('SELECT 2')
+
+    return ''
+
+
+QUERY_BLOCK_VIEW = 'glitter.tests.test_instrumentation.query_block_view'
+
+
+class ListSink(BaseSink):
+    timings = []
+
+    def record(self, request, timings):
+        ListSink.timings = list(timings)
+
+
+class BaseInstrumentationCase(TestCase):
+    def setUp(self):
+        self.page_version = PageVersionFactory.create(
+            template_name='glitter/sample.html', version_number=1, set_version=True,
+        )
+        html_block = HTML.objects.create(content='<p>HTML Block</p>')
+        content_block = ContentBlock.objects.create(
+            obj_version=self.page_version,
+            column='main_content',
+            position=1,
+            content_type=ContentType.objects.get_for_model(html_block),
+            object_id=html_block.id,
+        )
+        html_block.content_block = content_block
+        html_block.save(update_fields=['content_block'])
+
+
+class TestRenderTimer(BaseInstrumentationCase):
+    def test_disabled(self):
+        glitter = Glitter(page_version=self.page_version)
+        self.assertIsInstance(glitter.timer, NullTimer)
+
+    @override_settings(
+        GLITTER_RENDER_INSTRUMENTATION=['glitter.tests.test_instrumentation.ListSink'],
+    )
+    def test_timings(self):
+        glitter = Glitter(page_version=self.page_version)
+        glitter.render()
+
+        timings = [(timing.kind, timing.name) for timing in ListSink.timings]
+        self.assertEqual(timings, [
+            ('block', 'main_content.1.glitter_html.html'),
+            ('column', 'main_content'),
+            ('column', 'side'),
+            ('page', 'glitter/sample.html'),
+        ])
+
+        for timing in ListSink.timings:
+            self.assertGreaterEqual(timing.duration, 0)
+            self.assertEqual(timing.queries, 0)
+
+    @override_settings(
+        GLITTER_RENDER_INSTRUMENTATION=['glitter.tests.test_instrumentation.ListSink'],
+    )
+    def test_async_timings(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        glitter = Glitter(page_version=self.page_version)
+        loop.run_until_complete(glitter.arender(loop=loop))
+
+        timings = [(timing.kind, timing.name) for timing in ListSink.timings]
+        self.assertEqual(timings, [
+            ('block', 'main_content.1.glitter_html.html'),
+            ('column', 'main_content'),
+            ('column', 'side'),
+            ('page', 'glitter/sample.html'),
+        ])
+
+    def get_queries(self):
+        return {(timing.kind, timing.name): timing.queries for timing in ListSink.timings}
+
+    @override_settings(
+        GLITTER_RENDER_INSTRUMENTATION=['glitter.tests.test_instrumentation.ListSink'],
+    )
+    @mock.patch.object(HTML, 'render_function', QUERY_BLOCK_VIEW)
+    def test_queries(self):
+        glitter = Glitter(page_version=self.page_version)
+        glitter.render()
+
+        self.assertEqual(self.get_queries(), {
+            ('block', 'main_content.1.glitter_html.html'): 2,
+            ('column', 'main_content'): 2,
+            ('column', 'side'): 0,
+            ('page', 'glitter/sample.html'): 2,
+        })
+
+        # Queries are counted without the debug cursor
+        self.assertFalse(connection.force_debug_cursor)
+
+    @override_settings(
+        GLITTER_RENDER_INSTRUMENTATION=['glitter.tests.test_instrumentation.ListSink'],
+        GLITTER_CONCURRENT_RENDER=True,
+    )
+    @mock.patch.object(HTML, 'concurrent_render', True)
+    @mock.patch.object(HTML, 'render_function', QUERY_BLOCK_VIEW)
+    def test_concurrent_queries(self):
+        glitter = Glitter(page_version=self.page_version)
+        glitter.render()
+
+        # Blocks in the thread pool use the worker's own database connection
+        self.assertEqual(self.get_queries()[('block', 'main_content.1.glitter_html.html')], 2)
+        self.assertEqual(self.get_queries()[('column', 'main_content')], 2)
+        self.assertEqual(self.get_queries()[('page', 'glitter/sample.html')], 2)
+
+    @override_settings(
+        GLITTER_RENDER_INSTRUMENTATION=['glitter.tests.test_instrumentation.ListSink'],
+    )
+    @mock.patch.object(HTML, 'render_function', QUERY_BLOCK_VIEW)
+    def test_async_queries(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        glitter = Glitter(page_version=self.page_version)
+        loop.run_until_complete(glitter.arender(loop=loop))
+
+        self.assertEqual(self.get_queries(), {
+            ('block', 'main_content.1.glitter_html.html'): 2,
+            ('column', 'main_content'): 2,
+            ('column', 'side'): 0,
+            ('page', 'glitter/sample.html'): 2,
+        })
+
+
+@override_settings(
+    GLITTER_RENDER_INSTRUMENTATION=['glitter.instrumentation.ServerTimingSink'],
+)
+class TestServerTimingSink(BaseInstrumentationCase):
+    def setUp(self):
+        super().setUp()
+        self.page = self.page_version.content_object
+
+    def test_staff(self):
+        User.objects.create_user('editor', 'editor@test.com', 'editor', is_staff=True)
+        client = Client()
+        client.login(username='editor', password='editor')
+
+        response = client.get(self.page.url)
+        self.assertIn('glitter-page-3;dur=', response['Server-Timing'])
+
+    def test_anonymous(self):
+        response = Client().get(self.page.url)
+        self.assertFalse(response.has_header('Server-Timing'))
+
+
+class TestStatsdSink(BaseInstrumentationCase):
+    def setUp(self):
+        super().setUp()
+
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.listener.bind(('127.0.0.1', 0))
+        self.listener.settimeout(1)
+        self.addCleanup(self.listener.close)
+
+    def test_record(self):
+        with self.settings(
+            GLITTER_RENDER_INSTRUMENTATION=['glitter.instrumentation.StatsdSink'],
+            GLITTER_STATSD_HOST='127.0.0.1',
+            GLITTER_STATSD_PORT=self.listener.getsockname()[1],
+        ):
+            glitter = Glitter(page_version=self.page_version)
+            glitter.render()
+
+        metrics = self.listener.recv(4096).decode().splitlines()
+        self.assertIn('glitter.render.block.glitter_html.html.queries:0|ms', metrics)
+        self.assertIn('glitter.render.column.side.queries:0|ms', metrics)
+        self.assertIn('glitter.render.page.glitter_sample_html.queries:0|ms', metrics)
+
+    def test_no_listener(self):
+        sink = StatsdSink()
+        sink.port = 0
+
+        # Shouldn't raise any exceptions
+        sink.send(['glitter.render.page:1|ms'])
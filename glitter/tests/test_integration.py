@@ -0,0 +1,31 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from glitter.integration import GlitterAppPool, glitter_app_pool
+
+
+class TestGlitterAppPool(SimpleTestCase):
+    def test_discovered(self):
+        self.assertTrue(glitter_app_pool.discovered)
+        self.assertEqual(list(glitter_app_pool.get_glitter_apps()), ['sample'])
+        self.assertEqual(glitter_app_pool.get_glitter_app('sample').name, 'Sample')
+        self.assertIsNone(glitter_app_pool.get_glitter_app('missing'))
+
+    def test_frozen(self):
+        with self.assertRaises(TypeError):
+            glitter_app_pool.get_glitter_apps()['other'] = None
+
+    def test_only_glitter_apps_imported(self):
+        with mock.patch('glitter.integration.import_module') as import_module:
+            GlitterAppPool().discover_glitter_apps()
+
+        import_module.assert_called_once_with('glitter.tests.sample.glitter_apps')
+
+    def test_import_errors(self):
+        """
+        Errors in glitter_apps modules aren't hidden.
+        """
+        with mock.patch('glitter.integration.import_module', side_effect=ImportError):
+            with self.assertRaises(ImportError):
+                GlitterAppPool().discover_glitter_apps()
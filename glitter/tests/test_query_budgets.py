@@ -0,0 +1,230 @@
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.urlresolvers import reverse
+from django.template import Context, Template
+from django.test import Client, TestCase
+
+from glitter.blocks.banner.models import Banner, BannerBlock, BannerInline
+from glitter.blocks.html.models import HTML
+from glitter.blocks.redactor.models import Redactor
+from glitter.blocks.related_pages.models import RelatedPage, RelatedPagesBlock
+from glitter.forms import MoveBlockForm
+from glitter.models import ContentBlock, Version
+from glitter.pages.models import Page
+
+from .query_budget import QueryBudgetMixin
+
+
+class BaseQueryBudgetCase(QueryBudgetMixin, TestCase):
+    # Each view is checked with a small and a large page, so any queries per block are caught
+    block_counts = (4, 20)
+
+    def setUp(self):
+        self.super_user = User.objects.create_superuser('test', 'test@test.com', 'test')
+        self.super_user_client = Client()
+        self.super_user_client.login(username='test', password='test')
+        self.client = Client()
+
+    def create_block(self, block_number, page_version, column='main_content', block_type=None):
+        if block_type is None:
+            block_type = block_number % 4
+
+        if block_type == 0:
+            block = HTML.objects.create(content='<p>HTML block</p>')
+        elif block_type == 1:
+            block = Redactor.objects.create(content='<p>Text block</p>')
+        elif block_type == 2:
+            block = BannerBlock.objects.create()
+            banner = Banner.objects.create(title='Banner')
+            BannerInline.objects.create(banner_block=block, banner=banner)
+        else:
+            block = RelatedPagesBlock.objects.create()
+            RelatedPage.objects.create(related_pages_block=block, page=page_version.content_object)
+            RelatedPage.objects.create(related_pages_block=block, link='http://example.com/')
+
+        content_block = ContentBlock.objects.create(
+            obj_version=page_version,
+            column=column,
+            position=block_number,
+            content_type=ContentType.objects.get_for_model(block),
+            object_id=block.id,
+        )
+        block.content_block = content_block
+        block.save(update_fields=['content_block'])
+        return content_block
+
+    def create_page(self, block_count, published=True):
+        page = Page.objects.create(url='/page-{}/'.format(block_count), title='Page')
+        page_version = Version.objects.create(
+            content_type=ContentType.objects.get_for_model(Page),
+            object_id=page.id,
+            template_name='glitter/sample.html',
+            owner=self.super_user,
+            version_number=1 if published else None,
+        )
+
+        for block_number in range(1, block_count + 1):
+            self.create_block(block_number, page_version)
+
+        if published:
+            page = Page.objects.get(id=page.id)
+            page.current_version = page_version
+            page.save()
+
+        return page, page_version
+
+
+class TestPageQueryBudgets(BaseQueryBudgetCase):
+    def test_page(self):
+        for block_count in self.block_counts:
+            page, page_version = self.create_page(block_count)
+
+            with self.assertQueryBudget('page', blocks=block_count):
+                response = self.client.get(page.url)
+
+            self.assertEqual(response.status_code, 200)
+
+    def test_page_version(self):
+        for block_count in self.block_counts:
+            page, page_version = self.create_page(block_count)
+            url = reverse('admin:glitter_pages_page_version', args=(page_version.id,))
+
+            with self.assertQueryBudget('page_version', blocks=block_count):
+                response = self.super_user_client.get(url)
+
+            self.assertEqual(response.status_code, 200)
+
+    def test_page_edit(self):
+        for block_count in self.block_counts:
+            page, page_version = self.create_page(block_count, published=False)
+            url = reverse('admin:glitter_pages_page_edit', args=(page_version.id,))
+
+            with self.assertQueryBudget('page_edit', blocks=block_count):
+                response = self.super_user_client.get(url)
+
+            self.assertEqual(response.status_code, 200)
+
+    def test_page_edit_copy(self):
+        for block_count in self.block_counts:
+            page, page_version = self.create_page(block_count)
+            url = reverse('admin:glitter_pages_page_edit', args=(page_version.id,))
+
+            with self.assertQueryBudget('page_edit_copy', blocks=block_count):
+                response = self.super_user_client.post(url)
+
+            self.assertEqual(response.status_code, 302)
+
+
+class TestEditorQueryBudgets(BaseQueryBudgetCase):
+    def test_block_move(self):
+        for block_count in self.block_counts:
+            page, page_version = self.create_page(block_count, published=False)
+            content_block = page_version.contentblock_set.last()
+            url = reverse('admin:glitter_pages_page_block_move', args=(content_block.id,))
+
+            with self.assertQueryBudget('block_move', blocks=block_count):
+                response = self.super_user_client.post(url, {'move': MoveBlockForm.MOVE_TOP})
+
+            self.assertEqual(response.status_code, 200)
+
+    def test_block_column(self):
+        for block_count in self.block_counts:
+            page, page_version = self.create_page(block_count, published=False)
+            content_block = page_version.contentblock_set.last()
+            url = reverse('admin:glitter_pages_page_block_column', args=(content_block.id,))
+
+            with self.assertQueryBudget('block_column', blocks=block_count):
+                response = self.super_user_client.post(url, {'move': 'side'})
+
+            self.assertEqual(response.status_code, 200)
+
+    def test_block_delete(self):
+        for block_count in self.block_counts:
+            page, page_version = self.create_page(block_count, published=False)
+            content_block = page_version.contentblock_set.first()
+            url = reverse('admin:glitter_pages_page_block_delete', args=(content_block.id,))
+
+            with self.assertQueryBudget('block_delete', blocks=block_count):
+                response = self.super_user_client.post(url, {'confirm': True})
+
+            self.assertEqual(response.status_code, 200)
+
+
+class TestBlockAdminQueryBudgets(BaseQueryBudgetCase):
+    def test_block_add(self):
+        for block_count in self.block_counts:
+            page, page_version = self.create_page(block_count, published=False)
+            url = reverse('block_admin:glitter_html_html_add', kwargs={
+                'version_id': page_version.id,
+            })
+
+            with self.assertQueryBudget('block_add', blocks=block_count):
+                response = self.super_user_client.get(url, {'column': 'main_content'})
+
+            self.assertEqual(response.status_code, 200)
+
+    def test_block_change(self):
+        for block_count in self.block_counts:
+            page, page_version = self.create_page(block_count, published=False)
+            content_block = self.create_block(block_count + 1, page_version, block_type=0)
+            url = reverse('block_admin:glitter_html_html_change', args=(content_block.object_id,))
+
+            with self.assertQueryBudget('block_change', blocks=block_count):
+                response = self.super_user_client.get(url)
+
+            self.assertEqual(response.status_code, 200)
+
+    def test_block_continue(self):
+        for block_count in self.block_counts:
+            page, page_version = self.create_page(block_count, published=False)
+            content_block = self.create_block(block_count + 1, page_version, block_type=0)
+            url = reverse(
+                'block_admin:glitter_html_html_continue', args=(content_block.object_id,)
+            )
+
+            with self.assertQueryBudget('block_continue', blocks=block_count):
+                response = self.super_user_client.get(url)
+
+            self.assertEqual(response.status_code, 200)
+
+
+class TestNavigationQueryBudgets(BaseQueryBudgetCase):
+    # Navigation is checked with a number of pages, rather than blocks
+    page_counts = (4, 20)
+
+    def create_tree(self, page_count):
+        Page.objects.all().delete()
+        root = Page.objects.create(url='/', title='Home')
+
+        for page_number in range(page_count):
+            page = Page.objects.create(
+                url='/page-{}/'.format(page_number), title='Page', parent=root,
+            )
+
+        return page
+
+    def render(self, template, page):
+        return Template('{% load glitter_navigation %}' + template).render(Context({
+            'page': page,
+        }))
+
+    def test_navigation(self):
+        templates = {
+            'navigation_root_pages': (
+                '{% get_root_pages page as pages %}{% for page in pages %}{{ page }}{% endfor %}'
+            ),
+            'navigation_pages_at_level': (
+                '{% get_pages_at_level page 2 as pages %}'
+                '{% for page in pages %}{{ page }}{% endfor %}'
+            ),
+            'navigation_tree_from_root': (
+                '{% tree_from_root page as pages %}{% for page in pages %}{{ page }}{% endfor %}'
+            ),
+        }
+
+        for page_count in self.page_counts:
+            page = self.create_tree(page_count)
+
+            for name, template in templates.items():
+                with self.assertQueryBudget(name, blocks=page_count):
+                    self.render(template, page)
@@ -0,0 +1,57 @@
+from django.test import SimpleTestCase
+
+from glitter import templates
+from glitter.checks import check_layout_templates
+from glitter.exceptions import GlitterTemplateNotRegistered
+from glitter.layouts import PageLayout
+from glitter.mixins import GlitterMixin
+from glitter.pages.models import Page
+
+from .sample.layouts import SampleLayout
+
+
+class MissingLayout(PageLayout):
+    class Meta:
+        template = 'glitter/missing.html'
+        verbose_name = 'Missing'
+
+
+class TestTemplateRegistry(SimpleTestCase):
+    def register_missing_layout(self):
+        templates.register(MissingLayout, Page)
+        self.addCleanup(templates.finalize)
+        self.addCleanup(templates.templates.pop, 'glitter/missing.html')
+
+    def test_get_templates(self):
+        self.assertEqual(templates.get_templates(Page), (
+            ('glitter/sample.html', 'Sample'),
+            ('glitter/sample2.html', 'Sample2'),
+        ))
+
+    def test_parent_models(self):
+        self.assertEqual(templates.get_templates(GlitterMixin), templates.get_templates(Page))
+
+    def test_unknown_model(self):
+        self.assertEqual(templates.get_templates(SimpleTestCase), ())
+
+    def test_get_layout(self):
+        self.assertIs(templates.get_layout('glitter/sample.html'), SampleLayout)
+
+        with self.assertRaisesMessage(
+            GlitterTemplateNotRegistered, 'No layout is registered for template glitter/none.html'
+        ):
+            templates.get_layout('glitter/none.html')
+
+    def test_late_registration(self):
+        self.register_missing_layout()
+
+        self.assertIn(('glitter/missing.html', 'Missing'), templates.get_templates(Page))
+
+    def test_check(self):
+        self.assertEqual(check_layout_templates(None), [])
+
+        self.register_missing_layout()
+        errors = check_layout_templates(None)
+
+        self.assertEqual([error.id for error in errors], ['glitter.E001'])
+        self.assertEqual(errors[0].obj, MissingLayout)
@@ -0,0 +1,77 @@
+import importlib
+from unittest import mock
+
+from django.core.urlresolvers import NoReverseMatch, reverse
+from django.db.utils import DatabaseError
+from django.test import RequestFactory, TestCase, override_settings
+
+import glitter.urls
+from glitter.pages.middleware import GlitterUrlConfMiddleware
+
+from .factories import PageFactory
+
+
+@override_settings(ROOT_URLCONF='glitter.tests.app_urls')
+class TestGlitterAppURLs(TestCase):
+    def setUp(self):
+        # Test cases never commit, so clear the URLs straight away
+        patcher = mock.patch('glitter.pages.cache.on_commit', lambda func: func())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        glitter.urls.reload_app_urls()
+        self.addCleanup(glitter.urls.reload_app_urls)
+
+    def process_request(self):
+        GlitterUrlConfMiddleware().process_request(RequestFactory().get('/'))
+
+    def test_import(self):
+        with self.assertNumQueries(0):
+            importlib.reload(glitter.urls)
+
+    def test_fallback_url(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(reverse('sample:list'), '/sample/')
+
+        # Built once
+        with self.assertNumQueries(0):
+            self.assertEqual(reverse('sample:list'), '/sample/')
+            self.assertEqual(self.client.get('/sample/').content, b'Sample app')
+
+    def test_page_url(self):
+        PageFactory(url='/news/', glitter_app_name='sample')
+
+        self.assertEqual(reverse('sample:list'), '/news/')
+
+    def test_page_changed(self):
+        self.assertEqual(reverse('sample:list'), '/sample/')
+
+        page = PageFactory(url='/news/', glitter_app_name='sample')
+
+        with self.assertNumQueries(0):
+            self.process_request()
+        self.assertEqual(reverse('sample:list'), '/news/')
+
+        page.glitter_app_name = ''
+        page.save()
+
+        self.process_request()
+        self.assertEqual(reverse('sample:list'), '/sample/')
+
+    def test_other_page_changed(self):
+        self.assertEqual(reverse('sample:list'), '/sample/')
+
+        PageFactory(url='/about/')
+
+        self.process_request()
+        self.assertFalse(glitter.urls.app_urls_changed())
+
+    def test_database_error(self):
+        with mock.patch('glitter.urls.build_app_urlpatterns', side_effect=DatabaseError):
+            with self.assertRaises(NoReverseMatch):
+                reverse('sample:list')
+
+        # Tried again on the next request
+        self.assertTrue(glitter.urls.app_urls_changed())
+        self.process_request()
+        self.assertEqual(reverse('sample:list'), '/sample/')
@@ -1,13 +1,20 @@
 import os
+from unittest import mock
 
-from django.contrib.auth.models import Permission, User
+from django.contrib import messages
+from django.contrib.auth.models import AnonymousUser, Permission, User
+from django.contrib.messages.storage.fallback import FallbackStorage
 from django.contrib.contenttypes.models import ContentType
 from django.conf import settings
-from django.test import TestCase, Client
+from django.db import connection
+from django.test import TestCase, Client, RequestFactory
 from django.test import override_settings, modify_settings
+from django.test.utils import CaptureQueriesContext
 
-from glitter.models import Version
+from glitter.blocks.html.models import HTML
+from glitter.models import ContentBlock, Version
 from glitter.pages.models import Page
+from glitter.views import get_page_etag
 
 
 SAMPLE_BLOCK_MISSING = 'glitter.tests.sampleblocks' not in settings.INSTALLED_APPS
@@ -143,3 +150,234 @@ class TestRenderPageUnpublished(BaseViewCase):
     def test_exceptionssasd(self):
         response = self.editor_client.get(self.page_no_version.url)
         self.assertEqual(response.status_code, 200)
+
+
+def error_view(block, request, rerender, content_block, block_classes):
+    raise ValueError('Broken block')
+
+
+def session_view(block, request, rerender, content_block, block_classes):
+    request.session['glitter_test'] = 'saved'
+    return '<p>Session block</p>'
+
+
+class TestStreamingRenderPage(BaseViewCase):
+
+    def setUp(self):
+        super().setUp()
+
+        self.html_block = HTML.objects.create(content='<p>Streamed HTML block</p>')
+        self.content_block = ContentBlock.objects.create(
+            obj_version=self.page_version,
+            column='main_content',
+            position=1,
+            content_type=ContentType.objects.get_for_model(self.html_block),
+            object_id=self.html_block.id
+        )
+        self.html_block.content_block = self.content_block
+        self.html_block.save()
+
+    def test_not_streaming_by_default(self):
+        response = self.editor_no_permissions_client.get(self.page.url)
+        self.assertFalse(response.streaming)
+
+    @override_settings(GLITTER_STREAMING_RENDER=True)
+    def test_streaming_page(self):
+        response = self.editor_no_permissions_client.get(self.page.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+
+        streamed = b''.join(response.streaming_content).decode()
+
+        # Columns have replaced their placeholders
+        self.assertNotIn('glitter-column', streamed)
+        self.assertIn('<p>Streamed HTML block</p>', streamed)
+        self.assertIn('glitter_column_main_content', streamed)
+        self.assertIn('glitter_column_side', streamed)
+        self.assertIn('</html>', streamed)
+
+    @override_settings(GLITTER_STREAMING_RENDER=True)
+    def test_streaming_block_error(self):
+        with mock.patch.object(HTML, 'render_function', 'glitter.tests.test_views.error_view'):
+            response = self.editor_no_permissions_client.get(self.page.url)
+
+            with self.assertLogs('glitter.page', 'ERROR'):
+                streamed = b''.join(response.streaming_content).decode()
+
+        self.assertIn('glitter_page_block_error', streamed)
+        self.assertIn('</html>', streamed)
+
+    @override_settings(GLITTER_STREAMING_RENDER=True)
+    def test_streaming_session_block(self):
+        with mock.patch.object(HTML, 'render_function', 'glitter.tests.test_views.session_view'):
+            with mock.patch.object(HTML, 'stream_render', False):
+                response = self.editor_no_permissions_client.get(self.page.url)
+
+        # Rendered before the session middleware saved the session
+        self.assertIn('Session block', b''.join(response.streaming_content).decode())
+        self.assertEqual(self.editor_no_permissions_client.session['glitter_test'], 'saved')
+
+    @override_settings(GLITTER_STREAMING_RENDER=True)
+    def test_streaming_post(self):
+        # Forms might need to redirect, so POST requests are never streamed
+        response = self.editor_no_permissions_client.post(self.page.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.streaming)
+
+
+@override_settings(GLITTER_PAGE_ETAGS=True)
+class TestConditionalRenderPage(BaseViewCase):
+
+    def test_etag_disabled(self):
+        with self.settings(GLITTER_PAGE_ETAGS=False):
+            response = self.editor_no_permissions_client.get(self.page.url)
+
+        self.assertFalse(response.has_header('ETag'))
+
+    def test_not_modified(self):
+        response = self.editor_no_permissions_client.get(self.page.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.has_header('ETag'))
+        self.assertFalse(response.has_header('Last-Modified'))
+
+        response = self.editor_no_permissions_client.get(
+            self.page.url, HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_new_version(self):
+        response = self.editor_no_permissions_client.get(self.page.url)
+        etag = response['ETag']
+
+        new_version = Version.objects.create(
+            content_type=ContentType.objects.get_for_model(Page), object_id=self.page.id,
+            template_name='glitter/sample.html', owner=self.editor, version_number=2
+        )
+        self.page.current_version = new_version
+        self.page.save()
+
+        response = self.editor_no_permissions_client.get(self.page.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_page_changed(self):
+        response = self.editor_no_permissions_client.get(self.page.url)
+        etag = response['ETag']
+
+        self.page.title = 'New title'
+        self.page.save()
+
+        response = self.editor_no_permissions_client.get(self.page.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_if_modified_since(self):
+        # A date alone can't tell if the page has changed
+        response = self.editor_no_permissions_client.get(
+            self.page.url, HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT'
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_user_etag(self):
+        anonymous_response = self.editor_no_permissions_client.get(self.page.url)
+
+        self.editor_no_permissions_client.login(
+            username='editor_no_perm', password='editor_no_perm'
+        )
+        user_response = self.editor_no_permissions_client.get(
+            self.page.url, HTTP_IF_NONE_MATCH=anonymous_response['ETag']
+        )
+        self.assertEqual(user_response.status_code, 200)
+        self.assertNotEqual(user_response['ETag'], anonymous_response['ETag'])
+
+    def test_volatile_block(self):
+        html_block = HTML.objects.create(content='<p>HTML Block</p>')
+        ContentBlock.objects.create(
+            obj_version=self.page_version,
+            column='main_content',
+            position=1,
+            content_type=ContentType.objects.get_for_model(html_block),
+            object_id=html_block.id
+        )
+
+        with mock.patch.object(HTML, 'volatile', True):
+            with mock.patch('glitter.views._volatile_content_type_ids', None):
+                response = self.editor_no_permissions_client.get(self.page.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('ETag'))
+
+    def test_pending_messages(self):
+        request = RequestFactory().get(self.page.url)
+        request.user = AnonymousUser()
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        self.assertIsNotNone(get_page_etag(request, self.page, self.page_version))
+
+        # A cached page wouldn't show the message
+        messages.info(request, 'Page saved')
+        self.assertIsNone(get_page_etag(request, self.page, self.page_version))
+        self.assertEqual(len(request._messages), 1)
+
+
+@override_settings(GLITTER_PAGE_URL_CACHE=True)
+class TestPageURLCache(BaseViewCase):
+
+    def setUp(self):
+        # Test cases never commit, so clear the URLs straight away
+        patcher = mock.patch('glitter.pages.cache.on_commit', lambda func: func())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        super().setUp()
+
+        # Load the page URLs before any tests
+        self.editor_no_permissions_client.get('/not-a-page/')
+
+    def test_not_a_page(self):
+        with self.assertNumQueries(0):
+            response = self.editor_no_permissions_client.get('/not-a-page/')
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_page(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.editor_no_permissions_client.get(self.page.url)
+
+        self.assertEqual(response.status_code, 200)
+
+        # Only one lookup for the page URL
+        page_lookups = [query for query in queries if '"url" = ' in query['sql']]
+        self.assertEqual(len(page_lookups), 1)
+
+    def test_page_with_no_ending_slash(self):
+        with self.assertNumQueries(0):
+            response = self.editor_no_permissions_client.get('/testing')
+
+        self.assertEqual(response.status_code, 301)
+
+    def test_new_page(self):
+        Page.objects.create(url='/new-page/', title='New page', published=True)
+
+        # New page without a version, editors get the unpublished page
+        response = self.editor_client.get('/new-page/')
+        self.assertEqual(response.status_code, 200)
+
+    def test_deleted_page(self):
+        self.page_testing.delete()
+
+        response = self.editor_no_permissions_client.get(self.page_testing.url)
+        self.assertEqual(response.status_code, 404)
+
+    def test_cleared_on_commit(self):
+        with mock.patch('glitter.pages.cache.on_commit') as on_commit:
+            Page.objects.create(url='/new-page/', title='New page', published=True)
+
+        # Other processes shouldn't reload the URLs until the new page can be seen
+        response = self.editor_client.get('/new-page/')
+        self.assertEqual(response.status_code, 404)
+
+        for call in on_commit.call_args_list:
+            call[0][0]()
+
+        response = self.editor_client.get('/new-page/')
+        self.assertEqual(response.status_code, 200)
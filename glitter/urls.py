@@ -1,52 +1,153 @@
-from glitter.pages.models import Page
+import importlib
+import sys
+from threading import Lock
 
 from django.conf.urls import include, url
-from django.db.utils import DatabaseError
 from django.core.exceptions import FieldError
+from django.core.urlresolvers import RegexURLResolver, clear_url_caches, get_resolver
+from django.db.utils import DatabaseError
+
 from glitter.integration import glitter_app_pool
-import importlib
+from glitter.pages.cache import get_app_urls_version
+from glitter.pages.models import Page
+
+
+# URL patterns for glitter apps in this process, along with the cache version they were built for -
+# a version of None means they couldn't be built, and are rebuilt on the next request
+_app_urlpatterns = (None, None)
+_app_urlpatterns_lock = Lock()
 
-urlpatterns = []
-used_apps = []
 
-try:
+def build_app_urlpatterns():
+    """
+    Return URL patterns for every glitter app, at the URL of its page if it has one.
+    """
+    urlpatterns = []
+    used_apps = set()
+
     # Attempt to find all Glitter App Pages, get their corresponding Glitter App configs and then
     # use those to create URL patterns.
-    app_pages = Page.objects.exclude(glitter_app_name='')
-    for app_page in app_pages:
-        glitter_app = glitter_app_pool.get_glitter_app(app_page.glitter_app_name)
-        if glitter_app:
-            app_url_conf = importlib.import_module(glitter_app.url_conf)
+    app_pages = Page.objects.exclude(glitter_app_name='').values_list('url', 'glitter_app_name')
 
-            # Django caches URLs quite hard, without the reload it continues to just use the
-            # cached version.
-            importlib.reload(app_url_conf)
+    for page_url, glitter_app_name in app_pages:
+        glitter_app = glitter_app_pool.get_glitter_app(glitter_app_name)
 
-            app_url = url(
-                '^{}/'.format(app_page.url.strip('/')),
+        if glitter_app:
+            app_url_conf = importlib.import_module(glitter_app.url_conf)
+            urlpatterns.append(url(
+                '^{}/'.format(page_url.strip('/')),
                 include(app_url_conf, namespace=glitter_app.namespace)
-            )
-            urlpatterns.append(app_url)
-            used_apps.append(app_page.glitter_app_name)
+            ))
+            used_apps.add(glitter_app_name)
 
     # If a page has not been created for an app yet, we don't want a NoReverseMatch error every
     # time someone tries to '{% url %}' or 'reverse()' a viewname. So lets add a URL pattern entry
     # to support those requests.
-    glitter_apps = glitter_app_pool.get_glitter_apps()
-    for system_name, glitter_app in glitter_apps.items():
+    for system_name, glitter_app in glitter_app_pool.get_glitter_apps().items():
         if system_name not in used_apps:
             app_url_conf = importlib.import_module(glitter_app.url_conf)
-
-            app_url = url(
+            urlpatterns.append(url(
                 '^{}/'.format(system_name),
                 include(app_url_conf, namespace=glitter_app.namespace)
-            )
-            urlpatterns.append(app_url)
+            ))
+
+    return urlpatterns
+
+
+def get_app_urlpatterns():
+    """
+    Return URL patterns for glitter apps, building them when they're first needed.
+    """
+    global _app_urlpatterns
+
+    version, urlpatterns = _app_urlpatterns
+
+    if urlpatterns is None:
+        with _app_urlpatterns_lock:
+            version, urlpatterns = _app_urlpatterns
+
+            if urlpatterns is None:
+                version = get_app_urls_version()
+
+                try:
+                    urlpatterns = build_app_urlpatterns()
+                except (DatabaseError, FieldError):
+                    # Database not setup correctly, or migrations to support Glitter Apps have not
+                    # been executed. Not much we can do, try again next time - resolvers will
+                    # have cached the empty patterns, so they'll need clearing as well.
+                    version, urlpatterns = None, []
+
+                _app_urlpatterns = (version, urlpatterns)
+
+    return urlpatterns
+
+
+def app_urls_changed():
+    """
+    Return a boolean if glitter app pages have changed since the URL patterns were built.
+    """
+    version, urlpatterns = _app_urlpatterns
+    return urlpatterns is not None and version != get_app_urls_version()
+
+
+def clear_resolvers(resolver):
+    """
+    Clear the lookups cached by a resolver and any resolvers within it which include the glitter
+    app URL patterns, returning a boolean if the patterns were found.
+    """
+    # The glitter app patterns themselves aren't looked through, as that would build them
+    if resolver.urlconf_module is sys.modules[__name__]:
+        included = True
+    else:
+        included = False
+
+        for pattern in resolver.url_patterns:
+            if isinstance(pattern, RegexURLResolver) and clear_resolvers(pattern):
+                included = True
+
+    if included:
+        # Django caches reverse lookups on each resolver, without any way of clearing them
+        resolver._reverse_dict = {}
+        resolver._namespace_dict = {}
+        resolver._app_dict = {}
+        resolver._callback_strs = set()
+        resolver._populated = False
+
+    return included
+
+
+def reload_app_urls():
+    """
+    Rebuild the glitter app URL patterns when they're next needed.
+
+    Django caches URL resolvers quite hard, including the lookups for any resolvers in the
+    project's URLs which include these patterns, so those are cleared as well.
+    """
+    global _app_urlpatterns
+
+    with _app_urlpatterns_lock:
+        _app_urlpatterns = (None, None)
+        clear_resolvers(get_resolver())
+        clear_url_caches()
+
+
+class AppURLPatterns(object):
+    """
+    A lazy list of glitter app URL patterns, so nothing is loaded from the database until URLs are
+    resolved or reversed.
+    """
+
+    def __iter__(self):
+        return iter(get_app_urlpatterns())
+
+    def __reversed__(self):
+        return reversed(get_app_urlpatterns())
+
+    def __len__(self):
+        return len(get_app_urlpatterns())
+
+    def __getitem__(self, index):
+        return get_app_urlpatterns()[index]
 
-except DatabaseError:
-    # Database not setup correctly, not much we can do
-    pass
 
-except FieldError:
-    # Likely that migrations to support Glitter Apps have not been executed. Not much we can do.
-    pass
+urlpatterns = AppURLPatterns()
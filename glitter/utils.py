@@ -1,3 +1,8 @@
+from importlib import import_module
+import sys
+from types import ModuleType
+import warnings
+
 from django.db import router
 from django.db.models.deletion import Collector
 from django.db.models.fields.related import ForeignKey
@@ -96,3 +101,32 @@ def duplicate(obj, value=None, field=None, duplicate_order=None):
             if root_obj is None:
                 root_obj = obj
     return root_obj
+
+
+class MovedAttributesModule(ModuleType):
+    """
+    A module with attributes which have moved to another module, only imported from there when
+    they're first used.
+    """
+
+    def __getattr__(self, name):
+        moved_to, names = self.__dict__.get('_moved_attributes', (None, ()))
+
+        if name not in names:
+            raise AttributeError('module {!r} has no attribute {!r}'.format(self.__name__, name))
+
+        warnings.warn(
+            '{0}.{2} has moved to {1}.{2}'.format(self.__name__, moved_to, name),
+            DeprecationWarning, stacklevel=2,
+        )
+        return getattr(import_module(moved_to), name)
+
+
+def moved_attributes(module_name, moved_to, names):
+    """
+    Keep imports of attributes which have moved to another module working, without importing that
+    module until one of them is used.
+    """
+    module = sys.modules[module_name]
+    module.__class__ = MovedAttributesModule
+    module._moved_attributes = (moved_to, frozenset(names))
@@ -1,31 +1,160 @@
+import hashlib
+
+from django.apps import apps
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.urlresolvers import reverse
 from django.db.models import Q
 from django.http import Http404
-from django.http.response import HttpResponse
-from django.utils.encoding import force_text
+from django.http.response import HttpResponse, StreamingHttpResponse
+from django.middleware.csrf import get_token
+from django.utils.cache import get_conditional_response
+from django.utils.encoding import force_bytes, force_text
+from django.utils.http import quote_etag
 from django.views.decorators.csrf import csrf_protect
 from django.template.loader import render_to_string
 
-from glitter.models import Version
+from glitter.models import BaseBlock, Version
 from glitter.page import Glitter
 
 
+# Content type IDs of volatile blocks, found when they're first needed
+_volatile_content_type_ids = None
+
+
+def get_volatile_content_type_ids():
+    """
+    Return a set of content type IDs for blocks which are marked as ``volatile``.
+    """
+    global _volatile_content_type_ids
+
+    if _volatile_content_type_ids is None:
+        volatile_models = [
+            model for model in apps.get_models()
+            if issubclass(model, BaseBlock) and model.volatile
+        ]
+        _volatile_content_type_ids = frozenset(
+            content_type.id
+            for content_type in ContentType.objects.get_for_models(*volatile_models).values()
+        )
+
+    return _volatile_content_type_ids
+
+
+def has_volatile_blocks(page_version):
+    """
+    Return a boolean if a version contains any blocks which are marked as ``volatile``.
+    """
+    content_type_ids = get_volatile_content_type_ids()
+
+    # Avoid a query if there's nothing to look for
+    if not content_type_ids:
+        return False
+
+    return page_version.contentblock_set.filter(content_type_id__in=content_type_ids).exists()
+
+
+def get_page_etag(request, page, page_version):
+    """
+    Return an ETag for a page version without rendering it, or None if the page can't use one.
+
+    The ETag is made from the page, the version being rendered, the template and the user viewing
+    the page. Pages with any volatile blocks change without a new version being published, so
+    won't get an ETag. Requests with messages waiting to be shown won't get one either, as a
+    cached copy of the page wouldn't show them.
+    """
+    if not getattr(settings, 'GLITTER_PAGE_ETAGS', False):
+        return None
+
+    if has_volatile_blocks(page_version):
+        return None
+
+    # Checking the length of the message storage doesn't mark the messages as used
+    if len(getattr(request, '_messages', ())):
+        return None
+
+    if request.user.is_authenticated():
+        user_type = 'user-{}'.format(request.user.pk)
+    else:
+        user_type = 'anonymous'
+
+    page_fields = [getattr(page, field.attname) for field in page._meta.concrete_fields]
+    etag_parts = (
+        page._meta.label_lower, page_fields, page_version.id, page_version.modified.isoformat(),
+        page_version.template_name, user_type,
+    )
+    return hashlib.md5(force_bytes(repr(etag_parts))).hexdigest()
+
+
 @csrf_protect
-def render_page(request, page, page_version, edit=False):
+def render_page(request, page, page_version, edit=False, stream=None):
+    if stream is None:
+        stream = getattr(settings, 'GLITTER_STREAMING_RENDER', False)
+
+    # Conditional responses are only used for viewing pages, which can be skipped if the browser
+    # already has an up to date copy
+    etag = None
+    if not edit and request.method in ('GET', 'HEAD'):
+        etag = get_page_etag(request, page, page_version)
+
+    # Only the ETag is used - a version's modified time doesn't cover changes to the page, or
+    # who's viewing it
+    if etag is not None:
+        response = get_conditional_response(request, etag=etag)
+
+        if response is not None:
+            response['ETag'] = quote_etag(etag)
+            return response
+
+    # Blocks can process forms and redirect on POST, which can't happen mid-response
+    if stream and not edit and request.method in ('GET', 'HEAD'):
+        response = stream_page(request, page, page_version)
+    else:
+        glitter = Glitter(page_version, request=request)
+        columns = glitter.render(edit_mode=edit)
+
+        template_name = page_version.template_name
+        context = {
+            'glitter': glitter,
+            'edit_mode': edit,
+            'columns': columns,
+            page._meta.model_name: page,
+            'object': page}
+
+        rendered = render_to_string(template_name, context, request=request)
+        response = HttpResponse(rendered)
+        glitter.timer.process_response(request, response)
+
+    if etag is not None:
+        response['ETag'] = quote_etag(etag)
+
+    return response
+
+
+def stream_page(request, page, page_version):
+    """
+    Render a page as a streaming response, sending each column as soon as it's rendered.
+
+    The page template is rendered up front with placeholders for each column, so anything before
+    the first column is sent without waiting for any blocks.
+    """
     glitter = Glitter(page_version, request=request)
-    columns = glitter.render(edit_mode=edit)
 
     template_name = page_version.template_name
     context = {
         'glitter': glitter,
-        'edit_mode': edit,
-        'columns': columns,
+        'edit_mode': False,
+        'columns': glitter.column_placeholders(),
         page._meta.model_name: page,
         'object': page}
 
+    # Columns are rendered after the CSRF middleware has seen the response, so make sure the CSRF
+    # cookie is always sent for any forms on the page
+    get_token(request)
+
     rendered = render_to_string(template_name, context, request=request)
-    return HttpResponse(rendered)
+    glitter.prepare_stream()
+    return StreamingHttpResponse(glitter.stream(rendered))
 
 
 @csrf_protect